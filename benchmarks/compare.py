@@ -0,0 +1,74 @@
+"""
+Implementation of the comparison of benchmark results
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Default relative change of a measurement in the worse direction reported as regression
+DEFAULT_THRESHOLD = 0.1
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """
+    The change of a measurement between a baseline and a current result file.
+    """
+
+    name: str
+    baseline: float
+    current: float
+    unit: str
+    change: float
+    regression: bool
+
+
+def compare_results(baseline: dict[str, Any], current: dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> list[Comparison]:
+    """
+    Compares the measurements present in both result files (see benchmarks.run).
+
+    Parameters:
+        baseline (dict): The baseline result file.
+        current (dict): The current result file.
+        threshold (float): The relative change in the worse direction reported as regression, e.g. 0.1 for 10%.
+
+    Returns:
+        list: The comparisons in the order of the baseline measurements.
+
+    """
+    comparisons = []
+    for name, baseline_measurement in baseline["results"].items():
+        current_measurement = current["results"].get(name)
+        if current_measurement is None or not baseline_measurement["value"]:
+            continue
+        change = (current_measurement["value"] - baseline_measurement["value"]) / baseline_measurement["value"]
+        worse_change = -change if baseline_measurement["higher_is_better"] else change
+        comparisons.append(Comparison(name, baseline_measurement["value"], current_measurement["value"], baseline_measurement["unit"], change, worse_change > threshold))
+    return comparisons
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Compares two benchmark result files and fails on regressions.")
+    parser.add_argument("baseline", type=Path, help="path of the baseline result file")
+    parser.add_argument("current", type=Path, help="path of the current result file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help=f"relative change reported as regression (default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    comparisons = compare_results(baseline, current, args.threshold)
+    for comparison in comparisons:
+        marker = "REGRESSION" if comparison.regression else ""
+        print(f"{comparison.name:40} {comparison.baseline:12.2f} {comparison.current:12.2f} {comparison.unit:8} {comparison.change:+8.1%} {marker}")
+    for key in ("python", "platform", "corpus"):
+        if baseline["metadata"].get(key) != current["metadata"].get(key):
+            print(f"warning: the results differ in {key}, the comparison may be meaningless")
+    sys.exit(1 if any(comparison.regression for comparison in comparisons) else 0)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,224 @@
+"""
+Implementation of the synthetic requirement corpus generator
+"""
+
+import argparse
+import json
+import random
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from python_requirements_inspector import constants
+from python_requirements_inspector.checkers.process_word_checker import process_word_list_de
+from python_requirements_inspector.checkers.weak_word_checker import weak_word_list_de, weak_word_list_en
+from python_requirements_inspector.type_definitions import WorkItem
+
+# Vocabulary of the generated sentences per language
+SUBJECTS = {
+    constants.ENGLISH: ["The system", "The operator", "The interface", "The train control unit", "The user", "The application", "Each request", "The database"],
+    constants.GERMAN: ["Das System", "Der Bediener", "Die Schnittstelle", "Das Zugsteuergerät", "Der Benutzer", "Die Anwendung", "Jede Anfrage", "Die Datenbank"],
+}
+MODALS = {
+    constants.ENGLISH: ["shall", "must", "should", "will"],
+    constants.GERMAN: ["muss", "soll", "kann", "darf"],
+}
+ACTIVE_VERBS = {
+    constants.ENGLISH: ["store", "display", "validate", "transmit", "record", "reject", "confirm", "calculate"],
+    constants.GERMAN: ["speichern", "anzeigen", "prüfen", "übertragen", "erfassen", "ablehnen", "bestätigen", "berechnen"],
+}
+PARTICIPLES = {
+    constants.ENGLISH: ["stored", "displayed", "validated", "transmitted", "recorded", "rejected", "confirmed", "calculated"],
+    constants.GERMAN: ["gespeichert", "angezeigt", "geprüft", "übertragen", "erfasst", "abgelehnt", "bestätigt", "berechnet"],
+}
+PASSIVE_AUXILIARIES = {constants.ENGLISH: "be", constants.GERMAN: "werden"}
+OBJECTS = {
+    constants.ENGLISH: ["the timetable", "the position of the train", "every incoming message", "the configuration", "the signal state", "the error log"],
+    constants.GERMAN: ["die Fahrplandaten", "die Position des Zuges", "jede eingehende Meldung", "die Konfiguration", "die Signalstellung", "das Fehlerprotokoll"],
+}
+PHRASES = {
+    constants.ENGLISH: [
+        "within the operational network",
+        "after each scheduled maintenance window",
+        "for all connected stations",
+        "during normal operation",
+        "in case of a failure",
+        "at every station",
+        "without manual intervention",
+        "for each vehicle",
+    ],
+    constants.GERMAN: [
+        "innerhalb des betrieblichen Netzes",
+        "nach jedem geplanten Wartungsfenster",
+        "für alle verbundenen Bahnhöfe",
+        "während des Normalbetriebs",
+        "im Fehlerfall",
+        "an jedem Bahnhof",
+        "ohne manuellen Eingriff",
+        "für jedes Fahrzeug",
+    ],
+}
+WEAK_WORDS = {constants.ENGLISH: weak_word_list_en, constants.GERMAN: weak_word_list_de}
+TITLE_WORDS = {
+    constants.ENGLISH: ["Timetable", "Position", "Message", "Configuration", "Signal", "Logging", "Display", "Validation"],
+    constants.GERMAN: ["Fahrplan", "Position", "Meldung", "Konfiguration", "Signal", "Protokoll", "Anzeige", "Prüfung"],
+}
+
+
+@dataclass(frozen=True)
+class CorpusOptions:
+    """
+    The properties of a generated corpus. Languages other than English and German are written with the English vocabulary.
+    """
+
+    count: int = 1000
+    sentence_length_mean: float = 14.0
+    sentence_length_stddev: float = 6.0
+    min_sentences: int = 1
+    max_sentences: int = 6
+    weak_word_density: float = 0.03
+    passive_ratio: float = 0.3
+    process_word_ratio: float = 0.5
+    extra_fields: int = 0
+    language_mix: dict[str, float] = field(default_factory=lambda: {constants.ENGLISH: 0.5, constants.GERMAN: 0.5})
+    seed: int = 0
+
+
+class CorpusGenerator:
+    """
+    A class generating reproducible synthetic workitems with requirement-like titles and descriptions.
+    """
+
+    def __init__(self, options: CorpusOptions | None = None) -> None:
+        """
+        Initializes a CorpusGenerator object.
+
+        Parameters:
+            options (CorpusOptions): The properties of the corpus, None for the default properties.
+
+        """
+        self.__options = options or CorpusOptions()
+        self.__random = random.Random(self.__options.seed)  # noqa: S311 - reproducible test data, not cryptography
+
+    def __vocabulary_language(self, lang: str) -> str:
+        return lang if lang in SUBJECTS else constants.ENGLISH
+
+    def generate_sentence(self, lang: str) -> str:
+        """
+        Generates a sentence with a normally distributed number of words.
+
+        Parameters:
+            lang (str): The language of the sentence.
+
+        Returns:
+            str: The sentence.
+
+        """
+        lang = self.__vocabulary_language(lang)
+        subject = self.__random.choice(SUBJECTS[lang])
+        modal = self.__random.choice(MODALS[lang])
+        sentence_object = self.__random.choice(OBJECTS[lang])
+        if self.__random.random() < self.__options.passive_ratio:
+            # the object becomes the subject of the passive sentence
+            words = [sentence_object[0].upper() + sentence_object[1:], modal]
+            verb = [PASSIVE_AUXILIARIES[lang], self.__random.choice(PARTICIPLES[lang])]
+        else:
+            words = [subject, modal, sentence_object]
+            verb = [self.__random.choice(ACTIVE_VERBS[lang])]
+
+        target_length = max(len(words) + len(verb), round(self.__random.gauss(self.__options.sentence_length_mean, self.__options.sentence_length_stddev)))
+        length = len(words) + len(verb)
+        fillers: list[str] = []
+        while length < target_length:
+            # a weak word replaces a phrase with the given probability per word
+            filler = self.__random.choice(PHRASES[lang])
+            if self.__random.random() < self.__options.weak_word_density * len(filler.split()):
+                filler = self.__random.choice(WEAK_WORDS[lang])
+            fillers.append(filler)
+            length += len(filler.split())
+        # the verb comes last in German and before the object and the fillers in English
+        words = [*words, *fillers, *reversed(verb)] if lang == constants.GERMAN else [*words[:2], *verb, *words[2:], *fillers]
+        return " ".join(words) + "."
+
+    def generate_workitem(self, index: int) -> WorkItem:
+        """
+        Generates a workitem.
+
+        Parameters:
+            index (int): The number of the workitem, part of its id.
+
+        Returns:
+            WorkItem: The workitem, with the extra fields of the options.
+
+        """
+        lang = self.__random.choices(list(self.__options.language_mix), weights=list(self.__options.language_mix.values()))[0]
+        vocabulary_language = self.__vocabulary_language(lang)
+        title = " ".join(self.__random.sample(TITLE_WORDS[vocabulary_language], 2))
+        if vocabulary_language == constants.GERMAN and self.__random.random() < self.__options.process_word_ratio:
+            title = f"{title} {self.__random.choice(process_word_list_de)}"
+        sentence_count = self.__random.randint(self.__options.min_sentences, self.__options.max_sentences)
+        workitem = WorkItem(id=f"REQ-{index}", title=title, description=" ".join(self.generate_sentence(lang) for _ in range(sentence_count)), language=lang)
+        for field_index in range(self.__options.extra_fields):
+            workitem[f"extra{field_index}"] = self.generate_sentence(lang)  # type: ignore[literal-required]
+        return workitem
+
+    def generate(self) -> Iterator[WorkItem]:
+        """
+        Generates the workitems of the corpus.
+
+        Returns:
+            Iterator: The workitems.
+
+        """
+        for index in range(self.__options.count):
+            yield self.generate_workitem(index)
+
+
+def write_corpus(path: Path, options: CorpusOptions | None = None) -> None:
+    """
+    Writes a generated corpus as a JSON array, the input format of inspect-requirements.
+
+    Parameters:
+        path (Path): The path of the corpus.
+        options (CorpusOptions): The properties of the corpus, None for the default properties.
+
+    """
+    with path.open("w", encoding="utf-8") as corpus_file:
+        json.dump(list(CorpusGenerator(options).generate()), corpus_file, ensure_ascii=False)
+
+
+def language_mix(value: str) -> dict[str, float]:
+    """
+    Parses a language mix like "en=0.7,de=0.3".
+    """
+    try:
+        mix = {lang.strip(): float(weight) for lang, weight in (item.split("=") for item in value.split(","))}
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"Invalid language mix: {value}") from error
+    if not mix or any(weight < 0 for weight in mix.values()) or not sum(mix.values()):
+        raise argparse.ArgumentTypeError(f"Invalid language mix: {value}")
+    return mix
+
+
+def run() -> None:
+    defaults = CorpusOptions()
+    parser = argparse.ArgumentParser(description="Generates a synthetic corpus of German and English requirement workitems.")
+    parser.add_argument("output", type=Path, help="path of the generated JSON file")
+    parser.add_argument("--count", type=int, default=defaults.count, help=f"number of workitems (default: {defaults.count})")
+    parser.add_argument("--sentence-length-mean", type=float, default=defaults.sentence_length_mean, help=f"mean words per sentence (default: {defaults.sentence_length_mean})")
+    parser.add_argument("--sentence-length-stddev", type=float, default=defaults.sentence_length_stddev, help=f"standard deviation of the words per sentence (default: {defaults.sentence_length_stddev})")
+    parser.add_argument("--max-sentences", type=int, default=defaults.max_sentences, help=f"maximum sentences per description (default: {defaults.max_sentences})")
+    parser.add_argument("--weak-word-density", type=float, default=defaults.weak_word_density, help=f"share of weak words among the filler words (default: {defaults.weak_word_density})")
+    parser.add_argument("--passive-ratio", type=float, default=defaults.passive_ratio, help=f"share of passive sentences (default: {defaults.passive_ratio})")
+    parser.add_argument("--extra-fields", type=int, default=defaults.extra_fields, help=f"number of additional text fields per workitem (default: {defaults.extra_fields})")
+    parser.add_argument("--language-mix", type=language_mix, default=defaults.language_mix, help="weights of the languages, e.g. en=0.7,de=0.2,fr=0.1 (default: en=0.5,de=0.5)")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help=f"seed of the random generator (default: {defaults.seed})")
+    args = parser.parse_args()
+
+    options = CorpusOptions(**{name: value for name, value in vars(args).items() if name != "output"})
+    write_corpus(args.output, options)
+    print(json.dumps(asdict(options)))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,279 @@
+"""
+Implementation of the benchmark runner
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from functools import partial
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import spacy
+from spacy.tokens import Doc, Span
+
+from benchmarks.corpus import CorpusGenerator, CorpusOptions
+from python_requirements_inspector import constants
+from python_requirements_inspector.checkers.passive_checker import PassiveChecker
+from python_requirements_inspector.text_analyzer import TextAnalyzer
+from python_requirements_inspector.text_processor import TextProcessor
+
+if TYPE_CHECKING:
+    from python_requirements_inspector.type_definitions import WorkItem
+
+# Directory of the project, importable by the measured processes also if the project is not installed
+PROJECT_DIRECTORY = Path(__file__).resolve().parent.parent
+
+# Python code loading the language models of all supported languages, the startup of inspect-requirements
+STARTUP_CODE = "from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer; WorkitemAnalyzer().load_languages(['de', 'en'])"
+
+# Lengths in tokens of the run-on sentences of the German passive benchmark
+PASSIVE_SENTENCE_LENGTHS = [25, 100, 400]
+
+# Tags of the tokens of the German passive benchmark, with auxiliaries, participles and clause boundaries
+PASSIVE_SENTENCE_TAGS = ["ART", "NN", "ADJA", "APPR", "ADV", "KON", "$,", "VAFIN", "VVPP", "VVFIN"]
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """
+    The result of a benchmark: the median of its repetitions.
+    """
+
+    value: float
+    unit: str
+    higher_is_better: bool
+
+
+def _median_time(function: Callable[[], object], repeat: int) -> float:
+    """
+    Returns the median wall time of calls of a function.
+
+    Parameters:
+        function (Callable): The function to be timed.
+        repeat (int): The number of calls.
+
+    Returns:
+        float: The median time in seconds.
+
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _run_process(command: list[str], cwd: Path) -> tuple[float, float]:
+    """
+    Runs a process and measures its wall time and its peak memory.
+
+    Parameters:
+        command (list): The command of the process.
+        cwd (Path): The working directory of the process.
+
+    Returns:
+        tuple: The wall time in seconds and the peak resident memory in MB.
+
+    """
+    start = time.perf_counter()
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(PROJECT_DIRECTORY), os.environ.get("PYTHONPATH")]))}
+    process = subprocess.Popen(command, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)  # noqa: S603 - the commands are built from sys.executable
+    stderr = process.stderr.read() if process.stderr else b""
+    # wait4 reports the resource usage of this child only, unlike resource.RUSAGE_CHILDREN
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command, stderr=stderr)
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    peak_memory = usage.ru_maxrss / (1024 * 1024) if sys.platform == "darwin" else usage.ru_maxrss / 1024
+    return elapsed, peak_memory
+
+
+class BenchmarkRunner:
+    """
+    A class measuring the performance of the analysis on a generated corpus.
+    """
+
+    def __init__(self, corpus_options: CorpusOptions | None = None, repeat: int = 3) -> None:
+        """
+        Initializes a BenchmarkRunner object and generates the corpus.
+
+        Parameters:
+            corpus_options (CorpusOptions): The properties of the corpus, None for the default properties.
+            repeat (int): The number of repetitions of each benchmark, the median is reported.
+
+        """
+        self.__corpus_options = corpus_options or CorpusOptions()
+        self.__repeat = repeat
+        self.__workitems: list[WorkItem] = list(CorpusGenerator(self.__corpus_options).generate())
+        self.__results: dict[str, Measurement] = {}
+
+    def __get_descriptions(self, lang: str) -> list[str]:
+        return [workitem["description"] for workitem in self.__workitems if workitem["language"] == lang]
+
+    def measure_startup(self) -> None:
+        """
+        Measures the time of a new process to load the language models.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            times = [_run_process([sys.executable, "-c", STARTUP_CODE], Path(directory))[0] for _ in range(self.__repeat)]
+        self.__results["startup"] = Measurement(statistics.median(times), "s", higher_is_better=False)
+
+    def measure_checkers(self) -> None:
+        """
+        Measures per language the throughput of each check alone and of all checks, with the language models loaded.
+        """
+        for lang in constants.SUPPORTED_LANGUAGES:
+            texts = self.__get_descriptions(lang)
+            if not texts:
+                continue
+            for checks in [*([check] for check in constants.DEFAULT_CHECKS), constants.DEFAULT_CHECKS]:
+                text_analyzer = TextAnalyzer(lang, checks=checks)
+                # loads the language model and creates the checkers
+                text_analyzer.analyze_texts(texts[:1], checks)
+                elapsed = _median_time(partial(text_analyzer.analyze_texts, texts, checks), self.__repeat)
+                name = checks[0].name.lower() if len(checks) == 1 else "all"
+                self.__results[f"checker.{name}.{lang}"] = Measurement(len(texts) / elapsed, "texts/s", higher_is_better=True)
+
+    def measure_analyze_text(self) -> None:
+        """
+        Measures per language the throughput of analyze_text, called text by text with all checks.
+        """
+        for lang in constants.SUPPORTED_LANGUAGES:
+            texts = self.__get_descriptions(lang)
+            if not texts:
+                continue
+            text_analyzer = TextAnalyzer(lang)
+            text_analyzer.analyze_text(texts[0], constants.DEFAULT_CHECKS)
+
+            def analyze(text_analyzer: TextAnalyzer = text_analyzer, texts: list[str] = texts) -> None:
+                for text in texts:
+                    text_analyzer.analyze_text(text, constants.DEFAULT_CHECKS)
+
+            self.__results[f"analyze_text.{lang}"] = Measurement(len(texts) / _median_time(analyze, self.__repeat), "texts/s", higher_is_better=True)
+
+    def measure_passive_de(self) -> None:
+        """
+        Measures the time per token of the German passive rule on long run-on sentences with random tags,
+        which should not grow with the length of the sentence.
+        """
+        text_processor = TextProcessor(constants.GERMAN)
+        checker = PassiveChecker(text_processor)
+        tag_random = random.Random(self.__corpus_options.seed)  # noqa: S311 - reproducible test data, not cryptography
+        for length in PASSIVE_SENTENCE_LENGTHS:
+            tags = [tag_random.choice(PASSIVE_SENTENCE_TAGS) for _ in range(length)]
+            # the tags are set directly, so the rule is measured without the language model
+            sent = Doc(text_processor.get_vocab(), words=["wird" if tag == "VAFIN" else f"w{index}" for index, tag in enumerate(tags)], tags=tags)[:]
+
+            def check(checker: PassiveChecker = checker, sent: Span = sent) -> None:
+                for _ in range(100):
+                    checker.check_sentence(sent)
+
+            self.__results[f"passive.de.{length}_tokens"] = Measurement(_median_time(check, self.__repeat) / 100 / length * 1e6, "us/token", higher_is_better=False)
+
+    def measure_cli(self) -> None:
+        """
+        Measures the throughput and the peak memory of inspect-requirements analyzing the corpus, including its startup.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # inspect-requirements only reads files below its working directory
+            corpus_path = Path(directory) / "corpus.json"
+            corpus_path.write_text(json.dumps(self.__workitems, ensure_ascii=False), encoding="utf-8")
+            output_directory = Path(directory) / "output"
+            output_directory.mkdir()
+            command = [sys.executable, "-c", f"import tempfile; tempfile.tempdir = {str(output_directory)!r}; from python_requirements_inspector.main import run; run()", "corpus.json", "--no-daemon"]
+            runs = [_run_process(command, Path(directory)) for _ in range(self.__repeat)]
+        self.__results["cli.throughput"] = Measurement(len(self.__workitems) / statistics.median(elapsed for elapsed, _ in runs), "items/s", higher_is_better=True)
+        self.__results["cli.peak_memory"] = Measurement(max(peak_memory for _, peak_memory in runs), "MB", higher_is_better=False)
+
+    def run(self, benchmarks: list[str]) -> dict[str, Measurement]:
+        """
+        Runs benchmarks.
+
+        Parameters:
+            benchmarks (list): The names of the benchmarks: startup, checkers, analyze_text, passive_de, cli.
+
+        Returns:
+            dict: The measurements by name.
+
+        """
+        for benchmark in benchmarks:
+            getattr(self, f"measure_{benchmark}")()
+        return self.__results
+
+    def get_metadata(self) -> dict[str, object]:
+        """
+        Returns the environment of the measurements, to tell whether two result files are comparable.
+
+        Returns:
+            dict: The metadata.
+
+        """
+        try:
+            package_version = version("python-requirements-inspector")
+        except PackageNotFoundError:
+            package_version = None
+        return {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "package": package_version,
+            "spacy": spacy.__version__,
+            "repeat": self.__repeat,
+            "corpus": asdict(self.__corpus_options),
+        }
+
+
+BENCHMARKS = ["startup", "checkers", "analyze_text", "passive_de", "cli"]
+
+
+def write_results(path: Path, metadata: dict[str, object], results: dict[str, Measurement]) -> None:
+    """
+    Writes the measurements as JSON, the input of benchmarks.compare.
+
+    Parameters:
+        path (Path): The path of the result file.
+        metadata (dict): The environment of the measurements.
+        results (dict): The measurements by name.
+
+    """
+    path.write_text(json.dumps({"metadata": metadata, "results": {name: asdict(measurement) for name, measurement in results.items()}}, indent=2), encoding="utf-8")
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Measures the performance of the requirements analysis on a synthetic corpus.")
+    parser.add_argument("output", type=Path, help="path of the JSON result file")
+    parser.add_argument("--count", type=int, default=CorpusOptions.count, help=f"number of workitems of the corpus (default: {CorpusOptions.count})")
+    parser.add_argument("--seed", type=int, default=CorpusOptions.seed, help=f"seed of the corpus (default: {CorpusOptions.seed})")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per benchmark, the median is reported (default: 3)")
+    parser.add_argument("--benchmarks", type=lambda value: value.split(","), default=BENCHMARKS, help=f"comma separated benchmarks to run (default: {','.join(BENCHMARKS)})")
+    args = parser.parse_args()
+    unknown_benchmarks = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown_benchmarks:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown_benchmarks))}")
+
+    runner = BenchmarkRunner(CorpusOptions(count=args.count, seed=args.seed), args.repeat)
+    results = runner.run(args.benchmarks)
+    write_results(args.output, runner.get_metadata(), results)
+    for name, measurement in results.items():
+        print(f"{name:40} {measurement.value:12.2f} {measurement.unit}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,72 @@
+"""
+Implementation of the command-line argument types shared by the entry points
+"""
+
+import argparse
+
+from python_requirements_inspector.type_definitions import AnalyzerOptions
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a non-negative integer")
+    return number
+
+
+def add_memory_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the arguments bounding the memory of a long-running process (see AnalyzerOptions) to a parser.
+
+    Parameters:
+        parser (argparse.ArgumentParser): The parser of the process.
+
+    """
+    parser.add_argument(
+        "--max-new-strings",
+        type=positive_int,
+        default=None,
+        help="reload the language models when this many strings were added to their vocabularies (default: no limit)",
+    )
+    parser.add_argument(
+        "--max-rss-mb",
+        type=positive_int,
+        default=None,
+        help="reload the language models when the resident memory exceeds this many MB, Linux only (default: no limit)",
+    )
+
+
+def probability(value: str) -> float:
+    number = float(value)
+    if not 0 < number <= 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a probability in (0, 1]")
+    return number
+
+
+def add_language_detection_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the arguments of the language detection of workitems without a language (see AnalyzerOptions) to a parser.
+
+    Parameters:
+        parser (argparse.ArgumentParser): The parser of the process.
+
+    """
+    parser.add_argument(
+        "--language-sample-size",
+        type=positive_int,
+        default=AnalyzerOptions.language_sample_size,
+        help=f"number of characters of a description the language detection starts with (default: {AnalyzerOptions.language_sample_size})",
+    )
+    parser.add_argument(
+        "--language-confidence",
+        type=probability,
+        default=AnalyzerOptions.language_confidence,
+        help=f"probability of the detected language above which no more of the description is used (default: {AnalyzerOptions.language_confidence})",
+    )
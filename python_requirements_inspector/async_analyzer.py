@@ -0,0 +1,212 @@
+"""
+Implementation of the asyncio workitem analysis
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from contextlib import suppress
+from types import TracebackType
+from typing import Literal, Self
+
+from python_requirements_inspector import constants
+from python_requirements_inspector.micro_batcher import MicroBatcher
+from python_requirements_inspector.process_pool import analyze_batch_in_worker, create_pool
+from python_requirements_inspector.type_definitions import AnalyzerOptions, RequirementsInspectorResponseItem, WorkItem
+from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
+
+# Default maximum number of requests (analyze calls or batches of analyze_stream) submitted to the executor and not yet analyzed
+DEFAULT_MAX_PENDING = 16
+
+_Results = list[RequirementsInspectorResponseItem | None]
+
+
+def _set_future_result(future: asyncio.Future[_Results], results: _Results | None, error: BaseException | None) -> None:
+    """
+    Sets the result or the error of a future unless the future was cancelled.
+
+    Parameters:
+        future (asyncio.Future): The future of the analysis.
+        results (list): The results of the analysis.
+        error (BaseException): The error of the analysis or None.
+
+    """
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(results or [])
+
+
+async def _iterate_batches(workitems: Iterable[WorkItem] | AsyncIterable[WorkItem], batch_size: int) -> AsyncIterator[list[WorkItem]]:
+    """
+    Splits workitems into batches, reading the workitems only when the next batch is requested.
+
+    Parameters:
+        workitems (Iterable | AsyncIterable): The workitems.
+        batch_size (int): The number of workitems per batch.
+
+    Returns:
+        AsyncIterator: The batches of workitems.
+
+    """
+    batch: list[WorkItem] = []
+    if isinstance(workitems, AsyncIterable):
+        async for workitem in workitems:
+            batch.append(workitem)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    else:
+        for workitem in workitems:
+            batch.append(workitem)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+class AsyncWorkitemAnalyzer:
+    """
+    An asyncio facade of the workitem analysis. The analysis runs in a thread or in worker processes, so that the event loop stays responsive.
+    With the thread executor, a single thread analyzes the workitems of concurrent calls together (see MicroBatcher).
+    An AsyncWorkitemAnalyzer is used by a single event loop.
+    """
+
+    def __init__(
+        self,
+        options: AnalyzerOptions | None = None,
+        executor: Literal["thread", "process"] = "thread",
+        workers: int = 1,
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        """
+        Initializes an AsyncWorkitemAnalyzer object and starts its executor.
+
+        Parameters:
+            options (AnalyzerOptions): The options of the analysis, None for the default options.
+            executor (str): "thread" to analyze in a thread of this process, "process" to analyze in worker processes.
+            workers (int): The number of worker processes of the process executor.
+            batch_size (int): The number of workitems analyzed together and the number of texts per batch of the language model.
+            max_pending (int): The maximum number of requests submitted and not yet analyzed, further requests wait.
+
+        """
+        if executor not in {"thread", "process"}:
+            raise ValueError(f"Unknown executor: {executor}")
+        self.__batch_size = batch_size
+        self.__max_pending = max_pending
+        self.__slots = asyncio.Semaphore(max_pending)
+        self.__analyzer = WorkitemAnalyzer(options) if executor == "thread" else None
+        self.__batcher = MicroBatcher(self.__analyzer, max_batch_size=batch_size, max_wait=0) if self.__analyzer is not None else None
+        self.__pool = create_pool(workers, options or AnalyzerOptions(), batch_size) if executor == "process" else None
+
+    async def __submit(self, workitems: list[WorkItem]) -> asyncio.Future[_Results]:
+        """
+        Submits workitems to the executor, waiting while the maximum number of requests is pending.
+
+        Parameters:
+            workitems (list): The workitems to be analyzed.
+
+        Returns:
+            asyncio.Future: Per workitem, the data frame of the analyzed workitem or None if its language is not supported.
+
+        """
+        if self.__batcher is None and self.__pool is None:
+            raise RuntimeError("The analyzer is closed")
+        await self.__slots.acquire()
+        loop = asyncio.get_running_loop()
+
+        if self.__batcher is not None:
+            # cancelling the future removes the workitems from the queue of the batcher if their analysis has not started
+            batcher_future = self.__batcher.submit(workitems)
+            batcher_future.add_done_callback(lambda _: loop.call_soon_threadsafe(self.__slots.release))
+            return asyncio.wrap_future(batcher_future, loop=loop)
+
+        if self.__pool is None:
+            self.__slots.release()
+            raise RuntimeError("The analyzer is closed")
+        # a batch sent to a worker process is analyzed even if the future is cancelled, its result is dropped
+        future: asyncio.Future[_Results] = loop.create_future()
+
+        def resolve(results: _Results | None, error: BaseException | None) -> None:
+            with suppress(RuntimeError):  # the event loop is closed
+                loop.call_soon_threadsafe(_set_future_result, future, results, error)
+                loop.call_soon_threadsafe(self.__slots.release)
+
+        self.__pool.apply_async(analyze_batch_in_worker, (workitems,), callback=lambda results: resolve(results, None), error_callback=lambda error: resolve(None, error))
+        return future
+
+    async def analyze(self, workitem: WorkItem) -> RequirementsInspectorResponseItem | None:
+        """
+        Analyzes a workitem.
+
+        Parameters:
+            workitem (WorkItem): The workitem to be analyzed.
+
+        Returns:
+            dict: The data frame with analyzed workitem information or None if the language of the workitem is not supported.
+
+        """
+        results = await (await self.__submit([workitem]))
+        return results[0]
+
+    async def analyze_stream(self, workitems: Iterable[WorkItem] | AsyncIterable[WorkItem]) -> AsyncIterator[RequirementsInspectorResponseItem]:
+        """
+        Analyzes workitems in batches and returns the results in the order of the workitems.
+        Workitems are read only while less than the maximum number of batches wait for being returned, so a slow consumer
+        slows down the reading. Closing the iterator (or cancelling its consumer) cancels the batches not yet analyzed.
+
+        Parameters:
+            workitems (Iterable | AsyncIterable): The workitems to be analyzed.
+
+        Returns:
+            AsyncIterator: The data frames (dictonary) with analyzed workitem information,
+                workitems in an unsupported language are skipped.
+
+        """
+        pending: deque[asyncio.Future[_Results]] = deque()
+        try:
+            async for batch in _iterate_batches(workitems, self.__batch_size):
+                pending.append(await self.__submit(batch))
+                if len(pending) >= self.__max_pending:
+                    for result in await pending.popleft():
+                        if result is not None:
+                            yield result
+
+            while pending:
+                for result in await pending.popleft():
+                    if result is not None:
+                        yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self) -> None:
+        """
+        Waits for the submitted analyses and stops the executor. This blocks until the analyses are finished.
+        """
+        if self.__batcher is not None:
+            self.__batcher.close()
+            self.__batcher = None
+        if self.__analyzer is not None:
+            self.__analyzer.close()
+            self.__analyzer = None
+        if self.__pool is not None:
+            self.__pool.close()
+            self.__pool.join()
+            self.__pool = None
+
+    async def aclose(self) -> None:
+        """
+        Waits for the submitted analyses and stops the executor without blocking the event loop.
+        """
+        await asyncio.to_thread(self.close)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        await self.aclose()
@@ -2,7 +2,10 @@
 Implementation of comparative checker
 """
 
+from typing import ClassVar
+
 from spacy.matcher import Matcher
+from spacy.tokens.span import Span
 
 from python_requirements_inspector import constants
 from python_requirements_inspector.text_processor import TextProcessor
@@ -23,6 +26,12 @@ class ComparativeChecker:
     A class for checking comparative and superlative constructions in a given text.
     """
 
+    # Token annotations of the language model the rules rely on, per language
+    required_annotations: ClassVar[dict[str, frozenset[str]]] = {
+        constants.ENGLISH: frozenset({"TAG"}),
+        constants.GERMAN: frozenset({"MORPH"}),
+    }
+
     def __init__(self, text_processor: TextProcessor) -> None:
         """
         Initializes a ComparativeChecker object.
@@ -31,8 +40,6 @@ class ComparativeChecker:
             text_processor (TextProcessor): A TextProcessor instance for processing text.
 
         """
-        self.__text_processor = text_processor
-
         # Language-specific initialization
         lang = text_processor.get_language()
         if lang == constants.ENGLISH:
@@ -49,12 +56,12 @@ class ComparativeChecker:
         self.__superlative_matcher = Matcher(text_processor.get_vocab())
         self.__superlative_matcher.add(MatcherId.SUPERLATIVE_MATCHER_ID.value, superlative_rule)
 
-    def check_sentence(self, sent: str) -> tuple[int, str]:
+    def check_sentence(self, sent: Span) -> tuple[int, str]:
         """
         Analyzes a sentence for comparative and superlative constructions.
 
         Parameters:
-            sent (str): The sentence to be analyzed.
+            sent (Span): The processed sentence to be analyzed.
 
         Returns:
             tuple: A tuples with detected findings in the sentence. The tuple contains:
@@ -63,24 +70,30 @@ class ComparativeChecker:
 
         """
 
-        doc = self.__text_processor.tokenize(sent)
-        comp_matches = self.__comparative_matcher(doc, as_spans=True)
-        sup_matches = self.__superlative_matcher(doc, as_spans=True)
-        comparatives = [match.text for match in comp_matches]
-        superlatives = [match.text for match in sup_matches]
+        comp_matches = self.__comparative_matcher(sent)
+        sup_matches = self.__superlative_matcher(sent)
+        if not comp_matches and not sup_matches:
+            return 0, ""
 
+        # the matched texts are only extracted for the error description of sentences with findings
         finding_desc = ""
-        finding_count = 0
+        if comp_matches:
+            finding_desc += f" {MatcherId.COMPARATIVE_MATCHER_ID.value} " + ", ".join(sent[start:end].text for _, start, end in comp_matches)
+        if sup_matches:
+            finding_desc += f" {MatcherId.SUPERLATIVE_MATCHER_ID.value} " + ", ".join(sent[start:end].text for _, start, end in sup_matches)
+
+        return len(comp_matches) + len(sup_matches), finding_desc
+
+    def has_match(self, sent: Span) -> bool:
+        """
+        Checks whether a sentence contains comparative or superlative constructions, without counting them or building the finding description.
 
-        comparative_count = len(comparatives)
-        superlative_count = len(superlatives)
+        Parameters:
+            sent (Span): The processed sentence to be analyzed.
 
-        # Update the count and error description based on the matched constructions
-        if comparative_count > 0:
-            finding_count += comparative_count
-            finding_desc += f" {MatcherId.COMPARATIVE_MATCHER_ID.value} " + ", ".join(comparatives)
-        if superlative_count > 0:
-            finding_count += superlative_count
-            finding_desc += f" {MatcherId.SUPERLATIVE_MATCHER_ID.value} " + ", ".join(superlatives)
+        Returns:
+            bool: True if the sentence has a finding.
+
+        """
 
-        return finding_count, finding_desc
+        return bool(self.__comparative_matcher(sent)) or bool(self.__superlative_matcher(sent))
@@ -2,7 +2,10 @@
 Implementation of complex checker
 """
 
+from typing import ClassVar
+
 from spacy.matcher import Matcher
+from spacy.tokens.span import Span
 
 from python_requirements_inspector import constants
 from python_requirements_inspector.text_processor import TextProcessor
@@ -18,6 +21,13 @@ class ComplexChecker:
     A class for analyzing sentence complexity.
     """
 
+    # Token annotations of the language model the rules rely on, per language.
+    # The rules only use lexical attributes, which the tokenizer provides.
+    required_annotations: ClassVar[dict[str, frozenset[str]]] = {
+        constants.ENGLISH: frozenset(),
+        constants.GERMAN: frozenset(),
+    }
+
     def __init__(self, text_processor: TextProcessor) -> None:
         """
         Initializes a ComplexChecker object.
@@ -27,20 +37,18 @@ class ComplexChecker:
 
         """
 
-        self.__text_processor = text_processor
-
         self.__relevant_words_matcher = Matcher(text_processor.get_vocab())
         self.__relevant_words_matcher.add(MatcherId.RELEVANT_WORDS_MATCHER_ID.value, relevant_words_rule)
 
         self.__all_words_matcher = Matcher(text_processor.get_vocab())
         self.__all_words_matcher.add(MatcherId.ALL_WORDS_MATCHER_ID.value, all_words_rule)
 
-    def check_sentence(self, sent: str) -> tuple[int, str]:
+    def check_sentence(self, sent: Span) -> tuple[int, str]:
         """
         Analyzes a sentence for complexity based on word count.
 
         Parameters:
-            sent (str): The sentence to be analyzed.
+            sent (Span): The processed sentence to be analyzed.
 
         Returns:
             tuple: A tuples with detected findings in the sentence. The tuple contains:
@@ -49,13 +57,11 @@ class ComplexChecker:
 
         """
 
-        doc = self.__text_processor.tokenize(sent)
-
         # Remove stopwords, punctuations and spaces for tooMuch check
-        relevant_words = self.__relevant_words_matcher(doc, as_spans=True)
+        relevant_words = self.__relevant_words_matcher(sent)
 
         # Remove punctuations and spaces for tooLong check
-        all_words = self.__all_words_matcher(doc, as_spans=True)
+        all_words = self.__all_words_matcher(sent)
 
         word_count = len(all_words)
         relevant_word_count = len(relevant_words)
@@ -69,3 +75,18 @@ class ComplexChecker:
             finding_desc = f"The sentence is too complex. Contains {word_count} words and {relevant_word_count} relevant words."
 
         return finding_count, finding_desc
+
+    def has_match(self, sent: Span) -> bool:
+        """
+        Checks whether a sentence contains too many words or relevant words, without building the finding description.
+        The words are only matched if the sentence has not too many relevant words.
+
+        Parameters:
+            sent (Span): The processed sentence to be analyzed.
+
+        Returns:
+            bool: True if the sentence has a finding.
+
+        """
+
+        return len(self.__relevant_words_matcher(sent)) > constants.TOO_MUCH or len(self.__all_words_matcher(sent)) > constants.TOO_LONG
@@ -2,7 +2,10 @@
 Implementation of passive checker
 """
 
+from typing import ClassVar
+
 from spacy.matcher import Matcher
+from spacy.tokens.span import Span
 
 from python_requirements_inspector import constants
 from python_requirements_inspector.text_processor import TextProcessor
@@ -18,14 +21,32 @@ passive_rule_en = [
     ]
 ]
 
+# forms of "haben", the auxiliary of the perfect tense, which never forms a passive
+haben_forms_de = ["habe", "hast", "hat", "haben", "habt", "hatte", "hattest", "hatten", "hattet", "hätte", "hättest", "hätten", "hättet"]
+
+# tags ending the window between a finite auxiliary and its participle: the end of the sentence, another finite auxiliary, a verb
+# or the boundary of its clause (comma, subordinating or coordinating conjunction, relative pronoun).
+# A token can only be in the window of the last finite auxiliary before it, so the rule matches in linear time and once per auxiliary.
+passive_window_end_tags_de = ["$.", "VAFIN", "VVPP", "VVFIN", "$,", "KOUS", "PRELS", "KON"]
+
+# window of a finite auxiliary in its clause
+passive_window_de = {"TAG": {"NOT_IN": passive_window_end_tags_de}, "OP": "*"}
+
+# finite auxiliary except the forms of "haben"
+passive_auxiliary_de = {"TAG": "VAFIN", "LOWER": {"NOT_IN": haben_forms_de}}
+
 # rules pattern for passive in german
-# Pattern: finite verb + perfect participle | finite verb, full
+# Pattern: finite auxiliary + perfect participle | finite verb of its clause, full
 # Example VVPP: Damit es möglich ist, wird eine Bewegungserlaubnis benötigt.
 # Example VVFIN: weil gewisse SR40-Systemteile nicht nur in der Schweiz angewendet werden sollen
-# 2nd Pattern Example: .. zu erstellen sein
+# 2nd Pattern (clause embedded between commas) Example: Das Protokoll wird, falls ein Fehler auftritt, gespeichert.
+# 3rd Pattern Example: .. zu erstellen sein
+# 4th Pattern (verb-final clause or infinitive) Example: .. der im Passiv geschrieben ist | .. muss geprüft werden
 passive_rule_de = [
-    [{"TAG": "VAFIN"}, {"OP": "*"}, {"TAG": {"IN": ["VVPP", "VVFIN"]}}],
+    [passive_auxiliary_de, passive_window_de, {"TAG": {"IN": ["VVPP", "VVFIN"]}}],
+    [passive_auxiliary_de, passive_window_de, {"TAG": "$,"}, {"TAG": {"NOT_IN": ["$.", "$,"]}, "OP": "+"}, {"TAG": "$,"}, passive_window_de, {"TAG": {"IN": ["VVPP", "VVFIN"]}}],
     [{"TAG": "PTKZU"}, {"TAG": "VVINF"}, {"TAG": "VAFIN"}],
+    [{"TAG": "VVPP"}, {"TAG": {"IN": ["VAFIN", "VAINF"]}, "LOWER": {"NOT_IN": haben_forms_de}}],
 ]
 
 
@@ -34,6 +55,12 @@ class PassiveChecker:
     A class for analyzing passive voice constructions in sentences.
     """
 
+    # Token annotations of the language model the rules rely on, per language
+    required_annotations: ClassVar[dict[str, frozenset[str]]] = {
+        constants.ENGLISH: frozenset({"DEP", "TAG"}),
+        constants.GERMAN: frozenset({"TAG"}),
+    }
+
     def __init__(self, text_processor: TextProcessor) -> None:
         """
         Initializes a PassiveChecker object.
@@ -43,26 +70,27 @@ class PassiveChecker:
 
         """
 
-        self.__text_processor = text_processor
-
         # Language-specific initialization
         lang = text_processor.get_language()
         if lang == constants.ENGLISH:
             passive_rule = passive_rule_en
+            greedy = None
         elif lang == constants.GERMAN:
             passive_rule = passive_rule_de  # type: ignore[assignment]
+            # a construction matched by several rules (e.g. "wird geprüft werden") is counted once
+            greedy = "FIRST"
         else:
             raise ValueError(f"Unsupported language: {lang}")
 
         self.__passive_matcher = Matcher(text_processor.get_vocab())
-        self.__passive_matcher.add(MatcherId.PASSIVE_MATCHER_ID.value, passive_rule)
+        self.__passive_matcher.add(MatcherId.PASSIVE_MATCHER_ID.value, passive_rule, greedy=greedy)
 
-    def check_sentence(self, sent: str) -> tuple[int, str]:
+    def check_sentence(self, sent: Span) -> tuple[int, str]:
         """
         Analyzes a sentence for passive voice constructions.
 
         Parameters:
-            sent (str): The sentence to be analyzed.
+            sent (Span): The processed sentence to be analyzed.
 
         Returns:
             tuple: A tuples with detected findings in the sentence. The tuple contains:
@@ -71,15 +99,22 @@ class PassiveChecker:
 
         """
 
-        doc = self.__text_processor.tokenize(sent)
+        # the Matcher reports positions relative to the sentence span
+        matches = self.__passive_matcher(sent)
 
-        matches = self.__passive_matcher(doc)
+        # the matched ranges form the error description
+        return len(matches), "".join(f" [{start}:{end}]" for _, start, end in matches)
 
-        finding_desc = ""
-        finding_count = len(matches)
+    def has_match(self, sent: Span) -> bool:
+        """
+        Checks whether a sentence contains passive voice constructions, without counting them or building the finding description.
+
+        Parameters:
+            sent (Span): The processed sentence to be analyzed.
 
-        for _, start, end in matches:
-            # Add the matched range to the error description
-            finding_desc += f" [{start}:{end}]"
+        Returns:
+            bool: True if the sentence has a finding.
+
+        """
 
-        return finding_count, finding_desc
+        return bool(self.__passive_matcher(sent))
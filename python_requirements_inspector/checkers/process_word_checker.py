@@ -2,7 +2,10 @@
 Implementation of process word checker
 """
 
+from typing import ClassVar
+
 from spacy.matcher import PhraseMatcher
+from spacy.tokens.span import Span
 
 from python_requirements_inspector import constants
 from python_requirements_inspector.text_processor import TextProcessor
@@ -167,6 +170,12 @@ class ProcessWordChecker:
     A class for analyzing the presence of process words in sentences.
     """
 
+    # Token annotations of the language model the process words are matched on, per language
+    required_annotations: ClassVar[dict[str, frozenset[str]]] = {
+        constants.ENGLISH: frozenset({"LEMMA"}),
+        constants.GERMAN: frozenset({"LEMMA"}),
+    }
+
     def __init__(self, text_processor: TextProcessor) -> None:
         """
         Initializes a ProcessWordChecker object.
@@ -187,16 +196,20 @@ class ProcessWordChecker:
         else:
             raise ValueError(f"Unsupported language: {lang}")
 
-        self.__process_word_matcher = PhraseMatcher(text_processor.get_vocab(), attr="LEMMA")
-        patterns = [text_processor.tokenize(name) for name in text_processor.lemmatize_list(process_word_list)]
+        self.__process_word_matcher = PhraseMatcher(text_processor.get_vocab(), attr="LOWER")
+        patterns = text_processor.get_lemma_patterns(process_word_list)
         self.__process_word_matcher.add(MatcherId.PROCESSWORD_MATCHER_ID.value, patterns)
 
-    def check_sentence(self, sent: str) -> tuple[int, str]:
+        # the lowercase lemmas of the patterns of a single word, and the first lemmas of the patterns of several words
+        self.__word_lemmas = frozenset(pattern[0].lower_ for pattern in patterns if len(pattern) == 1)
+        self.__phrase_first_lemmas = frozenset(pattern[0].lower_ for pattern in patterns if len(pattern) > 1)
+
+    def check_sentence(self, sent: Span) -> tuple[int, str]:
         """
         Checks if a sentence contains any process words (defined in the process word list).
 
         Parameters:
-            sent (str): The sentence to be analyzed.
+            sent (Span): The processed sentence to be analyzed.
 
         Returns:
             tuple: A tuples with detected findings in the sentence. The tuple contains:
@@ -205,17 +218,29 @@ class ProcessWordChecker:
 
         """
 
-        # make the sentence lowercase to ensure detection is case-insensitive
-        text = sent.lower()
-        doc = self.__text_processor.tokenize(text)
+        # match the lowercase lemmas to ensure detection is case-insensitive
+        lemma_doc = self.__text_processor.lemmatize_doc(sent)
+
+        matches = self.__process_word_matcher(lemma_doc)
+
+        return len(matches), "".join(f" {sent[start:end].text.lower()}" for _, start, end in matches)
 
-        # get the matched lowercase lemmas
-        matches = self.__process_word_matcher(doc, as_spans=True)
+    def has_match(self, sent: Span) -> bool:
+        """
+        Checks whether a sentence contains process words, without counting them or building the finding description.
 
-        finding_desc = ""
-        finding_count = len(matches)
+        Parameters:
+            sent (Span): The processed sentence to be analyzed.
 
-        for match in matches:
-            finding_desc += f" {match}"
+        Returns:
+            bool: True if the sentence has a finding.
+
+        """
 
-        return finding_count, finding_desc
+        lemmas = self.__text_processor.get_lowercase_lemmas(sent)
+        # a single word pattern matches a token with its lemma, no matcher is needed
+        if not self.__word_lemmas.isdisjoint(lemmas):
+            return True
+        if self.__phrase_first_lemmas.isdisjoint(lemmas):
+            return False
+        return bool(self.__process_word_matcher(self.__text_processor.lemmatize_doc(sent, lemmas)))
@@ -2,7 +2,10 @@
 Implementation of weak word checker
 """
 
+from typing import ClassVar
+
 from spacy.matcher import PhraseMatcher
+from spacy.tokens.span import Span
 
 from python_requirements_inspector import constants
 from python_requirements_inspector.text_processor import TextProcessor
@@ -81,6 +84,12 @@ class WeakWordChecker:
     A class for analyzing the presence of weak words in sentences.
     """
 
+    # Token annotations of the language model the weak words are matched on, per language
+    required_annotations: ClassVar[dict[str, frozenset[str]]] = {
+        constants.ENGLISH: frozenset({"LEMMA"}),
+        constants.GERMAN: frozenset({"LEMMA"}),
+    }
+
     def __init__(self, text_processor: TextProcessor) -> None:
         """
         Initializes a WeakWordChecker object.
@@ -101,16 +110,35 @@ class WeakWordChecker:
         else:
             raise ValueError(f"Unsupported language: {lang}")
 
-        self.__weak_word_matcher = PhraseMatcher(text_processor.get_vocab(), attr="LEMMA")
-        patterns = [text_processor.tokenize(name) for name in text_processor.lemmatize_list(weak_word_list)]
+        self.__weak_word_matcher = PhraseMatcher(text_processor.get_vocab(), attr="LOWER")
+        patterns = text_processor.get_lemma_patterns(weak_word_list)
         self.__weak_word_matcher.add(MatcherId.WEAKWORD_MATCHER_ID.value, patterns)
 
-    def check_sentence(self, sent: str) -> tuple[int, str]:
+        # the lowercase lemmas the patterns start with, a sentence containing none of them cannot match
+        self.__first_lemmas = frozenset(pattern[0].lower_ for pattern in patterns if len(pattern))
+
+    def is_candidate(self, sent: Span) -> bool:
+        """
+        Checks whether a sentence can contain a weak word, using the lemmas of the processed sentence only.
+        A sentence is a candidate if one of its lowercase lemmas starts a weak word pattern, so every sentence
+        with a match is a candidate.
+
+        Parameters:
+            sent (Span): The processed sentence.
+
+        Returns:
+            bool: False if the sentence contains no weak word.
+
+        """
+
+        return not self.__first_lemmas.isdisjoint(self.__text_processor.get_lowercase_lemmas(sent))
+
+    def check_sentence(self, sent: Span) -> tuple[int, str]:
         """
         Analyzes a sentence for weak words.
 
         Parameters:
-            sent (str): The sentence to be analyzed.
+            sent (Span): The processed sentence to be analyzed.
 
         Returns:
             tuple: A tuples with detected findings in the sentence. The tuple contains:
@@ -119,17 +147,29 @@ class WeakWordChecker:
 
         """
 
-        # make the sentence lowercase to ensure detection is case-insensitive
-        text = sent.lower()
-        doc = self.__text_processor.tokenize(text)
+        # most sentences contain no weak word and are rejected before building the lemma Doc
+        lemmas = self.__text_processor.get_lowercase_lemmas(sent)
+        if self.__first_lemmas.isdisjoint(lemmas):
+            return 0, ""
+
+        # match the lowercase lemmas to ensure detection is case-insensitive
+        lemma_doc = self.__text_processor.lemmatize_doc(sent, lemmas)
+
+        matches = self.__weak_word_matcher(lemma_doc)
+
+        return len(matches), "".join(f"{sent[start:end].text.lower()} [{start}] " for _, start, end in matches)
 
-        matches = self.__weak_word_matcher(doc)
+    def has_match(self, sent: Span) -> bool:
+        """
+        Checks whether a sentence contains weak words, without counting them or building the finding description.
 
-        finding_desc = ""
-        finding_count = len(matches)
+        Parameters:
+            sent (Span): The processed sentence to be analyzed.
 
-        for _, start, end in matches:
-            matched_word = doc[start:end].text
-            finding_desc += f"{matched_word} [{start}] "
+        Returns:
+            bool: True if the sentence has a finding.
+
+        """
 
-        return finding_count, finding_desc
+        lemmas = self.__text_processor.get_lowercase_lemmas(sent)
+        return not self.__first_lemmas.isdisjoint(lemmas) and bool(self.__weak_word_matcher(self.__text_processor.lemmatize_doc(sent, lemmas)))
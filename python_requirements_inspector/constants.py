@@ -4,6 +4,9 @@ Summary of all application constants
 
 from python_requirements_inspector.type_definitions import FindingType, RequirementsInspectorResponseItem
 
+# Name of the installed package, its version covers changes of the analysis code
+PACKAGE_NAME = "python-requirements-inspector"
+
 # Complexity threshold for when a text is too complex
 TOO_LONG = 38
 TOO_MUCH = 19
@@ -12,9 +15,30 @@ TOO_MUCH = 19
 GERMAN = "de"
 ENGLISH = "en"
 SUPPORTED_LANGUAGES = [GERMAN, ENGLISH]
+MULTI_LANGUAGE = "xx"
+
+# Spacy language models per language
+LANGUAGE_MODELS = {GERMAN: "de_core_news_md", ENGLISH: "en_core_web_md"}
+
+# Pipeline components of the language models
+MODEL_COMPONENTS = ["tok2vec", "tagger", "morphologizer", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"]
+
+# Pipeline components providing a token annotation, including the components they depend on.
+# Components missing in a language model are ignored.
+ANNOTATION_COMPONENTS = {
+    "TAG": ["tok2vec", "tagger"],
+    "MORPH": ["tok2vec", "morphologizer"],
+    "DEP": ["tok2vec", "parser"],
+    "LEMMA": ["tok2vec", "tagger", "attribute_ruler", "lemmatizer"],
+    "SENT_START": ["tok2vec", "parser"],
+}
 
 DEFAULT_DESCRIPTION_CHECKS = [FindingType.COMPLEX, FindingType.PASSIVE, FindingType.WEAKWORD, FindingType.COMPARATIVE]
 DEFAULT_TITLE_CHECKS = [FindingType.PROCESS]
+DEFAULT_CHECKS = [*DEFAULT_DESCRIPTION_CHECKS, *DEFAULT_TITLE_CHECKS]
+
+# Number of workitems, and of texts per language model batch, analyzed together
+DEFAULT_BATCH_SIZE = 64
 
 
 INITIALIZED_DATA_FRAME = RequirementsInspectorResponseItem(
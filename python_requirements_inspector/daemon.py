@@ -0,0 +1,391 @@
+"""
+Implementation of the analysis daemon and its client
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+from dataclasses import replace
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from spacy.util import get_package_version
+
+from python_requirements_inspector import constants
+from python_requirements_inspector.arguments import add_memory_arguments
+from python_requirements_inspector.type_definitions import AnalyzerOptions, FindingType, RequirementsInspectorResponseItem, WorkItem
+from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
+
+# Environment variable overriding the path of the daemon socket
+SOCKET_PATH_VARIABLE = "REQUIREMENTS_INSPECTOR_SOCKET"
+
+# Version of the protocol between client and daemon, the daemon rejects other versions and other package versions
+PROTOCOL_VERSION = 2
+
+# Seconds a client waits for the daemon to accept its request, e.g. while the daemon serves another client,
+# before analyzing in its own process
+ACCEPT_TIMEOUT = 2.0
+
+# Seconds a client waits for the results of a batch
+RESULTS_TIMEOUT = 600.0
+
+# Maximum number of resident analyzers (one per set of client options), the least recently used one is closed
+MAX_ANALYZERS = 4
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon reports an error while analyzing the workitems of a client."""
+
+
+def get_default_socket_path() -> Path:
+    """
+    Returns the path of the daemon socket: the path of the environment variable, a socket in the
+    runtime directory of the user or a socket per user in the temporary directory.
+
+    Returns:
+        Path: The path of the socket.
+
+    """
+    socket_path = os.environ.get(SOCKET_PATH_VARIABLE)
+    if socket_path:
+        return Path(socket_path)
+    runtime_directory = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_directory:
+        return Path(runtime_directory) / "python-requirements-inspector.sock"
+    return Path(tempfile.gettempdir()) / f"python-requirements-inspector-{os.getuid()}.sock"
+
+
+def _options_to_json(options: AnalyzerOptions) -> dict[str, Any]:
+    """
+    Converts analyzer options to JSON. The path of the result cache is made absolute, as the daemon runs in another working directory.
+
+    Parameters:
+        options (AnalyzerOptions): The options of the analysis.
+
+    Returns:
+        dict: The JSON serializable options.
+
+    """
+    return {
+        "single_parse": options.single_parse,
+        "checks": None if options.checks is None else [check.name for check in options.checks],
+        "sentence_cache_size": options.sentence_cache_size,
+        "result_cache": None if options.result_cache is None else str(Path(options.result_cache).resolve()),
+        "max_new_strings": options.max_new_strings,
+        "max_rss_mb": options.max_rss_mb,
+        "language_sample_size": options.language_sample_size,
+        "language_confidence": options.language_confidence,
+        "content_hash": options.content_hash,
+    }
+
+
+def _options_from_json(data: dict[str, Any]) -> AnalyzerOptions:
+    """
+    Converts JSON to analyzer options (see _options_to_json).
+
+    Parameters:
+        data (dict): The JSON options.
+
+    Returns:
+        AnalyzerOptions: The options of the analysis.
+
+    """
+    checks = data.get("checks")
+    return AnalyzerOptions(
+        single_parse=bool(data.get("single_parse", False)),
+        checks=None if checks is None else tuple(FindingType[name] for name in checks),
+        sentence_cache_size=int(data.get("sentence_cache_size", AnalyzerOptions.sentence_cache_size)),
+        result_cache=data.get("result_cache"),
+        max_new_strings=data.get("max_new_strings"),
+        max_rss_mb=data.get("max_rss_mb"),
+        language_sample_size=int(data.get("language_sample_size", AnalyzerOptions.language_sample_size)),
+        language_confidence=float(data.get("language_confidence", AnalyzerOptions.language_confidence)),
+        content_hash=bool(data.get("content_hash", False)),
+    )
+
+
+def _write_line(file: Any, item: Any) -> None:
+    """
+    Writes an item as a JSON line to a binary file.
+
+    Parameters:
+        file (Any): The binary file (or socket file).
+        item (Any): The JSON serializable item.
+
+    """
+    file.write(json.dumps(item).encode("utf-8") + b"\n")
+    file.flush()
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handles a client connection. The client sends a request line with the protocol and package versions, the options
+    and the batch size, which the daemon accepts with a line of its versions. The client then sends one line per batch
+    of workitems, which the daemon answers with a line of results, or with an error line.
+    """
+
+    server: "AnalysisDaemon"
+
+    def __read_request(self) -> tuple[AnalyzerOptions, int] | None:
+        """
+        Reads the request line of the client.
+
+        Returns:
+            tuple: The options of the analysis and the batch size, or None if the client sent no request.
+
+        """
+        line = self.rfile.readline()
+        if not line.strip():
+            return None
+        request = json.loads(line)
+        if request.get("version") != PROTOCOL_VERSION:
+            raise ValueError(f"Unsupported protocol version: {request.get('version')}")
+        if request.get("package") != get_package_version(constants.PACKAGE_NAME):
+            raise ValueError(f"The daemon runs version {get_package_version(constants.PACKAGE_NAME)}, not {request.get('package')}")
+        return _options_from_json(request["options"]), int(request["batch_size"])
+
+    def handle(self) -> None:
+        try:
+            request = self.__read_request()
+            if request is None:
+                # e.g. a check whether the daemon is running
+                return
+            options, batch_size = request
+            _write_line(self.wfile, {"version": PROTOCOL_VERSION, "package": get_package_version(constants.PACKAGE_NAME)})
+
+            # each batch is analyzed before the next one is read
+            batches = (json.loads(line) for line in self.rfile if line.strip())
+            for results in self.server.get_analyzer(options).analyze_batches(batches, batch_size):
+                _write_line(self.wfile, {"results": results})
+                self.server.release_stale_models()
+        except (BrokenPipeError, ConnectionResetError):
+            # the client closed the connection
+            return
+        except Exception as error:  # noqa: BLE001 - the error is reported to the client and the daemon keeps serving
+            with suppress(OSError):
+                _write_line(self.wfile, {"error": f"{type(error).__name__}: {error}"})
+
+
+class AnalysisDaemon(socketserver.UnixStreamServer):
+    """
+    A server keeping workitem analyzers and their language models resident, so that clients
+    analyze workitems without loading the language models. Connections are handled one at a time.
+    """
+
+    def __init__(self, socket_path: Path, options: AnalyzerOptions | None = None, max_new_strings: int | None = None, max_rss_mb: int | None = None) -> None:
+        """
+        Initializes an AnalysisDaemon object and binds its socket. The socket is only accessible by the user.
+
+        Parameters:
+            socket_path (Path): The path of the socket.
+            options (AnalyzerOptions): The options the language models are warmed up for, None for the default options.
+            max_new_strings (int): The memory limit of the analyzers, replacing the limit of the clients (see AnalyzerOptions).
+            max_rss_mb (int): The memory limit of the analyzers, replacing the limit of the clients (see AnalyzerOptions).
+
+        """
+        self.__socket_path = socket_path
+        self.__max_new_strings = max_new_strings
+        self.__max_rss_mb = max_rss_mb
+        self.__options = options or AnalyzerOptions()
+        self.__analyzers: OrderedDict[AnalyzerOptions, WorkitemAnalyzer] = OrderedDict()
+        self.__analyzers_lock = threading.Lock()
+
+        # a socket left behind by a stopped daemon is replaced
+        if socket_path.exists():
+            connection = connect_to_daemon(socket_path)
+            if connection is not None:
+                connection.close()
+                raise RuntimeError(f"A daemon is already listening on {socket_path}")
+            socket_path.unlink()
+
+        # the socket is created without access for others, instead of restricting it after it is bound
+        umask = os.umask(0o177)
+        try:
+            super().__init__(str(socket_path), _DaemonRequestHandler)
+        finally:
+            os.umask(umask)
+
+    def get_analyzer(self, options: AnalyzerOptions) -> WorkitemAnalyzer:
+        """
+        Returns the workitem analyzer of the given options, creating it on first use.
+        Beyond MAX_ANALYZERS options, the analyzer used least recently is closed, with its sentence cache.
+
+        Parameters:
+            options (AnalyzerOptions): The options of the analysis.
+
+        Returns:
+            WorkitemAnalyzer: The resident analyzer.
+
+        """
+        # the memory of the daemon is bounded by the daemon, not by its clients
+        options = replace(options, max_new_strings=self.__max_new_strings, max_rss_mb=self.__max_rss_mb)
+        with self.__analyzers_lock:
+            analyzer = self.__analyzers.get(options)
+            if analyzer is None:
+                analyzer = WorkitemAnalyzer(options)
+                self.__analyzers[options] = analyzer
+                if len(self.__analyzers) > MAX_ANALYZERS:
+                    # connections are handled one at a time, so the evicted analyzer is not in use
+                    _, evicted_analyzer = self.__analyzers.popitem(last=False)
+                    evicted_analyzer.close()
+            self.__analyzers.move_to_end(options)
+            return analyzer
+
+    def release_stale_models(self) -> None:
+        """
+        Releases the language models held by the analyzers of other options after one analyzer reloaded them,
+        so that the process does not keep the dropped models alongside the reloaded ones.
+        """
+        with self.__analyzers_lock:
+            analyzers = list(self.__analyzers.values())
+        for analyzer in analyzers:
+            analyzer.release_stale_models()
+
+    def warm_up(self) -> None:
+        """
+        Loads the language models of all supported languages for the options of the daemon.
+        """
+        self.get_analyzer(self.__options).load_languages(constants.SUPPORTED_LANGUAGES)
+
+    def server_close(self) -> None:
+        """
+        Closes the socket, removes the socket file and closes the analyzers.
+        """
+        super().server_close()
+        self.__socket_path.unlink(missing_ok=True)
+        with self.__analyzers_lock:
+            for analyzer in self.__analyzers.values():
+                analyzer.close()
+            self.__analyzers.clear()
+
+
+def connect_to_daemon(socket_path: Path | None = None) -> socket.socket | None:
+    """
+    Connects to a running daemon. A socket of another user is ignored, as the default path in the temporary directory
+    is predictable and the workitems must not be sent to a daemon of someone else.
+
+    Parameters:
+        socket_path (Path): The path of the daemon socket, None for the default path.
+
+    Returns:
+        socket.socket: The connection, with a timeout of ACCEPT_TIMEOUT, or None if no daemon of the user is running.
+
+    """
+    socket_path = socket_path or get_default_socket_path()
+    try:
+        if socket_path.stat().st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.settimeout(ACCEPT_TIMEOUT)
+    try:
+        connection.connect(str(socket_path))
+    except OSError:
+        connection.close()
+        return None
+    return connection
+
+
+def start_analysis_in_daemon(options: AnalyzerOptions, batch_size: int, socket_path: Path | None = None) -> socket.socket | None:
+    """
+    Connects to a running daemon and requests an analysis. The daemon accepts the request if it runs the same
+    protocol and package version and answers within ACCEPT_TIMEOUT (it serves one client at a time).
+
+    Parameters:
+        options (AnalyzerOptions): The options of the analysis.
+        batch_size (int): The number of texts per batch of the language model.
+        socket_path (Path): The path of the daemon socket, None for the default path.
+
+    Returns:
+        socket.socket: The connection ready for the batches (see analyze_batches_in_daemon), or None if no daemon
+            accepted the request, so that the workitems are analyzed in this process.
+
+    """
+    connection = connect_to_daemon(socket_path)
+    if connection is None:
+        return None
+    try:
+        with connection.makefile("rwb") as connection_file:
+            request = {"version": PROTOCOL_VERSION, "package": get_package_version(constants.PACKAGE_NAME), "options": _options_to_json(options), "batch_size": batch_size}
+            _write_line(connection_file, request)
+            response = json.loads(connection_file.readline() or b'{"error": "The daemon closed the connection"}')
+    except (OSError, ValueError):
+        # e.g. the daemon serves another client
+        connection.close()
+        return None
+    if "error" in response:
+        # e.g. a daemon of another package version
+        connection.close()
+        return None
+    return connection
+
+
+def analyze_batches_in_daemon(connection: socket.socket, batches: Iterable[list[WorkItem]]) -> Iterator[list[RequirementsInspectorResponseItem]]:
+    """
+    Analyzes workitems already split into batches in the daemon (see WorkitemAnalyzer.analyze_batches).
+    The connection is closed when all batches are analyzed.
+
+    Parameters:
+        connection (socket.socket): The connection to the daemon (see start_analysis_in_daemon).
+        batches (Iterable): The batches of workitems to be analyzed.
+
+    Returns:
+        Iterator: Per batch, the data frames (dictonary) with analyzed workitem information.
+
+    """
+    connection.settimeout(RESULTS_TIMEOUT)
+    with connection, connection.makefile("rwb") as connection_file:
+        # a batch is sent after the results of the previous one are received, so neither side blocks on a full socket buffer
+        for batch in batches:
+            _write_line(connection_file, batch)
+            try:
+                line = connection_file.readline()
+            except TimeoutError as error:
+                raise DaemonError(f"The daemon sent no results within {RESULTS_TIMEOUT} seconds") from error
+            response = json.loads(line or b'{"error": "The daemon closed the connection"}')
+            if "error" in response:
+                raise DaemonError(response["error"])
+            yield response["results"]
+
+
+def _stop(signal_number: int, frame: FrameType | None) -> None:  # noqa: ARG001
+    """
+    Signal handler stopping the daemon like an interrupt, so that the socket is removed.
+    """
+    raise KeyboardInterrupt
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Keeps the language models loaded and analyzes the workitems forwarded by inspect-requirements.")
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help=f"path of the socket (default: ${SOCKET_PATH_VARIABLE}, $XDG_RUNTIME_DIR or the temporary directory)",
+    )
+    add_memory_arguments(parser)
+    args = parser.parse_args()
+
+    daemon = AnalysisDaemon(args.socket or get_default_socket_path(), max_new_strings=args.max_new_strings, max_rss_mb=args.max_rss_mb)
+    signal.signal(signal.SIGTERM, _stop)
+    try:
+        daemon.warm_up()
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
+
+
+if __name__ == "__main__":
+    run()
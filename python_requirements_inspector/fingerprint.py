@@ -0,0 +1,96 @@
+"""
+Implementation of the ruleset and workitem fingerprints
+"""
+
+import hashlib
+import json
+from typing import Any
+
+import spacy
+from spacy.util import get_package_version
+
+from python_requirements_inspector import constants
+from python_requirements_inspector.checkers import comparative_checker, complex_checker, passive_checker, process_word_checker, weak_word_checker
+from python_requirements_inspector.type_definitions import AnalyzerOptions, WorkItem
+
+
+def _hash_json(value: Any) -> str:
+    """
+    Hashes a JSON serializable value.
+
+    Parameters:
+        value (Any): The value to be hashed.
+
+    Returns:
+        str: The hexadecimal SHA-256 hash of the JSON representation.
+
+    """
+    serialized = json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def get_ruleset_fingerprint(options: AnalyzerOptions) -> str:
+    """
+    Returns a fingerprint of everything the results of an analysis depend on besides the workitem:
+    the word lists, the thresholds, the matcher rules, the versions of the language models and the analysis options.
+
+    Parameters:
+        options (AnalyzerOptions): The options of the analysis.
+
+    Returns:
+        str: The hexadecimal fingerprint.
+
+    """
+    checks = constants.DEFAULT_CHECKS if options.checks is None else options.checks
+    ruleset = {
+        "package": get_package_version(constants.PACKAGE_NAME),
+        "spacy": spacy.about.__version__,
+        "models": {name: get_package_version(name) for name in constants.LANGUAGE_MODELS.values()},
+        "thresholds": [constants.TOO_LONG, constants.TOO_MUCH],
+        "weak_words": [weak_word_checker.weak_word_list_en, weak_word_checker.weak_word_list_de],
+        "process_words": [process_word_checker.process_word_list_en, process_word_checker.process_word_list_de],
+        "complex_rules": [complex_checker.relevant_words_rule, complex_checker.all_words_rule],
+        "passive_rules": [passive_checker.passive_rule_en, passive_checker.passive_rule_de],
+        "comparative_rules": [
+            comparative_checker.comparative_rule_en,
+            comparative_checker.comparative_rule_de,
+            comparative_checker.superlative_rule_en,
+            comparative_checker.superlative_rule_de,
+        ],
+        # the order of the selected checks does not change the results
+        "checks": sorted(check.name for check in set(checks)),
+        "single_parse": options.single_parse,
+        # the detected language of workitems without a language depends on the sampled text
+        "language_detection": [options.language_sample_size, options.language_confidence],
+    }
+    return _hash_json(ruleset)
+
+
+def get_content_hash(workitem: WorkItem) -> str:
+    """
+    Returns a hash of all fields of a workitem. The order of the fields is part of the hash,
+    because it determines the order of the smell description.
+
+    Parameters:
+        workitem (dict): A dictionary representing the workitem data.
+
+    Returns:
+        str: The hexadecimal hash.
+
+    """
+    return _hash_json(list(workitem.items()))
+
+
+def get_result_hash(ruleset_fingerprint: str, content_hash: str) -> str:
+    """
+    Returns a hash identifying the result of a workitem: equal hashes mean equal results.
+
+    Parameters:
+        ruleset_fingerprint (str): The fingerprint of the ruleset (see get_ruleset_fingerprint).
+        content_hash (str): The content hash of the workitem (see get_content_hash).
+
+    Returns:
+        str: The hexadecimal hash.
+
+    """
+    return _hash_json([ruleset_fingerprint, content_hash])
@@ -0,0 +1,210 @@
+"""
+Implementation of the HTTP analysis service
+"""
+
+import argparse
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from python_requirements_inspector import constants
+from python_requirements_inspector.arguments import add_language_detection_arguments, add_memory_arguments, positive_int
+from python_requirements_inspector.main import check_list
+from python_requirements_inspector.metrics import Metrics
+from python_requirements_inspector.micro_batcher import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT, MicroBatcher
+from python_requirements_inspector.type_definitions import AnalyzerOptions, WorkItem
+from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
+
+# Maximum size of a request body in bytes
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+
+class _AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the requests of the service:
+    POST /analyze with a workitem or a list of workitems returns the result or the list of results
+    (workitems of unsupported languages have no result in the list, like in the output of inspect-requirements,
+    and a single workitem of an unsupported language is answered with 422),
+    GET /health returns whether the language models are loaded,
+    GET /metrics returns the metrics of the analysis in the Prometheus text format.
+    """
+
+    server: "AnalysisServer"
+
+    def __send_json(self, status: HTTPStatus, body: Any) -> None:
+        self.__send_content(status, json.dumps(body).encode("utf-8"), "application/json")
+
+    def __send_content(self, status: HTTPStatus, content: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def __read_workitems(self) -> tuple[list[WorkItem], bool] | None:
+        """
+        Reads the workitems of the request body, sending an error response if the body is invalid.
+
+        Returns:
+            tuple: The workitems and whether a single workitem (instead of a list) was sent, or None if the body is invalid.
+
+        """
+        try:
+            content_length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self.__send_json(HTTPStatus.BAD_REQUEST, {"error": "Invalid Content-Length"})
+            return None
+        if content_length > MAX_BODY_SIZE:
+            self.__send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": f"The body exceeds {MAX_BODY_SIZE} bytes"})
+            return None
+        try:
+            body = json.loads(self.rfile.read(content_length))
+        except ValueError as error:
+            self.__send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {error}"})
+            return None
+
+        single = isinstance(body, dict)
+        workitems = [body] if single else body
+        if not isinstance(workitems, list) or not all(isinstance(workitem, dict) for workitem in workitems):
+            self.__send_json(HTTPStatus.BAD_REQUEST, {"error": "Expecting a workitem or a list of workitems"})
+            return None
+        return workitems, single
+
+    def do_GET(self) -> None:
+        if self.path == "/metrics":
+            self.__send_content(HTTPStatus.OK, self.server.get_metrics().to_prometheus().encode("utf-8"), "text/plain; version=0.0.4")
+        elif self.path != "/health":
+            self.__send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+        elif self.server.is_ready():
+            self.__send_json(HTTPStatus.OK, {"status": "ready"})
+        else:
+            self.__send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"status": "starting"})
+
+    def do_POST(self) -> None:
+        if self.path != "/analyze":
+            self.__send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+            return
+        request = self.__read_workitems()
+        if request is None:
+            return
+        workitems, single = request
+
+        try:
+            results = self.server.batcher.submit(workitems).result()
+        except Exception as error:  # noqa: BLE001 - the error is reported to the client
+            self.__send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(error).__name__}: {error}"})
+            return
+        if not single:
+            self.__send_json(HTTPStatus.OK, [result for result in results if result is not None])
+        elif results[0] is None:
+            self.__send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {"error": f"Unsupported language: {workitems[0].get('language')}"})
+        else:
+            self.__send_json(HTTPStatus.OK, results[0])
+
+
+class AnalysisServer(ThreadingHTTPServer):
+    """
+    An HTTP server analyzing the posted workitems. The workitems of concurrent requests are analyzed together.
+    """
+
+    def __init__(self, address: tuple[str, int], options: AnalyzerOptions | None = None, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait: float = DEFAULT_MAX_WAIT) -> None:
+        """
+        Initializes an AnalysisServer object and binds its address.
+
+        Parameters:
+            address (tuple): The host and port to listen on.
+            options (AnalyzerOptions): The options of the analysis, None for the default options.
+            max_batch_size (int): The maximum number of workitems analyzed together (see MicroBatcher).
+            max_wait (float): The maximum time in seconds a request waits for other requests (see MicroBatcher).
+
+        """
+        super().__init__(address, _AnalysisRequestHandler)
+        self.__analyzer = WorkitemAnalyzer(options)
+        self.__ready = threading.Event()
+        self.batcher = MicroBatcher(self.__analyzer, max_batch_size, max_wait)
+
+    def warm_up(self) -> None:
+        """
+        Loads the language models and creates the checkers of all supported languages by analyzing a workitem per language.
+        The server reports ready afterwards.
+        """
+        self.__analyzer.load_languages(constants.SUPPORTED_LANGUAGES)
+        self.batcher.submit([WorkItem(id=None, title="warm up", description="warm up", language=lang) for lang in constants.SUPPORTED_LANGUAGES]).result()
+        self.__ready.set()
+
+    def get_metrics(self) -> Metrics:
+        """
+        Returns the metrics of the analysis (see WorkitemAnalyzer.get_metrics).
+
+        Returns:
+            Metrics: The metrics.
+
+        """
+        return self.__analyzer.get_metrics()
+
+    def is_ready(self) -> bool:
+        """
+        Returns whether the server is warmed up.
+
+        Returns:
+            bool: True if the language models are loaded.
+
+        """
+        return self.__ready.is_set()
+
+    def server_close(self) -> None:
+        """
+        Stops the batcher, closes the socket and closes the analyzer.
+        """
+        super().server_close()
+        self.batcher.close()
+        self.__analyzer.close()
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Analyses workitems posted to an HTTP service.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on (default: 8080)")
+    parser.add_argument("--single-parse", action="store_true", help="process each text field with the language model at once and use its sentence boundaries")
+    parser.add_argument("--checks", type=check_list, default=None, help="comma separated checks to perform (default: all)")
+    parser.add_argument(
+        "--max-batch-size",
+        type=positive_int,
+        default=DEFAULT_MAX_BATCH_SIZE,
+        help=f"maximum number of workitems of concurrent requests analyzed together (default: {DEFAULT_MAX_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--max-wait-ms",
+        type=positive_int,
+        default=int(DEFAULT_MAX_WAIT * 1000),
+        help=f"maximum milliseconds a request waits for concurrent requests (default: {int(DEFAULT_MAX_WAIT * 1000)})",
+    )
+    add_memory_arguments(parser)
+    add_language_detection_arguments(parser)
+    args = parser.parse_args()
+
+    options = AnalyzerOptions(
+        single_parse=args.single_parse,
+        checks=args.checks,
+        max_new_strings=args.max_new_strings,
+        max_rss_mb=args.max_rss_mb,
+        language_sample_size=args.language_sample_size,
+        language_confidence=args.language_confidence,
+    )
+    server = AnalysisServer((args.host, args.port), options, args.max_batch_size, args.max_wait_ms / 1000)
+    # the health endpoint answers while the language models are loaded
+    threading.Thread(target=server.warm_up, name="warm-up", daemon=True).start()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    run()
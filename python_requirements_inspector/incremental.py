@@ -0,0 +1,159 @@
+"""
+Implementation of the incremental analysis against the results of a previous run
+"""
+
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator
+
+from python_requirements_inspector.fingerprint import get_content_hash, get_result_hash
+from python_requirements_inspector.result_writer import DESCRIPTION_FIELD
+from python_requirements_inspector.type_definitions import RequirementsInspectorResponseItem, WorkItem
+
+# Number of previous results read ahead while looking for the result of a workitem
+PREVIOUS_LOOKAHEAD = 10000
+
+# Number of results waiting for the analysis of a batch, before an incomplete batch is analyzed
+MAX_PENDING_RESULTS = 4096
+
+
+class PreviousResults:
+    """
+    A class for looking up the results of a previous run by workitem id while reading them one by one.
+    The results are expected in about the order of the workitems: a result is found up to lookahead results ahead of
+    the last found result, and results further behind it than the lookahead are forgotten.
+    """
+
+    def __init__(self, results: Iterable[RequirementsInspectorResponseItem], lookahead: int = PREVIOUS_LOOKAHEAD) -> None:
+        """
+        Initializes a PreviousResults object.
+
+        Parameters:
+            results (Iterable): The results of the previous run.
+            lookahead (int): The number of results read ahead of the last found result, at most twice as many are held in memory.
+
+        """
+        self.__results = iter(results)
+        self.__lookahead = lookahead
+        # the results read but not yet found, with their position, in the order of the previous run
+        self.__read_ahead: OrderedDict[str, tuple[int, RequirementsInspectorResponseItem]] = OrderedDict()
+        self.__read_count = 0
+        # the position following the furthest result found so far
+        self.__position = 0
+
+    def pop(self, workitem_id: str) -> RequirementsInspectorResponseItem | None:
+        """
+        Returns the previous result of a workitem and forgets it.
+
+        Parameters:
+            workitem_id (str): The id of the workitem.
+
+        Returns:
+            dict: The previous result or None if the workitem has no previous result within the lookahead.
+
+        """
+        entry = self.__read_ahead.pop(workitem_id, None)
+        if entry is not None:
+            return self.__found(*entry)
+
+        # a miss (new workitem) stops after the lookahead and keeps all results read, they may belong to the next workitems
+        while self.__read_count <= self.__position + self.__lookahead:
+            result = next(self.__results, None)
+            if result is None:
+                break
+            position = self.__read_count
+            self.__read_count += 1
+            result_id = result.get("id")
+            if result_id is None:
+                continue
+            if str(result_id) == workitem_id:
+                return self.__found(position, result)
+            self.__read_ahead[str(result_id)] = (position, result)
+        return None
+
+    def __found(self, position: int, result: RequirementsInspectorResponseItem) -> RequirementsInspectorResponseItem:
+        self.__position = max(self.__position, position + 1)
+        while self.__read_ahead:
+            oldest_position, _ = next(iter(self.__read_ahead.values()))
+            if oldest_position + self.__lookahead >= self.__position:
+                break
+            # results far behind the last found result belong to removed workitems or to workitems far out of order
+            self.__read_ahead.popitem(last=False)
+        return result
+
+
+def analyze_incrementally(
+    workitems: Iterable[WorkItem],
+    previous_results: PreviousResults,
+    ruleset_fingerprint: str,
+    analyze_batches: Callable[[Iterable[list[WorkItem]]], Iterator[list[RequirementsInspectorResponseItem]]],
+    batch_size: int,
+) -> Iterator[RequirementsInspectorResponseItem]:
+    """
+    Analyzes only the new and changed workitems and takes the results of the unchanged workitems from the previous run.
+    A workitem is unchanged if its previous result (matched by id) has the same contentHash and a smell description
+    (previous output written without descriptions is analyzed again).
+    The results are returned in the order of the workitems, as if all workitems were analyzed.
+
+    Parameters:
+        workitems (Iterable): The workitems to be analyzed.
+        previous_results (PreviousResults): The results of the previous run.
+        ruleset_fingerprint (str): The fingerprint of the ruleset of this run (see fingerprint.get_ruleset_fingerprint).
+        analyze_batches (Callable): Analyzes batches of workitems and returns the results per batch with their contentHash,
+            e.g. WorkitemAnalyzer.analyze_batches with AnalyzerOptions.content_hash.
+        batch_size (int): The number of workitems analyzed together.
+
+    Returns:
+        Iterator: The data frames (dictonary) with analyzed workitem information.
+
+    """
+    workitem_iterator = iter(workitems)
+    # Per workitem in input order: the previous result, or the hash of the result expected from the analysis
+    pending: deque[RequirementsInspectorResponseItem | str] = deque()
+    changed_workitems: list[WorkItem] = []
+    analyzed_batch_sizes: deque[int] = deque()
+
+    def read_workitem() -> bool:
+        workitem = next(workitem_iterator, None)
+        if workitem is None:
+            return False
+
+        result_hash = get_result_hash(ruleset_fingerprint, get_content_hash(workitem))
+        workitem_id = workitem.get("id")
+        previous_result = previous_results.pop(str(workitem_id)) if workitem_id is not None else None
+        if previous_result is not None and previous_result.get("contentHash") == result_hash and DESCRIPTION_FIELD in previous_result:
+            pending.append(previous_result)
+        else:
+            pending.append(result_hash)
+            changed_workitems.append(workitem)
+        return True
+
+    def changed_batches() -> Iterator[list[WorkItem]]:
+        while True:
+            while len(changed_workitems) < batch_size and len(pending) < MAX_PENDING_RESULTS and read_workitem():
+                pass
+            if not changed_workitems and len(pending) < MAX_PENDING_RESULTS:
+                return
+            # an incomplete (or empty) batch bounds the number of results waiting for the analysis
+            batch = changed_workitems.copy()
+            changed_workitems.clear()
+            analyzed_batch_sizes.append(len(batch))
+            yield batch
+
+    analyzed_batches = analyze_batches(changed_batches())
+    # the analyzed results of the received batches and the number of their workitems not yet returned
+    analyzed_results: deque[RequirementsInspectorResponseItem] = deque()
+    received_workitems = 0
+    while pending or read_workitem():
+        entry = pending.popleft()
+        if not isinstance(entry, str):
+            yield entry
+            continue
+
+        while not received_workitems:
+            analyzed_results.extend(next(analyzed_batches))
+            received_workitems += analyzed_batch_sizes.popleft()
+        received_workitems -= 1
+
+        if analyzed_results and analyzed_results[0]["contentHash"] == entry:
+            yield analyzed_results.popleft()
+        # otherwise the workitem produced no result (unsupported language)
@@ -0,0 +1,282 @@
+"""
+Implementation of streaming JSON input and output
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from enum import Enum
+from typing import IO, Any, cast
+
+# Number of characters read from the input file at once
+READ_CHUNK_SIZE = 65536
+
+# Characters changing the nesting of JSON values outside of strings, and the characters of a string up to its closing quote
+STRUCTURE_PATTERN = re.compile(r'["\[\]{}]')
+STRING_CONTENT_PATTERN = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+# Characters ending a number or a literal (true, false, null) in an array
+SCALAR_END_PATTERN = re.compile(r"[\s,\]]")
+
+
+class JsonFormat(Enum):
+    JSON = "json"  # a JSON array of items
+    JSON_LINES = "jsonl"  # one JSON item per line
+
+
+class JsonArrayReader:
+    """
+    A class for reading the items of a JSON array one by one, without loading the whole array into memory.
+    """
+
+    def __init__(self, json_file: IO[str]) -> None:
+        """
+        Initializes a JsonArrayReader object.
+
+        Parameters:
+            json_file (IO): The file containing the JSON array.
+
+        """
+        self.__file = json_file
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__position = 0
+        self.__end_of_file = False
+
+    def __read_chunk(self, size: int | None = None) -> bool:
+        """
+        Appends the next chunk of the file to the buffer and drops the already processed part of the buffer.
+
+        Parameters:
+            size (int): The number of characters to read, None for READ_CHUNK_SIZE.
+
+        Returns:
+            bool: False if the end of the file is reached.
+
+        """
+        chunk = self.__file.read(size or READ_CHUNK_SIZE)
+        if not chunk:
+            self.__end_of_file = True
+            return False
+        self.__buffer = self.__buffer[self.__position :] + chunk
+        self.__position = 0
+        return True
+
+    def __next_char(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it.
+
+        Returns:
+            str: The next character or an empty string at the end of the file.
+
+        """
+        while True:
+            while self.__position < len(self.__buffer) and self.__buffer[self.__position].isspace():
+                self.__position += 1
+            if self.__position < len(self.__buffer) or not self.__read_chunk():
+                return self.__buffer[self.__position : self.__position + 1]
+
+    def __expect(self, expected_chars: str, message: str) -> str:
+        """
+        Consumes the next character, which must be one of the expected characters.
+
+        Parameters:
+            expected_chars (str): The allowed characters.
+            message (str): The error message if another character is found.
+
+        Returns:
+            str: The consumed character.
+
+        """
+        char = self.__next_char()
+        if not char or char not in expected_chars:
+            raise json.JSONDecodeError(message, self.__buffer, self.__position)
+        self.__position += 1
+        return char
+
+    def __skip_string(self, position: int) -> tuple[int, bool]:
+        """
+        Skips the characters of a string in the buffer.
+
+        Parameters:
+            position (int): A position in the string, not within an escape sequence.
+
+        Returns:
+            tuple: The position after the closing quote and True, or the position to continue at once the next chunk is read and False.
+
+        """
+        quote = self.__buffer.find('"', position)
+        if quote != -1 and self.__buffer[quote - 1] != "\\":
+            return quote + 1, True
+        if quote == -1 and not self.__buffer.endswith("\\"):
+            return len(self.__buffer), False
+        # escaped quotes or an escape sequence at the end of the buffer: the pattern skips the escape sequences
+        end = cast("re.Match[str]", STRING_CONTENT_PATTERN.match(self.__buffer, position)).end()
+        if self.__buffer[end : end + 1] == '"':
+            return end + 1, True
+        return end, False
+
+    def __read_scalar(self) -> None:
+        """
+        Reads more of the file until the buffer contains the end of the number or literal at the current position,
+        so that a number is not decoded from its part in the current chunk.
+        """
+        scanned = 0
+        while not SCALAR_END_PATTERN.search(self.__buffer, self.__position + scanned):
+            scanned = len(self.__buffer) - self.__position
+            if not self.__read_chunk():
+                return
+
+    def __read_value(self) -> None:
+        """
+        Reads more of the file until the buffer contains the end of the array, object or string at the current position.
+        Each character is scanned once and the chunks grow with the value, so an item spanning many chunks is decoded
+        once instead of after every chunk, and the buffer is copied a logarithmic number of times.
+        """
+        depth = 0
+        in_string = False
+        # the scanned part of the value, the value starts at the current position of the buffer
+        scanned = 0
+        while True:
+            position = self.__position + scanned
+            while position < len(self.__buffer):
+                if in_string:
+                    position, closed = self.__skip_string(position)
+                    if not closed:
+                        break
+                    in_string = False
+                    if depth == 0:
+                        return
+                    continue
+                match = STRUCTURE_PATTERN.search(self.__buffer, position)
+                if match is None:
+                    position = len(self.__buffer)
+                    break
+                position = match.end()
+                char = match.group()
+                if char == '"':
+                    in_string = True
+                elif char in "[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return
+            scanned = position - self.__position
+            if not self.__read_chunk(max(READ_CHUNK_SIZE, len(self.__buffer))):
+                # the decoding reports the incomplete value
+                return
+
+    def __decode_item(self) -> Any:
+        """
+        Decodes the next item, reading more of the file until the item is complete.
+
+        Returns:
+            Any: The decoded item.
+
+        """
+        # the buffer contains the whole item (or the rest of the file), so the item is decoded once
+        char = self.__next_char()
+        if char in {"[", "{", '"'}:
+            self.__read_value()
+        elif char:
+            self.__read_scalar()
+        item, self.__position = self.__decoder.raw_decode(self.__buffer, self.__position)
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over the items of the JSON array.
+
+        Returns:
+            Iterator: The decoded items in the order of the array.
+
+        """
+        self.__expect("[", "Expecting '['")
+        if self.__next_char() == "]":
+            self.__position += 1
+        else:
+            while True:
+                yield self.__decode_item()
+                if self.__expect(",]", "Expecting ',' delimiter or ']'") == "]":
+                    break
+
+        if self.__next_char():
+            raise json.JSONDecodeError("Extra data", self.__buffer, self.__position)
+
+
+def read_json_lines(json_file: IO[str]) -> Iterator[Any]:
+    """
+    Reads the items of a JSON Lines file one by one. Empty lines are skipped.
+
+    Parameters:
+        json_file (IO): The file containing one JSON item per line.
+
+    Returns:
+        Iterator: The decoded items in the order of the lines.
+
+    """
+    for line in json_file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_json_items(json_file: IO[str], json_format: JsonFormat) -> Iterator[Any]:
+    """
+    Reads the items of a JSON array or JSON Lines file one by one.
+
+    Parameters:
+        json_file (IO): The file to be read.
+        json_format (JsonFormat): The format of the file.
+
+    Returns:
+        Iterator: The decoded items.
+
+    """
+    if json_format == JsonFormat.JSON_LINES:
+        return read_json_lines(json_file)
+    return iter(JsonArrayReader(json_file))
+
+
+class JsonItemWriter:
+    """
+    A class for writing items one by one as a JSON array or as JSON Lines.
+    A JSON array is written exactly as json.dump writes the list of all items.
+    """
+
+    def __init__(self, json_file: IO[str], json_format: JsonFormat) -> None:
+        """
+        Initializes a JsonItemWriter object.
+
+        Parameters:
+            json_file (IO): The file to write to.
+            json_format (JsonFormat): The format of the file.
+
+        """
+        self.__file = json_file
+        self.__json_format = json_format
+        self.__item_count = 0
+
+    def write(self, item: Any) -> None:
+        """
+        Writes an item.
+
+        Parameters:
+            item (Any): The JSON serializable item.
+
+        """
+        if self.__json_format == JsonFormat.JSON_LINES:
+            json.dump(item, self.__file)
+            self.__file.write("\n")
+        else:
+            self.__file.write(", " if self.__item_count else "[")
+            json.dump(item, self.__file)
+        self.__item_count += 1
+
+    def close(self) -> None:
+        """
+        Completes the written items. The file itself is not closed.
+        """
+        if self.__json_format == JsonFormat.JSON:
+            self.__file.write("]" if self.__item_count else "[]")
+        self.__file.flush()
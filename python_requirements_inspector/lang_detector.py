@@ -7,6 +7,10 @@ from spacy.language import Language
 from spacy_language_detection import LanguageDetector  # type: ignore[import-untyped]
 
 from python_requirements_inspector import constants
+from python_requirements_inspector.type_definitions import AnalyzerOptions
+
+# Number of times the sample of an ambiguous text is doubled, which bounds the detected characters
+MAX_SAMPLE_DOUBLINGS = 3
 
 
 class LangDetector:
@@ -14,14 +18,24 @@ class LangDetector:
     Language Detector class for detecting the language of text using Spacy and langdetect.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, sample_size: int = AnalyzerOptions.language_sample_size, confidence: float = AnalyzerOptions.language_confidence) -> None:
         """
         Initializes the LangDetector class.
 
+        Parameters:
+            sample_size (int): The number of characters of a text the detection starts with.
+            confidence (float): The probability of the detected language at which the detection stops,
+                below it the sample is doubled up to MAX_SAMPLE_DOUBLINGS times.
+
         """
 
-        # For language detection a model must be loaded. Could be possibly work with any model.
-        self.__nlp = spacy.load("en_core_web_md")
+        self.__sample_size = sample_size
+        self.__confidence = confidence
+
+        # The language detector only reads the text of the Doc, so a blank multi-language pipeline
+        # is sufficient. The sentencizer is needed because the detector iterates over the sentences.
+        self.__nlp = spacy.blank(constants.MULTI_LANGUAGE)
+        self.__nlp.add_pipe("sentencizer")
 
         # Define a factory function for the language detector
         Language.factory("language_detector", func=self.__get_lang_detector)
@@ -42,9 +56,29 @@ class LangDetector:
         """
         return LanguageDetector(seed=42)
 
+    @staticmethod
+    def __get_sample(text: str, size: int) -> str:
+        """
+        Returns the start of a text with at most the given number of characters, without a cut word at its end.
+
+        Parameters:
+            text (str): The text.
+            size (int): The maximum number of characters.
+
+        Returns:
+            str: The sample, the whole text if it is not longer than size.
+
+        """
+        if len(text) <= size:
+            return text
+        words = text[:size].rsplit(maxsplit=1)
+        return words[0] if len(words) > 1 else text[:size]
+
     def detect_language(self, text: str | None) -> str:
         """
-        Detects the language of the given text.
+        Detects the language of the given text. The detection starts with a sample of the text and uses more of the text
+        only while the probability of the detected language is below the confidence, so long texts cost no more than
+        a bounded sample.
 
         Parameters:
             text (str): The text to detect the language of.
@@ -56,11 +90,13 @@ class LangDetector:
         if not text:
             return ""
 
-        # Process the text with the Spacy language model
-        doc = self.__nlp(text)
-
-        # Extract the language information from the document
-        language_object = doc._.language
+        sample_size = self.__sample_size
+        for _ in range(MAX_SAMPLE_DOUBLINGS + 1):
+            # Process the sample with the Spacy language model and extract the language information
+            language_object = self.__nlp(self.__get_sample(text, sample_size))._.language
+            if language_object["score"] >= self.__confidence or sample_size >= len(text):
+                break
+            sample_size *= 2
         language = language_object["language"]
 
         return language if language in constants.SUPPORTED_LANGUAGES else ""
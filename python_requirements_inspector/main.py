@@ -3,12 +3,29 @@ Application entry point
 """
 
 import argparse
-import json
 import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import nullcontext
+from dataclasses import replace
+from itertools import chain, islice
 from pathlib import Path
 
+from python_requirements_inspector import constants
+from python_requirements_inspector.arguments import add_language_detection_arguments, non_negative_int, positive_int
+from python_requirements_inspector.daemon import analyze_batches_in_daemon, start_analysis_in_daemon
+from python_requirements_inspector.fingerprint import get_ruleset_fingerprint
+from python_requirements_inspector.incremental import PreviousResults, analyze_incrementally
+from python_requirements_inspector.json_stream import JsonFormat, read_json_items
+from python_requirements_inspector.metrics import Metrics
+from python_requirements_inspector.process_pool import analyze_batches_in_processes
+from python_requirements_inspector.result_cache import ResultCache
+from python_requirements_inspector.result_writer import OutputFormat, ResultWriter
+from python_requirements_inspector.type_definitions import AnalyzerOptions, FindingType, RequirementsInspectorResponseItem, WorkItem
 from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
 
+# Names of the checks on the command line
+CHECK_NAMES = {check.name.lower(): check for check in FindingType}
+
 
 class PathOutsideWorkingDirectoryError(ValueError):
     """Raised when an input path resolves outside the current working directory."""
@@ -22,34 +39,146 @@ def validate_path_in_cwd(path: Path) -> Path:
     return resolved
 
 
-def main(json_path: str) -> str:
+def check_list(value: str) -> tuple[FindingType, ...]:
+    checks = []
+    for name in value.split(","):
+        check = CHECK_NAMES.get(name.strip().lower())
+        if check is None:
+            raise argparse.ArgumentTypeError(f"unknown check {name.strip()!r}, choose from {', '.join(CHECK_NAMES)}")
+        checks.append(check)
+    return tuple(checks)
+
+
+def analyze(
+    workitems: Iterable[WorkItem],
+    options: AnalyzerOptions,
+    batch_size: int,
+    workers: int,
+    previous_results: PreviousResults | None,
+    use_daemon: bool = False,
+    metrics: Metrics | None = None,
+) -> Iterator[RequirementsInspectorResponseItem]:
+    """
+    Analyzes workitems in batches: in a running daemon if requested, otherwise in this process or in worker processes
+    if more than one worker is requested.
+
+    Parameters:
+        workitems (Iterable): The workitems to be analyzed.
+        options (AnalyzerOptions): The options of the analysis.
+        batch_size (int): The number of workitems analyzed together.
+        workers (int): The number of worker processes analyzing the workitems.
+        previous_results (PreviousResults): The results of a previous run, only changed workitems are analyzed. None to analyze all workitems.
+        use_daemon (bool): Forward the workitems to the daemon if one is running (see daemon) and a single worker is requested.
+        metrics (Metrics): The metrics the stages of the analysis are recorded in, None for no metrics.
+            The stages are only recorded in this process, so the workitems are not forwarded to the daemon.
+    Returns:
+        Iterator: The results in the order of the workitems.
+    """
+
+    # the daemon analyzes the workitems of a client one batch at a time, so more workers are not faster in the daemon
+    daemon_connection = start_analysis_in_daemon(options, batch_size) if use_daemon and metrics is None and workers == 1 else None
+
+    def analyze_batches(batches: Iterable[list[WorkItem]]) -> Iterator[list[RequirementsInspectorResponseItem]]:
+        if daemon_connection is not None:
+            return analyze_batches_in_daemon(daemon_connection, batches)
+        if workers > 1:
+            return analyze_batches_in_processes(batches, workers, options, batch_size)
+        return analyze_batches_in_this_process(batches)
+
+    def analyze_batches_in_this_process(batches: Iterable[list[WorkItem]]) -> Iterator[list[RequirementsInspectorResponseItem]]:
+        with WorkitemAnalyzer(options, metrics) as analyzer:
+            yield from analyzer.analyze_batches(batches, batch_size)
+
+    if previous_results is not None:
+        return analyze_incrementally(workitems, previous_results, get_ruleset_fingerprint(options), analyze_batches, batch_size)
+
+    workitem_iterator = iter(workitems)
+    return chain.from_iterable(analyze_batches(iter(lambda: list(islice(workitem_iterator, batch_size)), [])))
+
+
+def main(  # noqa: PLR0913, PLR0917 - the CLI passes all its options
+    json_path: str,
+    options: AnalyzerOptions | None = None,
+    batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    workers: int = 1,
+    input_format: JsonFormat = JsonFormat.JSON,
+    output_format: JsonFormat | OutputFormat = OutputFormat.JSON,
+    cache_export: str | None = None,
+    previous: str | None = None,
+    use_daemon: bool = False,
+    metrics: Metrics | None = None,
+    sparse: bool = False,
+    descriptions: bool = True,
+) -> str:
     """
     Main function for analyzing workitem data from a JSON file.
     Writes all findings to another jsonfile and prints the path.
+    Workitems are read one by one and each result is written as soon as it is available.
 
     Parameters:
         json_path (str): Path to the JSON file containing workitem data.
+        options (AnalyzerOptions): The options of the analysis, None for the default options.
+        batch_size (int): The number of workitems analyzed together.
+        workers (int): The number of worker processes analyzing the workitems.
+        input_format (JsonFormat): The format of the input file (JSON array or JSON Lines).
+        output_format (OutputFormat): The format of the output file (JSON array, JSON Lines, CSV or numpy arrays).
+        cache_export (str): Path to write a copy of the result cache to after the analysis, None for no copy.
+        previous (str): Path to the output file of a previous run (in the output format, JSON array or JSON Lines only),
+            only new and changed workitems are analyzed. None to analyze all workitems. Requires output of all results with descriptions,
+            and implies AnalyzerOptions.content_hash, which the previous run needs to have been analyzed with.
+        use_daemon (bool): Forward the workitems to the daemon if one is running, instead of loading the language models.
+        metrics (Metrics): The metrics the stages of the run are recorded in (see WorkitemAnalyzer.get_metrics), None for
+            no metrics. Reading the input and writing the output are recorded as the stages input and output.
+        sparse (bool): Leave the workitems without findings out of the output.
+        descriptions (bool): Write the smell descriptions, False to leave them out of the output.
     Returns:
         str: Path to the generated output JSON file.
     """
 
-    # Read input data from the provided JSON file
+    if metrics is not None and workers > 1:
+        raise ValueError("Metrics are only recorded with a single worker")
+    output_format = OutputFormat(output_format.value)
+    if previous and output_format not in {OutputFormat.JSON, OutputFormat.JSON_LINES}:
+        raise ValueError("Previous results are only read from JSON output")
+    if previous and (sparse or not descriptions):
+        # the output is the previous output of the next run, which needs all results with their descriptions
+        raise ValueError("Previous results are only read from output with all results and descriptions")
     validated_json_path = validate_path_in_cwd(Path(json_path))
-    with validated_json_path.open(encoding="utf-8") as json_file:
-        input_data = json.load(json_file)
+    validated_previous_path = validate_path_in_cwd(Path(previous)) if previous else None
+    options = options or AnalyzerOptions()
+    if previous:
+        # the output is the previous output of the next run, which matches the results by their content hashes
+        options = replace(options, content_hash=True)
+    with (
+        validated_json_path.open(encoding="utf-8") as json_file,
+        validated_previous_path.open(encoding="utf-8") if validated_previous_path else nullcontext() as previous_file,
+        tempfile.NamedTemporaryFile(prefix="output_", suffix=f".{output_format.value}", delete=False, mode="w+b") as output_file,
+    ):
+        try:
+            # Read input data from the provided JSON file
+            input_data = read_json_items(json_file, input_format)
+            if metrics is not None:
+                input_data = metrics.time_iterator("input", input_data)
 
-    workitem_analyzer = WorkitemAnalyzer()
+            # Process all (or only the changed) workitems in batches
+            previous_results = PreviousResults(read_json_items(previous_file, JsonFormat(output_format.value))) if previous_file else None
+            results = analyze(input_data, options, batch_size, workers, previous_results, use_daemon, metrics)
 
-    # Process all workitems
-    for workitem in input_data:
-        workitem_analyzer.analyze_workitem(workitem)
+            # Write each result to the output file
+            writer = ResultWriter(output_file, output_format, sparse, descriptions, options.content_hash)
+            for result in results:
+                with metrics.time("output") if metrics is not None else nullcontext():
+                    writer.write(result)
+            writer.close()
+        except BaseException:
+            # Do not leave an incomplete output file behind
+            output_file.close()
+            Path(output_file.name).unlink()
+            raise
 
-    output_data = workitem_analyzer.get_collected_data()
-
-    # Write data back to stdout in csv format.
-    with tempfile.NamedTemporaryFile(prefix="output_", suffix=".json", delete=False, mode="w+", encoding="utf-8") as output_file:
-        json.dump(output_data, output_file)
-        output_file.flush()
+    if cache_export and options.result_cache:
+        with ResultCache(options.result_cache, get_ruleset_fingerprint(options)) as result_cache:
+            result_cache.export(cache_export)
 
     return output_file.name
 
@@ -58,13 +187,141 @@ def run() -> None:
     # Set up the command-line argument parser
     parser = argparse.ArgumentParser(description="Analyses workitem data provided by a json file.")
     parser.add_argument("jsonfile", type=str, help="path to the json file")
+    parser.add_argument(
+        "--single-parse",
+        action="store_true",
+        help="process each text field with the language model at once and use its sentence boundaries",
+    )
+    parser.add_argument(
+        "--checks",
+        type=check_list,
+        default=None,
+        help=f"comma separated checks to perform: {', '.join(CHECK_NAMES)} (default: all)",
+    )
+    parser.add_argument(
+        "--sentence-cache-size",
+        type=non_negative_int,
+        default=AnalyzerOptions.sentence_cache_size,
+        help=f"number of sentences whose findings are cached for repeated sentences, 0 to disable (default: {AnalyzerOptions.sentence_cache_size})",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        help="path to a SQLite database caching the results of unchanged workitems across runs",
+    )
+    parser.add_argument(
+        "--cache-export",
+        type=str,
+        default=None,
+        help="path to write a copy of the cache to after the analysis, e.g. to start another machine warm",
+    )
+    parser.add_argument(
+        "--previous",
+        type=str,
+        default=None,
+        help="path to the output file of a previous run with --content-hash or --previous, only new and changed workitems are analyzed",
+    )
+    parser.add_argument(
+        "--content-hash",
+        action="store_true",
+        help="add the hash identifying the result of each workitem (contentHash), so the output can be read with --previous",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="analyze in this process even if a daemon (inspect-requirements-daemon) is running",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=constants.DEFAULT_BATCH_SIZE,
+        help=f"number of workitems analyzed together (default: {constants.DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=1,
+        help="number of worker processes analyzing the workitems, more than one implies --no-daemon (default: 1)",
+    )
+    parser.add_argument(
+        "--input-format",
+        choices=[json_format.value for json_format in JsonFormat],
+        default=JsonFormat.JSON.value,
+        help="format of the input file: a JSON array or JSON Lines (default: json)",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=[output_format.value for output_format in OutputFormat],
+        default=OutputFormat.JSON.value,
+        help="format of the output file: a JSON array, JSON Lines, CSV or numpy arrays of the finding counts (default: json)",
+    )
+    parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="leave the workitems without findings out of the output",
+    )
+    parser.add_argument(
+        "--no-descriptions",
+        action="store_true",
+        help="leave the smell descriptions out of the output",
+    )
+    parser.add_argument(
+        "--metrics",
+        type=str,
+        default=None,
+        help="path to write the call counts, durations and latency histograms of the analysis stages to (implies --no-daemon)",
+    )
+    parser.add_argument(
+        "--metrics-format",
+        choices=["json", "prometheus"],
+        default="json",
+        help="format of the metrics: JSON or the Prometheus text format (default: json)",
+    )
+
+    add_language_detection_arguments(parser)
 
     # Parse the command-line arguments
     args = parser.parse_args()
+    if args.cache_export and not args.cache:
+        parser.error("--cache-export requires --cache")
+    if args.metrics and args.workers > 1:
+        parser.error("--metrics requires a single worker")
+    if args.previous and args.output_format not in {OutputFormat.JSON.value, OutputFormat.JSON_LINES.value}:
+        parser.error("--previous requires a JSON output format")
+    if args.previous and (args.sparse or args.no_descriptions):
+        parser.error("--previous cannot be combined with --sparse or --no-descriptions")
     json_file_path = args.jsonfile
 
     try:
-        print(main(json_file_path))
+        options = AnalyzerOptions(
+            single_parse=args.single_parse,
+            checks=args.checks,
+            sentence_cache_size=args.sentence_cache_size,
+            result_cache=args.cache,
+            language_sample_size=args.language_sample_size,
+            language_confidence=args.language_confidence,
+            content_hash=args.content_hash,
+        )
+        metrics = Metrics() if args.metrics else None
+        print(
+            main(
+                json_file_path,
+                options,
+                args.batch_size,
+                args.workers,
+                JsonFormat(args.input_format),
+                OutputFormat(args.output_format),
+                args.cache_export,
+                args.previous,
+                not args.no_daemon,
+                metrics,
+                args.sparse,
+                not args.no_descriptions,
+            )
+        )
+        if metrics is not None:
+            Path(args.metrics).write_text(metrics.to_prometheus() if args.metrics_format == "prometheus" else metrics.to_json(), encoding="utf-8")
     except PathOutsideWorkingDirectoryError as error:
         parser.error(str(error))
 
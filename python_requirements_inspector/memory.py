@@ -0,0 +1,25 @@
+"""
+Implementation of the memory measurement of the process
+"""
+
+import os
+from pathlib import Path
+
+# Growth of the resident memory in MB after a reload of the language models before the next reload, so that memory
+# the allocator does not return to the system does not reload the models after every batch
+RSS_RELOAD_MARGIN_MB = 64
+
+
+def get_rss_mb() -> float | None:
+    """
+    Returns the current resident memory of the process.
+
+    Returns:
+        float: The resident memory in MB or None if it cannot be measured (only Linux is supported).
+
+    """
+    try:
+        resident_pages = int(Path("/proc/self/statm").read_text(encoding="ascii").split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
@@ -0,0 +1,223 @@
+"""
+Implementation of the analysis metrics
+"""
+
+import bisect
+import json
+import math
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, math.inf)
+
+# Prefix of the Prometheus metric names
+PROMETHEUS_PREFIX = "requirements_inspector"
+
+T = TypeVar("T")
+
+
+@dataclass
+class StageStats:
+    """
+    The calls of a stage: their number, their total time and their latency histogram (calls per bucket of LATENCY_BUCKETS).
+    """
+
+    count: int = 0
+    total_seconds: float = 0.0
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+
+class Metrics:
+    """
+    A thread-safe collection of the call counts, total times and latency histograms per stage
+    of the analysis, and of counters of the processed items.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty Metrics object.
+        """
+        self.__lock = threading.Lock()
+        self.__stages: dict[str, StageStats] = {}
+        self.__counters: dict[str, int] = {}
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        Records a call of a stage.
+
+        Parameters:
+            stage (str): The name of the stage.
+            seconds (float): The duration of the call.
+
+        """
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self.__lock:
+            stats = self.__stages.get(stage)
+            if stats is None:
+                stats = self.__stages[stage] = StageStats()
+            stats.count += 1
+            stats.total_seconds += seconds
+            stats.bucket_counts[bucket] += 1
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """
+        Records the duration of the block as a call of a stage.
+
+        Parameters:
+            stage (str): The name of the stage.
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def time_iterator(self, stage: str, iterable: Iterable[T]) -> Iterator[T]:
+        """
+        Records the time spent producing the items of a lazy iterable (e.g. the docs of nlp.pipe) as one call of a stage.
+        The call is recorded when the iterable is exhausted or the iterator is closed.
+
+        Parameters:
+            stage (str): The name of the stage.
+            iterable (Iterable): The iterable.
+
+        Returns:
+            Iterator: The items of the iterable.
+
+        """
+        iterator = iter(iterable)
+        seconds = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    seconds += time.perf_counter() - start
+                yield item
+        finally:
+            self.record(stage, seconds)
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """
+        Increments a counter.
+
+        Parameters:
+            counter (str): The name of the counter, e.g. workitems.
+            amount (int): The increment.
+
+        """
+        with self.__lock:
+            self.__counters[counter] = self.__counters.get(counter, 0) + amount
+
+    def get_stage_stats(self, stage: str) -> StageStats | None:
+        """
+        Returns a copy of the statistics of a stage.
+
+        Parameters:
+            stage (str): The name of the stage.
+
+        Returns:
+            StageStats: The statistics or None if the stage was not called.
+
+        """
+        with self.__lock:
+            stats = self.__stages.get(stage)
+            return StageStats(stats.count, stats.total_seconds, stats.bucket_counts.copy()) if stats is not None else None
+
+    def get_counter(self, counter: str) -> int:
+        """
+        Returns the value of a counter.
+
+        Parameters:
+            counter (str): The name of the counter.
+
+        Returns:
+            int: The value, 0 if the counter was never incremented.
+
+        """
+        with self.__lock:
+            return self.__counters.get(counter, 0)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the metrics as JSON serializable dictionary. The histogram buckets are cumulative like in Prometheus.
+
+        Returns:
+            dict: The stages with count, total_seconds and buckets (upper bound to calls), and the counters.
+
+        """
+        with self.__lock:
+            stages = {}
+            for stage, stats in sorted(self.__stages.items()):
+                cumulative_counts = [sum(stats.bucket_counts[: index + 1]) for index in range(len(LATENCY_BUCKETS))]
+                stages[stage] = {
+                    "count": stats.count,
+                    "total_seconds": stats.total_seconds,
+                    "buckets": {_format_bound(bound): count for bound, count in zip(LATENCY_BUCKETS, cumulative_counts, strict=True)},
+                }
+            return {"stages": stages, "counters": dict(sorted(self.__counters.items()))}
+
+    def to_json(self) -> str:
+        """
+        Returns the metrics as JSON (see to_dict).
+
+        Returns:
+            str: The JSON text.
+
+        """
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Returns the metrics in the Prometheus text format: a histogram of the stage durations and a counter per counter.
+
+        Returns:
+            str: The Prometheus text.
+
+        """
+        metrics = self.to_dict()
+        lines = [
+            f"# HELP {PROMETHEUS_PREFIX}_stage_seconds Duration of the calls of an analysis stage.",
+            f"# TYPE {PROMETHEUS_PREFIX}_stage_seconds histogram",
+        ]
+        for stage, stats in metrics["stages"].items():
+            lines.extend(f'{PROMETHEUS_PREFIX}_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}' for bound, count in stats["buckets"].items())
+            lines.append(f'{PROMETHEUS_PREFIX}_stage_seconds_sum{{stage="{stage}"}} {stats["total_seconds"]}')
+            lines.append(f'{PROMETHEUS_PREFIX}_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+        for counter, value in metrics["counters"].items():
+            lines.append(f"# HELP {PROMETHEUS_PREFIX}_{counter}_total Number of {counter} processed.")
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{counter}_total counter")
+            lines.append(f"{PROMETHEUS_PREFIX}_{counter}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """
+        Removes all recorded calls and counters.
+        """
+        with self.__lock:
+            self.__stages.clear()
+            self.__counters.clear()
+
+
+def _format_bound(bound: float) -> str:
+    """
+    Formats an upper bound of a histogram bucket like Prometheus.
+
+    Parameters:
+        bound (float): The upper bound in seconds.
+
+    Returns:
+        str: The formatted bound, +Inf for infinity.
+
+    """
+    return "+Inf" if math.isinf(bound) else repr(bound)
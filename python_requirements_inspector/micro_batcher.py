@@ -0,0 +1,135 @@
+"""
+Implementation of the micro-batching of concurrent analysis requests
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+from python_requirements_inspector import constants
+from python_requirements_inspector.type_definitions import RequirementsInspectorResponseItem, WorkItem
+from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
+
+# Default maximum number of workitems analyzed together and maximum time a request waits for other requests
+DEFAULT_MAX_BATCH_SIZE = constants.DEFAULT_BATCH_SIZE
+DEFAULT_MAX_WAIT = 0.01
+
+
+@dataclass
+class _AnalysisRequest:
+    workitems: list[WorkItem]
+    result: Future[list[RequirementsInspectorResponseItem | None]] = field(default_factory=Future)
+
+
+class MicroBatcher:
+    """
+    A class merging the workitems of concurrent requests into batches, analyzed one after the other by a single thread.
+    A batch is analyzed when the next request would exceed the maximum batch size or when its first request waited the
+    maximum wait time. The requests are not split, so a request larger than the maximum batch size is analyzed alone.
+    """
+
+    def __init__(self, analyzer: WorkitemAnalyzer, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait: float = DEFAULT_MAX_WAIT) -> None:
+        """
+        Initializes a MicroBatcher object and starts its thread.
+
+        Parameters:
+            analyzer (WorkitemAnalyzer): The analyzer, only used by the thread of the batcher.
+            max_batch_size (int): The maximum number of workitems analyzed together. A larger request is analyzed alone.
+            max_wait (float): The maximum time in seconds a request waits for other requests.
+
+        """
+        self.__analyzer = analyzer
+        self.__max_batch_size = max_batch_size
+        self.__max_wait = max_wait
+        self.__requests: queue.Queue[_AnalysisRequest | None] = queue.Queue()
+        self.__thread = threading.Thread(target=self.__run, name="micro-batcher", daemon=True)
+        self.__thread.start()
+
+    def submit(self, workitems: list[WorkItem]) -> Future[list[RequirementsInspectorResponseItem | None]]:
+        """
+        Queues workitems for the analysis. Cancelling the future before the analysis starts removes the workitems from the queue.
+
+        Parameters:
+            workitems (list): The workitems to be analyzed.
+
+        Returns:
+            Future: Per workitem, the data frame of the analyzed workitem or None if its language is not supported.
+
+        """
+        request = _AnalysisRequest(workitems)
+        self.__requests.put(request)
+        return request.result
+
+    def close(self) -> None:
+        """
+        Analyzes the queued requests and stops the thread.
+        """
+        self.__requests.put(None)
+        self.__thread.join()
+
+    def __collect_batch(self, first_request: _AnalysisRequest) -> tuple[list[_AnalysisRequest], _AnalysisRequest | None, bool]:
+        """
+        Collects the requests arriving until the batch is full or the maximum wait time is over.
+
+        Parameters:
+            first_request (_AnalysisRequest): The first request of the batch.
+
+        Returns:
+            tuple: The requests of the batch, the request exceeding the maximum batch size (the first request of the next batch)
+                or None, and whether the batcher is closed.
+
+        """
+        batch = [first_request]
+        workitem_count = len(first_request.workitems)
+        deadline = time.monotonic() + self.__max_wait
+        while workitem_count < self.__max_batch_size:
+            try:
+                request = self.__requests.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if request is None:
+                return batch, None, True
+            if workitem_count + len(request.workitems) > self.__max_batch_size:
+                return batch, request, False
+            batch.append(request)
+            workitem_count += len(request.workitems)
+        return batch, None, False
+
+    def __analyze(self, batch: list[_AnalysisRequest]) -> None:
+        """
+        Analyzes the workitems of all requests of a batch at once and sets the results of the requests.
+        If the batch fails, each request is analyzed alone, so that one invalid request does not fail the others.
+
+        Parameters:
+            batch (list): The requests of the batch.
+
+        """
+        try:
+            results = self.__analyzer.analyze_batch([workitem for request in batch for workitem in request.workitems], self.__max_batch_size)
+        except Exception as error:  # noqa: BLE001 - the error is passed to the waiting requests
+            if len(batch) == 1:
+                batch[0].result.set_exception(error)
+            else:
+                for request in batch:
+                    self.__analyze([request])
+            return
+
+        start = 0
+        for request in batch:
+            request.result.set_result(results[start : start + len(request.workitems)])
+            start += len(request.workitems)
+
+    def __run(self) -> None:
+        closed = False
+        next_request: _AnalysisRequest | None = None
+        while next_request is not None or not closed:
+            first_request = next_request if next_request is not None else self.__requests.get()
+            if first_request is None:
+                break
+            batch, next_request, closed = self.__collect_batch(first_request)
+            # requests cancelled while waiting are not analyzed
+            batch = [request for request in batch if request.result.set_running_or_notify_cancel()]
+            if batch:
+                self.__analyze(batch)
@@ -0,0 +1,127 @@
+"""
+Implementation of the process-wide language model registry
+"""
+
+import gc
+import threading
+from collections.abc import Iterable
+
+import spacy
+from spacy.language import Language
+
+from python_requirements_inspector.memory import get_rss_mb
+
+# Key of a loaded language model: the model name and the excluded pipeline components
+ModelKey = tuple[str, tuple[str, ...]]
+
+
+class ModelRegistry:
+    """
+    A thread-safe registry sharing each loaded Spacy language model within the process.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a ModelRegistry object.
+        """
+        self.__lock = threading.Lock()
+        self.__key_locks: dict[ModelKey, threading.Lock] = {}
+        self.__models: dict[ModelKey, Language] = {}
+        # The vocabulary sizes after loading, the number of reloads and the memory after the last reload bound the memory
+        # of the process, once per shared model (see reload)
+        self.__loaded_string_counts: dict[ModelKey, int] = {}
+        self.__generation = 0
+        self.__rss_after_reload = 0.0
+
+    def load(self, name: str, exclude: Iterable[str] = ()) -> Language:
+        """
+        Returns the language model with the given configuration, loading it on first use.
+        Different models can be loaded concurrently, the same model is loaded only once.
+
+        Parameters:
+            name (str): The name (or path) of the Spacy language model.
+            exclude (Iterable): The names of the pipeline components not to load.
+
+        Returns:
+            spacy.language.Language: The shared language model.
+
+        """
+        key = (name, tuple(sorted(set(exclude))))
+        with self.__lock:
+            key_lock = self.__key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            nlp = self.__models.get(key)
+            if nlp is None:
+                nlp = spacy.load(name, exclude=list(key[1]))
+                self.__loaded_string_counts[key] = len(nlp.vocab.strings)
+                self.__models[key] = nlp
+            return nlp
+
+    def clear(self) -> None:
+        """
+        Removes all language models from the registry. Users holding a model keep their instance.
+        """
+        with self.__lock:
+            self.__key_locks.clear()
+            self.__models.clear()
+            self.__loaded_string_counts.clear()
+
+    def get_new_string_count(self) -> int:
+        """
+        Returns the number of strings added to the vocabularies of the loaded models since they were loaded.
+        Every new token text (e.g. ids, numbers and typos) adds a string, whichever user of the shared model processed it.
+
+        Returns:
+            int: The number of new strings.
+
+        """
+        with self.__lock:
+            return sum(len(nlp.vocab.strings) - self.__loaded_string_counts[key] for key, nlp in self.__models.items())
+
+    def get_generation(self) -> int:
+        """
+        Returns the number of reloads, so that users can detect that the models they hold were dropped (see reload).
+
+        Returns:
+            int: The generation of the loaded models.
+
+        """
+        return self.__generation
+
+    def get_rss_after_reload(self) -> float:
+        """
+        Returns the resident memory of the process after the last reload.
+
+        Returns:
+            float: The resident memory in MB, 0 before the first reload or if it cannot be measured.
+
+        """
+        return self.__rss_after_reload
+
+    def reload(self, generation: int) -> bool:
+        """
+        Removes all language models from the registry, so that the next loads read the models again with fresh
+        vocabularies, and measures the memory afterwards. Users holding a model keep their instance until they
+        release it (see get_generation). Users noticing the same limit concurrently reload the models only once.
+
+        Parameters:
+            generation (int): The generation of the models of the user (see get_generation).
+
+        Returns:
+            bool: True if the models were reloaded, False if they were already reloaded since the given generation.
+
+        """
+        with self.__lock:
+            if generation != self.__generation:
+                return False
+            self.__models.clear()
+            self.__loaded_string_counts.clear()
+            self.__generation += 1
+        gc.collect()
+        self.__rss_after_reload = get_rss_mb() or 0.0
+        return True
+
+
+# The registry shared by all components of the process
+model_registry = ModelRegistry()
@@ -0,0 +1,148 @@
+"""
+Implementation of the matcher pattern cache
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zlib
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+from spacy.tokens import DocBin
+from spacy.tokens.doc import Doc
+from spacy.util import get_package_version
+from spacy.vocab import Vocab
+
+from python_requirements_inspector import constants
+
+# Environment variable overriding the directory of the pattern cache, an empty value keeps the patterns in memory only
+CACHE_DIRECTORY_VARIABLE = "REQUIREMENTS_INSPECTOR_CACHE_DIR"
+
+# Version of the creation of the patterns (e.g. TextProcessor.get_lemma_patterns and lemmatize_doc), to be increased when
+# it changes, as the version of the package does not change between its releases
+PATTERN_FORMAT_VERSION = 1
+
+
+def get_default_directory() -> Path | None:
+    """
+    Returns the directory of the pattern cache: the directory of the environment variable
+    or the python-requirements-inspector directory in the user cache directory.
+
+    Returns:
+        Path: The directory or None if the patterns are kept in memory only.
+
+    """
+    directory = os.environ.get(CACHE_DIRECTORY_VARIABLE)
+    if directory is not None:
+        return Path(directory) if directory else None
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "python-requirements-inspector"
+
+
+class PatternCache:
+    """
+    A thread-safe cache of matcher patterns, kept in memory and serialized as DocBin files,
+    so that the patterns are created with the language model only once. The serialized patterns are keyed by the
+    version of the package and the pattern format besides the key of the patterns.
+    """
+
+    def __init__(self, directory: Path | None = None) -> None:
+        """
+        Initializes a PatternCache object.
+
+        Parameters:
+            directory (Path): The directory of the serialized patterns, None to keep the patterns in memory only.
+
+        """
+        self.__directory = directory
+        self.__lock = threading.Lock()
+        self.__patterns: dict[str, tuple[Vocab, list[Doc]]] = {}
+
+    def load(self, key: Any, vocab: Vocab, create_patterns: Callable[[], list[Doc]]) -> list[Doc]:
+        """
+        Returns the cached patterns of a key, creating and caching them if they are not cached.
+
+        Parameters:
+            key (Any): A JSON serializable value identifying the patterns, e.g. the model version and the word list.
+            vocab (Vocab): The vocabulary of the language model the patterns are used with.
+            create_patterns (Callable): Creates the patterns.
+
+        Returns:
+            list: The pattern Docs.
+
+        """
+        versioned_key = [PATTERN_FORMAT_VERSION, get_package_version(constants.PACKAGE_NAME), key]
+        key_hash = hashlib.sha256(json.dumps(versioned_key, ensure_ascii=False).encode("utf-8")).hexdigest()
+        with self.__lock:
+            # patterns in memory are only shared by users of the same vocabulary
+            patterns_vocab, patterns = self.__patterns.get(key_hash, (None, None))
+            if patterns is None or patterns_vocab is not vocab:
+                patterns = self.__read(key_hash, vocab)
+            if patterns is None:
+                patterns = create_patterns()
+                self.__write(key_hash, patterns)
+            self.__patterns[key_hash] = (vocab, patterns)
+            return patterns
+
+    def __read(self, key_hash: str, vocab: Vocab) -> list[Doc] | None:
+        """
+        Reads serialized patterns.
+
+        Parameters:
+            key_hash (str): The hash of the key of the patterns.
+            vocab (Vocab): The vocabulary of the language model.
+
+        Returns:
+            list: The pattern Docs or None if the patterns are not serialized or not readable.
+
+        """
+        if self.__directory is None:
+            return None
+        try:
+            doc_bin = DocBin().from_bytes((self.__directory / f"{key_hash}.spacy").read_bytes())
+        except (OSError, ValueError, zlib.error):
+            return None
+        return list(doc_bin.get_docs(vocab))
+
+    def __write(self, key_hash: str, patterns: list[Doc]) -> None:
+        """
+        Serializes patterns. A cache directory that cannot be written is ignored.
+
+        Parameters:
+            key_hash (str): The hash of the key of the patterns.
+            patterns (list): The pattern Docs.
+
+        """
+        if self.__directory is None:
+            return
+        temp_path: Path | None = None
+        try:
+            self.__directory.mkdir(parents=True, exist_ok=True)
+            # other processes only ever see a complete file
+            with tempfile.NamedTemporaryFile(dir=self.__directory, suffix=".tmp", delete=False) as temp_file:
+                temp_path = Path(temp_file.name)
+                temp_file.write(DocBin(attrs=["ORTH"], docs=patterns).to_bytes())
+            temp_path.replace(self.__directory / f"{key_hash}.spacy")
+            temp_path = None
+        except OSError:
+            return
+        finally:
+            # an incomplete file is not left behind
+            if temp_path is not None:
+                with suppress(OSError):
+                    temp_path.unlink()
+
+    def clear(self) -> None:
+        """
+        Removes all patterns from memory. Serialized patterns are kept.
+        """
+        with self.__lock:
+            self.__patterns.clear()
+
+
+# The pattern cache shared by all components of the process
+pattern_cache = PatternCache(get_default_directory())
@@ -0,0 +1,150 @@
+"""
+Implementation of the multi-process workitem analysis
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import chain, islice
+from multiprocessing.pool import Pool
+from typing import TYPE_CHECKING
+
+from python_requirements_inspector.type_definitions import AnalyzerOptions, RequirementsInspectorResponseItem, WorkItem
+from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import AsyncResult
+
+# Environment variables limiting the threads of the numerical libraries used by the language models
+THREAD_LIMIT_VARIABLES = [
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+]
+
+# Number of batches queued per worker process, bounds the number of workitems held in memory
+BATCHES_PER_WORKER = 2
+
+# The analyzer of a worker process, initialized once per process
+_worker_analyzer: WorkitemAnalyzer | None = None
+_worker_batch_size: int = 1
+
+
+def _init_worker(options: AnalyzerOptions, batch_size: int) -> None:
+    """
+    Initializes a worker process by loading the language models once.
+
+    Parameters:
+        options (AnalyzerOptions): The options of the analysis.
+        batch_size (int): The number of texts per batch of the language model.
+
+    """
+    global _worker_analyzer, _worker_batch_size  # noqa: PLW0603
+    _worker_analyzer = WorkitemAnalyzer(options)
+    _worker_batch_size = batch_size
+
+
+def analyze_batch_in_worker(workitems: list[WorkItem]) -> list[RequirementsInspectorResponseItem | None]:
+    """
+    Analyzes a batch of workitems in a worker process.
+
+    Parameters:
+        workitems (list): The workitems to be analyzed.
+
+    Returns:
+        list: Per workitem, the data frame of the analyzed workitem or None if its language is not supported.
+
+    """
+    if _worker_analyzer is None:
+        raise RuntimeError("Worker process is not initialized")
+    return _worker_analyzer.analyze_batch(workitems, _worker_batch_size)
+
+
+@contextmanager
+def _limited_threads(threads: int) -> Iterator[None]:
+    """
+    Limits the threads of the numerical libraries for processes started within the context.
+    Limits already set in the environment are kept.
+
+    Parameters:
+        threads (int): The number of threads per process.
+
+    """
+    added_variables = [variable for variable in THREAD_LIMIT_VARIABLES if variable not in os.environ]
+    for variable in added_variables:
+        os.environ[variable] = str(threads)
+    try:
+        yield
+    finally:
+        for variable in added_variables:
+            del os.environ[variable]
+
+
+def create_pool(workers: int, options: AnalyzerOptions, batch_size: int) -> Pool:
+    """
+    Creates a pool of worker processes analyzing batches of workitems with analyze_batch_in_worker.
+
+    Parameters:
+        workers (int): The number of worker processes.
+        options (AnalyzerOptions): The options of the analysis.
+        batch_size (int): The number of texts per batch of the language model.
+
+    Returns:
+        multiprocessing.pool.Pool: The pool, to be terminated by the caller.
+
+    """
+    # Spawned workers start without the state of this process and load the models once in the initializer
+    context = multiprocessing.get_context("spawn")
+    with _limited_threads(1):
+        return context.Pool(workers, initializer=_init_worker, initargs=(options, batch_size))
+
+
+def analyze_workitems_in_processes(workitems: Iterable[WorkItem], workers: int, options: AnalyzerOptions, batch_size: int) -> Iterator[RequirementsInspectorResponseItem]:
+    """
+    Analyzes workitems in batches spread over a pool of worker processes.
+    The results are returned in the order of the workitems, equal to WorkitemAnalyzer.analyze_workitems.
+
+    Parameters:
+        workitems (Iterable): The workitems to be analyzed.
+        workers (int): The number of worker processes.
+        options (AnalyzerOptions): The options of the analysis.
+        batch_size (int): The number of workitems analyzed together.
+
+    Returns:
+        Iterator: The data frames (dictonary) with analyzed workitem information.
+
+    """
+    workitem_iterator = iter(workitems)
+    batches = iter(lambda: list(islice(workitem_iterator, batch_size)), [])
+    return chain.from_iterable(analyze_batches_in_processes(batches, workers, options, batch_size))
+
+
+def analyze_batches_in_processes(batches: Iterable[list[WorkItem]], workers: int, options: AnalyzerOptions, batch_size: int) -> Iterator[list[RequirementsInspectorResponseItem]]:
+    """
+    Analyzes workitems already split into batches in a pool of worker processes (see analyze_workitems_in_processes).
+    A batch may be empty.
+
+    Parameters:
+        batches (Iterable): The batches of workitems to be analyzed.
+        workers (int): The number of worker processes.
+        options (AnalyzerOptions): The options of the analysis.
+        batch_size (int): The number of texts per batch of the language model.
+
+    Returns:
+        Iterator: Per batch, the data frames (dictonary) with analyzed workitem information.
+
+    """
+    with create_pool(workers, options, batch_size) as pool:
+        pending: deque[AsyncResult[list[RequirementsInspectorResponseItem | None]]] = deque()
+        for batch in batches:
+            pending.append(pool.apply_async(analyze_batch_in_worker, (batch,)))
+            if len(pending) >= workers * BATCHES_PER_WORKER:
+                yield [result for result in pending.popleft().get() if result is not None]
+
+        while pending:
+            yield [result for result in pending.popleft().get() if result is not None]
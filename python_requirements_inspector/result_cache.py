@@ -0,0 +1,120 @@
+"""
+Implementation of the persistent workitem result cache
+"""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from python_requirements_inspector.type_definitions import RequirementsInspectorResponseItem
+
+# Seconds a connection waits for a lock held by another process
+BUSY_TIMEOUT = 60
+
+# Maximum number of parameters of a single query
+MAX_QUERY_PARAMETERS = 500
+
+
+class ResultCache:
+    """
+    A SQLite database of analyzed workitems, keyed by the ruleset fingerprint and the content hash of the workitem.
+    The database can be shared by several processes, each opening its own ResultCache.
+    A workitem without result (unsupported language) is cached as None.
+    """
+
+    def __init__(self, path: str | Path, ruleset_fingerprint: str) -> None:
+        """
+        Initializes a ResultCache object, creating the database if it does not exist.
+
+        Parameters:
+            path (str | Path): The path of the database file.
+            ruleset_fingerprint (str): The fingerprint of the ruleset the cached results belong to (see fingerprint).
+
+        """
+        self.__ruleset_fingerprint = ruleset_fingerprint
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        with self.__lock, self.__connection:
+            # write-ahead logging lets readers of other processes continue while one process writes
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+            self.__connection.execute("PRAGMA synchronous=NORMAL")
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS results (ruleset TEXT NOT NULL, content_hash TEXT NOT NULL, result TEXT NOT NULL, PRIMARY KEY (ruleset, content_hash)) WITHOUT ROWID")
+
+    def get_many(self, content_hashes: Iterable[str]) -> dict[str, RequirementsInspectorResponseItem | None]:
+        """
+        Returns the cached results of workitems.
+
+        Parameters:
+            content_hashes (Iterable): The content hashes of the workitems.
+
+        Returns:
+            dict: The results per content hash, workitems not in the cache are missing.
+
+        """
+        unique_hashes = list(dict.fromkeys(content_hashes))
+        results: dict[str, RequirementsInspectorResponseItem | None] = {}
+        with self.__lock:
+            for start in range(0, len(unique_hashes), MAX_QUERY_PARAMETERS):
+                chunk = unique_hashes[start : start + MAX_QUERY_PARAMETERS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.__connection.execute(
+                    f"SELECT content_hash, result FROM results WHERE ruleset = ? AND content_hash IN ({placeholders})",  # noqa: S608
+                    (self.__ruleset_fingerprint, *chunk),
+                )
+                results.update((content_hash, json.loads(result)) for content_hash, result in rows)
+        return results
+
+    def put_many(self, results: Iterable[tuple[str, RequirementsInspectorResponseItem | None]]) -> None:
+        """
+        Caches the results of workitems in a single transaction.
+
+        Parameters:
+            results (Iterable): Tuples of the content hash of a workitem and its result.
+
+        """
+        rows = [(self.__ruleset_fingerprint, content_hash, json.dumps(result)) for content_hash, result in results]
+        with self.__lock, self.__connection:
+            self.__connection.executemany("INSERT OR REPLACE INTO results (ruleset, content_hash, result) VALUES (?, ?, ?)", rows)
+
+    def prune(self) -> int:
+        """
+        Removes the results of all other rulesets.
+
+        Returns:
+            int: The number of removed results.
+
+        """
+        with self.__lock, self.__connection:
+            return self.__connection.execute("DELETE FROM results WHERE ruleset != ?", (self.__ruleset_fingerprint,)).rowcount
+
+    def export(self, path: str | Path) -> None:
+        """
+        Writes a consistent copy of the database, e.g. to start another machine with a warm cache.
+
+        Parameters:
+            path (str | Path): The path of the copy, an existing file is replaced.
+
+        """
+        target = sqlite3.connect(path)
+        try:
+            with self.__lock:
+                self.__connection.backup(target)
+        finally:
+            target.close()
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self.__lock:
+            self.__connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        self.close()
@@ -0,0 +1,191 @@
+"""
+Implementation of the output formats of the analysis results
+"""
+
+import csv
+import io
+from array import array
+from enum import Enum
+from typing import IO, Any, cast
+
+from python_requirements_inspector import constants
+from python_requirements_inspector.json_stream import JsonFormat, JsonItemWriter
+from python_requirements_inspector.type_definitions import FindingType, RequirementsInspectorResponseItem
+
+# Field of the results holding the smell description, the largest part of most results
+DESCRIPTION_FIELD = "smellDescription"
+
+# Field of the results holding the hash identifying the result, only with AnalyzerOptions.content_hash
+CONTENT_HASH_FIELD = "contentHash"
+
+
+class OutputFormat(Enum):
+    JSON = "json"  # a JSON array of results
+    JSON_LINES = "jsonl"  # one JSON result per line
+    CSV = "csv"  # one row per result with a header row
+    NPZ = "npz"  # numpy arrays: the ids, languages (and content hashes), and a matrix of the finding counts per result and FindingType
+
+
+def is_clean(result: RequirementsInspectorResponseItem) -> bool:
+    """
+    Checks whether a result contains no findings.
+
+    Parameters:
+        result (dict): The data frame of an analyzed workitem.
+
+    Returns:
+        bool: True if all finding counts are 0 and the title contains a process word.
+
+    """
+    return not any(result.get(check.value) for check in FindingType)
+
+
+class CsvResultWriter:
+    """
+    A class for writing results one by one as CSV, with the fields of the JSON output as columns.
+    """
+
+    def __init__(self, csv_file: IO[str], descriptions: bool = True, content_hashes: bool = False) -> None:
+        """
+        Initializes a CsvResultWriter object and writes the header row.
+
+        Parameters:
+            csv_file (IO): The file to write to, opened with newline="".
+            descriptions (bool): Write the smell descriptions, False to leave out their column.
+            content_hashes (bool): Write the content hashes of the results (see AnalyzerOptions.content_hash) in a last column.
+
+        """
+        self.__file = csv_file
+        fieldnames = [field for field in constants.INITIALIZED_DATA_FRAME if descriptions or field != DESCRIPTION_FIELD]
+        if content_hashes:
+            fieldnames.append(CONTENT_HASH_FIELD)
+        self.__writer = csv.DictWriter(csv_file, fieldnames=fieldnames, extrasaction="ignore")
+        self.__writer.writeheader()
+
+    def write(self, result: RequirementsInspectorResponseItem) -> None:
+        """
+        Writes a result as row.
+
+        Parameters:
+            result (dict): The data frame of an analyzed workitem.
+
+        """
+        self.__writer.writerow(result)
+
+    def close(self) -> None:
+        """
+        Completes the written rows. The file itself is not closed.
+        """
+        self.__file.flush()
+
+
+class NpzResultWriter:
+    """
+    A class for collecting results as columns and writing them as a compressed numpy archive (see numpy.load).
+    The archive contains the arrays id, language, finding_type (the names of the columns of counts) and counts,
+    an integer matrix with a row per result and a column per FindingType (1 for a missing process word),
+    and optionally content_hash. The smell descriptions are not written.
+    """
+
+    def __init__(self, npz_file: IO[bytes], content_hashes: bool = False) -> None:
+        """
+        Initializes a NpzResultWriter object.
+
+        Parameters:
+            npz_file (IO): The binary file to write to.
+            content_hashes (bool): Write the content hashes of the results (see AnalyzerOptions.content_hash).
+
+        """
+        self.__file = npz_file
+        self.__ids: list[str] = []
+        self.__languages: list[str] = []
+        self.__content_hashes: list[str] | None = [] if content_hashes else None
+        # the counts matrix in row-major order, without a Python object per count
+        self.__counts = array("i")
+
+    def write(self, result: RequirementsInspectorResponseItem) -> None:
+        """
+        Adds a result as row.
+
+        Parameters:
+            result (dict): The data frame of an analyzed workitem.
+
+        """
+        self.__ids.append(str(result.get("id") or ""))
+        self.__languages.append(result.get("language") or "")
+        if self.__content_hashes is not None:
+            self.__content_hashes.append(result.get("contentHash", ""))
+        # the fields of the finding types are counts, except missingProcessword, which is a bool
+        finding_counts = cast("dict[str, int]", result)
+        self.__counts.extend(int(finding_counts.get(check.value, 0)) for check in FindingType)
+
+    def close(self) -> None:
+        """
+        Writes the collected columns. The file itself is not closed.
+        """
+        import numpy as np  # noqa: PLC0415 - numpy comes with spaCy and is not a declared dependency, only this output format imports it
+
+        arrays: dict[str, Any] = {
+            "id": np.array(self.__ids, dtype=np.str_),
+            "language": np.array(self.__languages, dtype=np.str_),
+            "finding_type": np.array([check.value for check in FindingType], dtype=np.str_),
+            "counts": np.frombuffer(self.__counts, dtype=np.intc).reshape(-1, len(FindingType)),
+        }
+        if self.__content_hashes is not None:
+            arrays["content_hash"] = np.array(self.__content_hashes, dtype=np.str_)
+        np.savez_compressed(self.__file, **arrays)
+        self.__file.flush()
+
+
+class ResultWriter:
+    """
+    A class for writing results one by one in an output format, optionally leaving out the results without findings
+    (sparse output) and the smell descriptions.
+    """
+
+    def __init__(self, output_file: IO[bytes], output_format: OutputFormat, sparse: bool = False, descriptions: bool = True, content_hashes: bool = False) -> None:
+        """
+        Initializes a ResultWriter object.
+
+        Parameters:
+            output_file (IO): The binary file to write to, text formats are written in UTF-8.
+            output_format (OutputFormat): The format of the file.
+            sparse (bool): Leave out the results without findings.
+            descriptions (bool): Write the smell descriptions, False to leave them out.
+            content_hashes (bool): Write the content hashes of results analyzed with AnalyzerOptions.content_hash
+                as column (CSV) or array (numpy), the JSON formats write the results as they are.
+
+        """
+        self.__sparse = sparse
+        self.__descriptions = descriptions
+        self.__text_file = io.TextIOWrapper(output_file, encoding="utf-8", newline="") if output_format != OutputFormat.NPZ else None
+        self.__writer: JsonItemWriter | CsvResultWriter | NpzResultWriter
+        if self.__text_file is None:
+            self.__writer = NpzResultWriter(output_file, content_hashes)
+        elif output_format == OutputFormat.CSV:
+            self.__writer = CsvResultWriter(self.__text_file, descriptions, content_hashes)
+        else:
+            self.__writer = JsonItemWriter(self.__text_file, JsonFormat(output_format.value))
+
+    def write(self, result: RequirementsInspectorResponseItem) -> None:
+        """
+        Writes a result, unless it is left out of sparse output.
+
+        Parameters:
+            result (dict): The data frame of an analyzed workitem.
+
+        """
+        if self.__sparse and is_clean(result):
+            return
+        if not self.__descriptions and DESCRIPTION_FIELD in result:
+            result = {field: value for field, value in result.items() if field != DESCRIPTION_FIELD}  # type: ignore[assignment]
+        self.__writer.write(result)
+
+    def close(self) -> None:
+        """
+        Completes the written results. The file itself is not closed.
+        """
+        self.__writer.close()
+        if self.__text_file is not None:
+            # leave the binary file open for the caller
+            self.__text_file.detach()
@@ -0,0 +1,103 @@
+"""
+Implementation of the sentence result cache
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from python_requirements_inspector.type_definitions import FindingType, PartialFinding
+
+# Key of a cached sentence: the language, the sentence text and the performed checks.
+# The text is not normalized: spaCy makes a token of additional whitespace, so sentences differing in whitespace have
+# findings at other token positions.
+SentenceKey = tuple[str, str, tuple[FindingType, ...]]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int  # lookups answered from the cache
+    misses: int  # lookups of sentences not in the cache
+    size: int  # number of cached sentences
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SentenceCache:
+    """
+    A thread-safe cache of the findings of analyzed sentences with least recently used eviction.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initializes a SentenceCache object.
+
+        Parameters:
+            max_size (int): The maximum number of cached sentences.
+
+        """
+        if max_size < 1:
+            raise ValueError(f"Cache size must be positive, got {max_size}")
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[SentenceKey, tuple[PartialFinding, ...]] = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, key: SentenceKey) -> tuple[PartialFinding, ...] | None:
+        """
+        Returns the cached findings of a sentence and marks the sentence as recently used.
+
+        Parameters:
+            key (SentenceKey): The language, the sentence text and the performed checks.
+
+        Returns:
+            tuple: The findings of the sentence or None if the sentence is not cached.
+
+        """
+        with self.__lock:
+            findings = self.__entries.get(key)
+            if findings is None:
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return findings
+
+    def put(self, key: SentenceKey, findings: tuple[PartialFinding, ...]) -> None:
+        """
+        Caches the findings of a sentence, evicting the least recently used sentence if the cache is full.
+
+        Parameters:
+            key (SentenceKey): The language, the sentence text and the performed checks.
+            findings (tuple): The findings of the sentence.
+
+        """
+        with self.__lock:
+            self.__entries[key] = findings
+            self.__entries.move_to_end(key)
+            if len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def get_stats(self) -> CacheStats:
+        """
+        Returns the hit and miss statistics of the cache.
+
+        Returns:
+            CacheStats: The number of hits, misses and cached sentences.
+
+        """
+        with self.__lock:
+            return CacheStats(hits=self.__hits, misses=self.__misses, size=len(self.__entries))
+
+    def clear(self) -> None:
+        """
+        Removes all sentences from the cache and resets the statistics.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
@@ -2,8 +2,14 @@
 Implementation of text analyzer
 """
 
+import time
+from collections.abc import Iterable, Iterator
 from typing import Protocol
 
+from spacy.tokens.doc import Doc
+from spacy.tokens.span import Span
+
+from python_requirements_inspector import constants
 from python_requirements_inspector.checkers.comparative_checker import ComparativeChecker
 from python_requirements_inspector.checkers.complex_checker import ComplexChecker
 from python_requirements_inspector.checkers.passive_checker import PassiveChecker
@@ -11,18 +17,20 @@ from python_requirements_inspector.checkers.process_word_checker import (
     ProcessWordChecker,
 )
 from python_requirements_inspector.checkers.weak_word_checker import WeakWordChecker
+from python_requirements_inspector.metrics import Metrics
+from python_requirements_inspector.sentence_cache import SentenceCache
 from python_requirements_inspector.text_processor import TextProcessor
 from python_requirements_inspector.type_definitions import Finding, FindingType, PartialFinding
 
 
 # Define a protocol that all checkers must follow
 class CheckerProtocol(Protocol):
-    def check_sentence(self, sentence: str) -> tuple[int, str]:
+    def check_sentence(self, sent: Span) -> tuple[int, str]:
         """
-        Analyzes a sentence.
+        Analyzes a sentence. The sentence is processed once by the TextAnalyzer and shared by all checkers.
 
         Parameters:
-            sent (str): The sentence to be analyzed.
+            sent (Span): The processed sentence to be analyzed.
 
         Returns:
             tuple: A tuples with detected findings in the sentence. The tuple contains:
@@ -31,53 +39,140 @@ class CheckerProtocol(Protocol):
 
         """
 
+    def has_match(self, sent: Span) -> bool:
+        """
+        Checks whether a sentence has a finding, without counting the findings or building their description.
+
+        Parameters:
+            sent (Span): The processed sentence to be analyzed.
+
+        Returns:
+            bool: True if check_sentence would report a finding.
+
+        """
+
+
+# Define a protocol that all checker classes must follow
+class CheckerTypeProtocol(Protocol):
+    # Token annotations of the language model the checker relies on, per language
+    required_annotations: dict[str, frozenset[str]]
+
+    def __call__(self, text_processor: TextProcessor) -> CheckerProtocol:
+        """
+        Creates a checker.
+
+        Parameters:
+            text_processor (TextProcessor): A TextProcessor instance for processing text.
+
+        Returns:
+            CheckerProtocol: The checker.
+
+        """
+
+
+# All available checkers
+CHECKER_TYPES: dict[FindingType, CheckerTypeProtocol] = {
+    FindingType.COMPLEX: ComplexChecker,
+    FindingType.PASSIVE: PassiveChecker,
+    FindingType.COMPARATIVE: ComparativeChecker,
+    FindingType.WEAKWORD: WeakWordChecker,
+    FindingType.PROCESS: ProcessWordChecker,
+}
+
+# Names of the metrics stages of the checkers
+CHECK_STAGES = {check: f"check.{check.name.lower()}" for check in FindingType}
+
 
 class TextAnalyzer:
     """
     A class for analyzing text for various types of linguistic issues.
     """
 
-    def __init__(self, lang: str) -> None:
+    def __init__(
+        self,
+        lang: str,
+        single_parse: bool = False,
+        checks: Iterable[FindingType] | None = None,
+        sentence_cache: SentenceCache | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
         """
         Initialize the TextAnalyzer.
 
         Parameters:
             lang (str): The language for text analysis.
+            single_parse (bool): Process a whole text with the language model at once and take the sentences
+                from the processed text instead of processing each sentence of the sentencizer separately.
+            checks (Iterable): The linguistic issues the analyzer can check for, None for all.
+                Only the components of the language model needed by these checks are loaded.
+            sentence_cache (SentenceCache): A cache of the findings of analyzed sentences, None for no caching.
+                Cached sentences are not processed by the language model again. Not used with single_parse,
+                because the sentences are then processed within their text.
+            metrics (Metrics): The metrics the stages of the analysis are recorded in, None for metrics of this analyzer only.
         """
 
-        self.__text_processor = TextProcessor(lang)
-        self.__available_checks: dict[FindingType, CheckerProtocol] = {
-            FindingType.COMPLEX: ComplexChecker(self.__text_processor),
-            FindingType.PASSIVE: PassiveChecker(self.__text_processor),
-            FindingType.COMPARATIVE: ComparativeChecker(self.__text_processor),
-            FindingType.WEAKWORD: WeakWordChecker(self.__text_processor),
-            FindingType.PROCESS: ProcessWordChecker(self.__text_processor),
-        }
+        self.__checker_types = {check: CHECKER_TYPES[check] for check in (CHECKER_TYPES if checks is None else checks)}
+        annotations = {annotation for checker_type in self.__checker_types.values() for annotation in checker_type.required_annotations[lang]}
+        if single_parse:
+            # Sentence boundaries are taken from the language model
+            annotations.add("SENT_START")
 
-    def process_sentence(self, sent: str, list_of_checks: list[FindingType]) -> list[PartialFinding]:
+        self.__lang = lang
+        self.__text_processor = TextProcessor(lang, annotations)
+        self.__single_parse = single_parse
+        self.__sentence_cache = None if single_parse else sentence_cache
+        self.__metrics = metrics if metrics is not None else Metrics()
+        # Checkers are created on first use
+        self.__available_checks: dict[FindingType, CheckerProtocol] = {}
+
+    def __get_checker(self, check: FindingType) -> CheckerProtocol | None:
+        """
+        Get the checker for a type of linguistic issue, creating it on first use.
+
+        Parameters:
+            check (FindingType): The type of linguistic issue.
+
+        Returns:
+            CheckerProtocol: The checker or None if the type of linguistic issue has no checker.
+        """
+
+        checker = self.__available_checks.get(check)
+        if checker is None:
+            checker_type = self.__checker_types.get(check)
+            if checker_type is None:
+                return None
+            checker = checker_type(self.__text_processor)
+            self.__available_checks[check] = checker
+        return checker
+
+    def process_sentence(self, sent: Span, list_of_checks: list[FindingType]) -> tuple[PartialFinding, ...]:
         """
         Process a sentence for specified types of linguistic issues.
 
         Parameters:
-            sent (str): The sentence to be processed.
+            sent (Span): The processed sentence, shared by all checkers.
             list_of_checks (list): A list of linguistic issues to check for.
 
         Returns:
-            list: A list of tuples representing detected findings in the sentence. Each tuple contains:
+            tuple: The detected findings in the sentence, empty for most sentences. Each finding contains:
                 - Finding type (str)
                 - Finding count (int)
                 - Finding description (str)
         """
 
-        findings: list[PartialFinding] = []
+        findings: list[PartialFinding] | None = None
 
         for check in list_of_checks:
-            checker = self.__available_checks.get(check)
+            checker = self.__get_checker(check)
+            start = time.perf_counter()
             result = checker.check_sentence(sent) if checker is not None else (0, "")
+            self.__metrics.record(CHECK_STAGES[check], time.perf_counter() - start)
 
             if result[0] <= 0:
                 continue
 
+            if findings is None:
+                findings = []
             findings.append(
                 PartialFinding(
                     finding_type=check,
@@ -86,7 +181,98 @@ class TextAnalyzer:
                 )
             )
 
-        return findings
+        # the sentences without findings share the empty tuple
+        return tuple(findings) if findings is not None else ()
+
+    def __has_finding(self, sent: Span, list_of_checks: list[FindingType]) -> bool:
+        """
+        Checks whether a sentence has a finding of any of the specified types, stopping at the first one.
+
+        Parameters:
+            sent (Span): The processed sentence, shared by all checkers.
+            list_of_checks (list): A list of linguistic issues to check for.
+
+        Returns:
+            bool: True if the sentence has a finding.
+        """
+
+        for check in list_of_checks:
+            checker = self.__get_checker(check)
+            if checker is None:
+                continue
+            start = time.perf_counter()
+            found = checker.has_match(sent)
+            self.__metrics.record(CHECK_STAGES[check], time.perf_counter() - start)
+            if found:
+                return True
+        return False
+
+    def __parse(self, texts: Iterable[str], batch_size: int) -> Iterator[Doc]:
+        """
+        Processes texts with the language model in batches, recording the time and the number of tokens.
+
+        Parameters:
+            texts (Iterable): The texts to be processed.
+            batch_size (int): The number of texts per batch of the language model.
+
+        Returns:
+            Iterator: The processed texts.
+        """
+
+        for doc in self.__metrics.time_iterator("parse", self.__text_processor.tokenize_batch(texts, batch_size)):
+            self.__metrics.count("tokens", len(doc))
+            yield doc
+
+    def __get_sentence_findings(self, texts: list[str], list_of_checks: list[FindingType], batch_size: int) -> Iterator[list[tuple[Span, tuple[PartialFinding, ...]]]]:
+        """
+        Splits texts into sentences and processes each sentence once with the language model.
+        The language model processes all sentences of the texts in batches.
+
+        Parameters:
+            texts (list): The texts to be split.
+            list_of_checks (list): A list of linguistic issues to check for.
+            batch_size (int): The number of texts per batch of the language model.
+
+        Returns:
+            Iterator: Per text, a list of tuples of the sentence as split from the text and the findings of the sentence.
+        """
+
+        if self.__single_parse:
+            # Process each whole text once and take the sentence boundaries from the language model
+            for doc in self.__parse(texts, batch_size):
+                sents = list(doc.sents)
+                self.__metrics.count("sentences", len(sents))
+                yield [(sent, self.process_sentence(sent, list_of_checks)) for sent in sents]
+            return
+
+        # Split texts into sentences
+        split_texts = [list(doc.sents) for doc in self.__metrics.time_iterator("sentencize", self.__text_processor.sentenize_batch(texts, batch_size))]
+        self.__metrics.count("sentences", sum(len(sents) for sents in split_texts))
+
+        if self.__sentence_cache is None:
+            processed_sents = self.__parse((sent.text for sents in split_texts for sent in sents), batch_size)
+            for sents in split_texts:
+                yield [(sent, self.process_sentence(next(processed_sents)[:], list_of_checks)) for sent in sents]
+            return
+
+        # Look up each distinct sentence once and process only the sentences not in the cache (keyed by its exact text, see SentenceKey)
+        checks = tuple(list_of_checks)
+        findings_per_sentence: dict[str, tuple[PartialFinding, ...]] = {}
+        missing_sentences: list[str] = []
+        for sent_text in dict.fromkeys(sent.text for sents in split_texts for sent in sents):
+            cached_findings = self.__sentence_cache.get((self.__lang, sent_text, checks))
+            if cached_findings is None:
+                missing_sentences.append(sent_text)
+            else:
+                findings_per_sentence[sent_text] = cached_findings
+
+        for sent_text, processed_sent in zip(missing_sentences, self.__parse(missing_sentences, batch_size), strict=True):
+            findings = self.process_sentence(processed_sent[:], list_of_checks)
+            self.__sentence_cache.put((self.__lang, sent_text, checks), findings)
+            findings_per_sentence[sent_text] = findings
+
+        for sents in split_texts:
+            yield [(sent, findings_per_sentence[sent.text]) for sent in sents]
 
     def analyze_text(self, text: str, list_of_checks: list[FindingType]) -> list[Finding]:
         """
@@ -105,23 +291,88 @@ class TextAnalyzer:
                 - Finding description (str)
         """
 
-        findings: list[Finding] = []  # stores the detected problems
-        # Split text into sentences
-        doc = self.__text_processor.sentenize(text)
-        for sent_num, sent in enumerate(doc.sents):
-            results = self.process_sentence(sent.text, list_of_checks)
+        return self.analyze_texts([text], list_of_checks)[0]
+
+    def contains_findings(self, texts: list[str], list_of_checks: list[FindingType], batch_size: int = constants.DEFAULT_BATCH_SIZE) -> list[bool]:
+        """
+        Checks whether texts have any finding (existence mode), e.g. whether a title contains a process word.
+        Unlike analyze_texts, the findings are neither counted nor described, and the analysis of a text stops
+        at its first sentence with a finding: the first sentences of all texts are processed in a batch, then
+        the second sentences of the texts without a finding so far, and so on.
+
+        Parameters:
+            texts (list): The texts to be checked.
+            list_of_checks (list): A list of linguistic issues to check for.
+            batch_size (int): The number of texts per batch of the language model.
+
+        Returns:
+            list: Per text, True if the text has a finding (in the order of the texts).
+        """
+
+        results = [False] * len(texts)
+        if self.__single_parse:
+            for index, doc in enumerate(self.__parse(texts, batch_size)):
+                results[index] = any(self.__has_finding(sent, list_of_checks) for sent in doc.sents)
+            return results
+
+        split_texts = [[sent.text for sent in doc.sents] for doc in self.__metrics.time_iterator("sentencize", self.__text_processor.sentenize_batch(texts, batch_size))]
+        self.__metrics.count("sentences", sum(len(sents) for sents in split_texts))
+
+        checks = tuple(list_of_checks)
+        remaining = [index for index, sents in enumerate(split_texts) if sents]
+        sent_num = 0
+        while remaining:
+            missing: list[int] = []
+            for index in remaining:
+                # a cached sentence is not processed by the language model again
+                cached_findings = self.__sentence_cache.get((self.__lang, split_texts[index][sent_num], checks)) if self.__sentence_cache is not None else None
+                if cached_findings is None:
+                    missing.append(index)
+                else:
+                    results[index] = bool(cached_findings)
+
+            for index, processed_sent in zip(missing, self.__parse((split_texts[index][sent_num] for index in missing), batch_size), strict=True):
+                results[index] = self.__has_finding(processed_sent[:], list_of_checks)
+                if not results[index] and self.__sentence_cache is not None:
+                    # without a finding the findings of the sentence are known exactly, unlike with a finding
+                    self.__sentence_cache.put((self.__lang, split_texts[index][sent_num], checks), ())
+
+            sent_num += 1
+            remaining = [index for index in remaining if not results[index] and sent_num < len(split_texts[index])]
+
+        return results
+
+    def analyze_texts(self, texts: list[str], list_of_checks: list[FindingType], batch_size: int = constants.DEFAULT_BATCH_SIZE) -> list[list[Finding]]:
+        """
+        Analyze multiple texts (see analyze_text). The language model processes the texts in batches.
+
+        Parameters:
+            texts (list): The texts to be analyzed.
+            list_of_checks (list): A list of linguistic issues to check for.
+            batch_size (int): The number of texts per batch of the language model.
 
-            findings.extend(
-                [
+        Returns:
+            list: Per text, a list of Finding representing detected findings in the text (in the order of the texts).
+        """
+
+        findings_per_text: list[list[Finding]] = []
+        for sentences in self.__get_sentence_findings(texts, list_of_checks, batch_size):
+            findings: list[Finding] = []  # stores the detected problems
+            for sent_num, (sent, results) in enumerate(sentences, start=1):
+                if not results:
+                    continue
+                # the start of the sentence is only extracted for sentences with findings
+                sent_start = sent[0:3].text
+                findings.extend(
                     Finding(
-                        sent_num=sent_num + 1,
-                        sent_start=sent[0:3].text,
+                        sent_num=sent_num,
+                        sent_start=sent_start,
                         finding_count=result.finding_count,
                         finding_desc=result.finding_desc,
                         finding_type=result.finding_type,
                     )
                     for result in results
-                ]
-            )
+                )
+            findings_per_text.append(findings)
 
-        return findings
+        return findings_per_text
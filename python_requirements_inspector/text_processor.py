@@ -2,13 +2,21 @@
 Implementation of text processor
 """
 
+from collections.abc import Iterable, Iterator
+
 import spacy
 from spacy.lang.de import German
 from spacy.lang.en import English
 from spacy.tokens.doc import Doc
+from spacy.tokens.span import Span
 from spacy.vocab import Vocab
 
 from python_requirements_inspector import constants
+from python_requirements_inspector.model_registry import model_registry
+from python_requirements_inspector.pattern_cache import pattern_cache
+
+# Maximum number of lowercase word forms with their lemma kept per text processor (see get_lowercase_lemmas)
+LOWERCASE_LEMMA_CACHE_SIZE = 100000
 
 
 class TextProcessor:
@@ -18,27 +26,50 @@ class TextProcessor:
 
     __small_nlp: English | German
 
-    def __init__(self, lang: str) -> None:
+    def __init__(self, lang: str, annotations: Iterable[str] | None = None) -> None:
         """
         Initializes a TextProcessor object.
 
         Parameters:
             lang (str): The language of the text being processed.
+            annotations (Iterable): The token annotations needed from the language model (see constants.ANNOTATION_COMPONENTS).
+                Components providing none of them are not loaded. None loads all components.
 
         """
 
         # Language-specific initialization
         if lang == constants.ENGLISH:
-            self.__nlp = spacy.load("en_core_web_md")
             self.__small_nlp = English()
         elif lang == constants.GERMAN:
-            self.__nlp = spacy.load("de_core_news_md")
             self.__small_nlp = German()
         else:
             raise ValueError(f"Unsupported language: {lang}")
 
+        # The language models are shared by all text processors of the process
+        self.__nlp = model_registry.load(constants.LANGUAGE_MODELS[lang], self.__get_excluded_components(annotations))
         self.__small_nlp.add_pipe("sentencizer")
 
+        # The lemmas of the lowercase forms of words containing uppercase letters
+        self.__lowercase_lemmas: dict[str, str] = {}
+
+    @staticmethod
+    def __get_excluded_components(annotations: Iterable[str] | None) -> list[str]:
+        """
+        Get the pipeline components of the language model not needed for the given token annotations.
+
+        Parameters:
+            annotations (Iterable): The needed token annotations, None for all.
+
+        Returns:
+            list: The names of the pipeline components to exclude.
+
+        """
+        if annotations is None:
+            return []
+
+        needed_components = {component for annotation in annotations for component in constants.ANNOTATION_COMPONENTS[annotation]}
+        return [component for component in constants.MODEL_COMPONENTS if component not in needed_components]
+
     def sentenize(self, text: str) -> Doc:
         """
         Tokenizes a text into sentences using the language-specific Spacy language model.
@@ -52,6 +83,20 @@ class TextProcessor:
         """
         return self.__small_nlp(text)
 
+    def sentenize_batch(self, texts: Iterable[str], batch_size: int) -> Iterator[Doc]:
+        """
+        Tokenizes texts into sentences in batches (see sentenize).
+
+        Parameters:
+            texts (Iterable): The texts to be tokenized.
+            batch_size (int): The number of texts per batch.
+
+        Returns:
+            Iterator: The Spacy Doc objects in the order of the texts.
+
+        """
+        return self.__small_nlp.pipe(texts, batch_size=batch_size)
+
     def tokenize(self, text: str) -> Doc:
         """
         Tokenizes a text using the language-specific Spacy language model.
@@ -65,6 +110,20 @@ class TextProcessor:
         """
         return self.__nlp(text)
 
+    def tokenize_batch(self, texts: Iterable[str], batch_size: int) -> Iterator[Doc]:
+        """
+        Tokenizes texts in batches using the language-specific Spacy language model (see tokenize).
+
+        Parameters:
+            texts (Iterable): The texts to be tokenized.
+            batch_size (int): The number of texts per batch.
+
+        Returns:
+            Iterator: The Spacy Doc objects in the order of the texts.
+
+        """
+        return self.__nlp.pipe(texts, batch_size=batch_size)
+
     def lemmatize_list(self, word_list: list[str]) -> list[str]:
         """
         Lemmatizes a list of words using the language-specific Spacy language model.
@@ -76,14 +135,64 @@ class TextProcessor:
             list: The lemmatized list of words.
 
         """
-        lemma_list: list[str] = []
+        # all words are processed by the language model in a single batch
+        return [" ".join(f"{token}" for token in doc).strip() for doc in self.__nlp.pipe(word.lower() for word in word_list)]
+
+    def get_lowercase_lemmas(self, sent: Doc | Span) -> list[str]:
+        """
+        Returns the lowercase lemma of each token of an already processed sentence, as if the sentence was processed in lowercase.
+        The lemmatizers are case-sensitive (e.g. the lemma of "TRIGGERS" is "TRIGGERS", the one of "triggers" is "trigger"),
+        so a token containing uppercase letters gets the lemma of its lowercase form. The lowercase forms are processed
+        alone, like the words of the patterns (see get_lemma_patterns), once per form.
 
-        for word in word_list:
-            doc = self.tokenize(word.lower())
-            lemma = " ".join(f"{token}" for token in doc).strip()  # Append each token's lemma to the string
-            lemma_list.append(lemma.strip())  # Append the processed lemma to the lemma list
+        Parameters:
+            sent (Doc | Span): The processed sentence.
+
+        Returns:
+            list: The lowercase lemmas in the order of the tokens.
 
-        return lemma_list
+        """
+        missing_forms = list({token.lower_ for token in sent if token.text != token.lower_ and token.lower_ not in self.__lowercase_lemmas})
+        if missing_forms:
+            if len(self.__lowercase_lemmas) + len(missing_forms) > LOWERCASE_LEMMA_CACHE_SIZE:
+                self.__lowercase_lemmas.clear()
+            for form, doc in zip(missing_forms, self.__nlp.pipe(missing_forms), strict=True):
+                # a form split into several tokens keeps its text
+                self.__lowercase_lemmas[form] = (doc[0].lemma_ or form).lower() if len(doc) == 1 else form
+
+        return [(token.lemma_ or token.text).lower() if token.text == token.lower_ else self.__lowercase_lemmas[token.lower_] for token in sent]
+
+    def lemmatize_doc(self, sent: Doc | Span, lemmas: list[str] | None = None) -> Doc:
+        """
+        Builds a Doc holding one lowercase lemma per token of an already processed sentence (see get_lowercase_lemmas).
+        Token positions stay aligned with the sentence, so lemma phrases can be matched
+        case-insensitively on the LOWER attribute without running the pipeline on the sentence again.
+
+        Parameters:
+            sent (Doc | Span): The processed sentence.
+            lemmas (list): The lowercase lemmas of the sentence if already known, None to get them.
+
+        Returns:
+            spacy.tokens.doc.Doc: A Doc with the lemmas of the sentence as words.
+
+        """
+        return Doc(self.__nlp.vocab, words=lemmas if lemmas is not None else self.get_lowercase_lemmas(sent))
+
+    def get_lemma_patterns(self, word_list: list[str]) -> list[Doc]:
+        """
+        Creates lemma patterns for a PhraseMatcher matching on the LOWER attribute of Docs created by lemmatize_doc.
+        The patterns are cached per language model and word list (see PatternCache), so that they are created only once.
+
+        Parameters:
+            word_list (list): The list of words to create patterns for.
+
+        Returns:
+            list: One lemma Doc per word.
+
+        """
+        # the lemmas depend on the version and the loaded components of the language model
+        key = [self.__nlp.lang, self.__nlp.meta.get("name"), self.__nlp.meta.get("version"), spacy.about.__version__, self.__nlp.pipe_names, word_list]
+        return pattern_cache.load(key, self.__nlp.vocab, lambda: [self.lemmatize_doc(doc) for doc in self.__nlp.pipe(self.lemmatize_list(word_list))])
 
     def get_language(self) -> str | None:
         """
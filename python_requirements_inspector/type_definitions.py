@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 
 class WorkItem(TypedDict):
@@ -26,6 +26,7 @@ class RequirementsInspectorResponseItem(TypedDict):
     smellComparative: int
     missingProcessword: bool
     smellDescription: str
+    contentHash: NotRequired[str]  # only with AnalyzerOptions.content_hash
 
 
 class FindingType(Enum):
@@ -46,7 +47,7 @@ class MatcherId(Enum):
     ALL_WORDS_MATCHER_ID = "All"
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     sent_num: int | None
     sent_start: str | None
@@ -55,8 +56,21 @@ class Finding:
     finding_desc: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PartialFinding:
     finding_type: FindingType
     finding_count: int
     finding_desc: str
+
+
+@dataclass(frozen=True)
+class AnalyzerOptions:
+    single_parse: bool = False  # process each text field with the language model at once (see TextAnalyzer)
+    checks: tuple[FindingType, ...] | None = None  # the linguistic issues to check for, None for the default checks
+    sentence_cache_size: int = 10000  # the number of sentences with cached findings, 0 disables the cache (see SentenceCache)
+    result_cache: str | None = None  # the path of the persistent result cache of the workitems (see ResultCache), None for no caching
+    max_new_strings: int | None = None  # the number of strings added to the vocabularies of the language models before they are reloaded, None for no limit
+    max_rss_mb: int | None = None  # the resident memory of the process in MB before the language models are reloaded, None for no limit
+    language_sample_size: int = 1000  # the number of characters of a description the language detection starts with (see LangDetector)
+    language_confidence: float = 0.9  # the probability of the detected language above which the language detection uses no more of the description
+    content_hash: bool = False  # add the hash identifying the result of each workitem (contentHash), needed to read the results as previous results
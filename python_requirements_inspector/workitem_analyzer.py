@@ -2,10 +2,29 @@
 Implementation of workitem analyzer
 """
 
+import threading
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from types import TracebackType
+from typing import Self
+
 from python_requirements_inspector import constants
+from python_requirements_inspector.fingerprint import get_content_hash, get_result_hash, get_ruleset_fingerprint
 from python_requirements_inspector.lang_detector import LangDetector
+from python_requirements_inspector.memory import RSS_RELOAD_MARGIN_MB, get_rss_mb
+from python_requirements_inspector.metrics import Metrics
+from python_requirements_inspector.model_registry import model_registry
+from python_requirements_inspector.pattern_cache import pattern_cache
+from python_requirements_inspector.result_cache import ResultCache
+from python_requirements_inspector.sentence_cache import CacheStats, SentenceCache
 from python_requirements_inspector.text_analyzer import TextAnalyzer
-from python_requirements_inspector.type_definitions import Finding, FindingType, RequirementsInspectorResponseItem, WorkItem, WorkItemFields
+from python_requirements_inspector.type_definitions import AnalyzerOptions, Finding, FindingType, RequirementsInspectorResponseItem, WorkItem, WorkItemFields
+
+# Texts of the same language analyzed with the same checks are processed together,
+# titles only for the existence of findings (see TextAnalyzer.contains_findings)
+TextGroup = tuple[str, tuple[FindingType, ...], bool]
 
 
 class WorkitemAnalyzer:
@@ -13,16 +32,36 @@ class WorkitemAnalyzer:
     A class for analyzing workitems and generating a dataframes of all findings.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, options: AnalyzerOptions | None = None, metrics: Metrics | None = None) -> None:
         """
         Initializes a WorkitemAnalyzer object.
+
+        Parameters:
+            options (AnalyzerOptions): The options of the analysis, None for the default options.
+            metrics (Metrics): The metrics the stages of the analysis are recorded in, None for metrics of this analyzer only.
         """
 
+        self.__options = options or AnalyzerOptions()
+        self.__metrics = metrics if metrics is not None else Metrics()
+
+        # The process word check applies to the title, all other checks to the description and additional fields
+        checks = constants.DEFAULT_CHECKS if self.__options.checks is None else self.__options.checks
+        self.__title_checks = [check for check in constants.DEFAULT_TITLE_CHECKS if check in checks]
+        self.__text_checks = [check for check in constants.DEFAULT_DESCRIPTION_CHECKS if check in checks]
+
+        # The findings of repeated sentences are shared by the text analyzers of all languages
+        self.__sentence_cache = SentenceCache(self.__options.sentence_cache_size) if self.__options.sentence_cache_size > 0 else None
+
+        # The results of unchanged workitems are taken from the persistent result cache
+        self.__ruleset_fingerprint = get_ruleset_fingerprint(self.__options)
+        self.__result_cache = ResultCache(self.__options.result_cache, self.__ruleset_fingerprint) if self.__options.result_cache else None
+
+        # Text analyzers and the language detector are created on first use
         self.__available_text_analyzer: dict[str, TextAnalyzer] = {}
-        for lang in constants.SUPPORTED_LANGUAGES:
-            self.__available_text_analyzer[lang] = TextAnalyzer(lang)
-        self.__language_detector = LangDetector()
-        self.__text_checks = constants.DEFAULT_DESCRIPTION_CHECKS
+        self.__text_analyzer_lock = threading.Lock()
+        self.__language_detector: LangDetector | None = None
+        # The text analyzers hold the language models of this generation of the registry (see release_stale_models)
+        self.__model_generation = model_registry.get_generation()
         self.__data: list[RequirementsInspectorResponseItem] = []
 
     def __validate_language(self, workitem: WorkItem) -> None:
@@ -37,16 +76,20 @@ class WorkitemAnalyzer:
         lang = workitem.get("language")
         desc = workitem.get("description")
         if not lang:
-            lang = self.__language_detector.detect_language(desc)
+            if self.__language_detector is None:
+                self.__language_detector = LangDetector(self.__options.language_sample_size, self.__options.language_confidence)
+            with self.__metrics.time("language_detection"):
+                lang = self.__language_detector.detect_language(desc)
             workitem["language"] = lang
 
     @staticmethod
-    def __get_initialized_data_frame(workitem: WorkItem) -> RequirementsInspectorResponseItem:
+    def __get_initialized_data_frame(workitem: WorkItem, result_hash: str | None) -> RequirementsInspectorResponseItem:
         """
         Returns an initialized data frame for a given workitem.
 
         Parameters:
             workitem (dict): A dictionary representing the workitem data.
+            result_hash (str): The hash identifying the result of the workitem (see fingerprint.get_result_hash), None to leave it out.
 
         Returns:
             dict: An initialized data frame.
@@ -55,14 +98,17 @@ class WorkitemAnalyzer:
         data_frame = constants.INITIALIZED_DATA_FRAME.copy()
         data_frame["id"] = workitem.get("id")
         data_frame["language"] = workitem.get("language")
+        if result_hash is not None:
+            data_frame["contentHash"] = result_hash
         return data_frame
 
-    def __process_findings(self, data_frame: RequirementsInspectorResponseItem, findings: list[Finding], text_section: str) -> None:
+    def __process_findings(self, data_frame: RequirementsInspectorResponseItem, smell_descriptions: list[str], findings: list[Finding], text_section: str) -> None:
         """
         Processes the findings returned by the analyse_text method and updates the data frame.
 
         Parameters:
             data_frame (dict): A data frame representing the analyzed workitem.
+            smell_descriptions (list): The parts of the smell description of the workitem, joined once all sections are processed.
             findings (list): A list of namedtuple findings (defined in constants).
             text_section (str): The section of the workitem where analysis was performed on.
 
@@ -70,8 +116,7 @@ class WorkitemAnalyzer:
 
         for finding in findings:
             # update smell description
-            smell_desc = self.__generate_smell_description(text_section, finding)
-            data_frame["smellDescription"] += smell_desc
+            smell_descriptions.append(self.__generate_smell_description(text_section, finding))
 
             # update counter
             match finding.finding_type:
@@ -84,22 +129,22 @@ class WorkitemAnalyzer:
                 case FindingType.COMPARATIVE:
                     data_frame["smellComparative"] += finding.finding_count
 
-    def __process_title_findings(self, data_frame: RequirementsInspectorResponseItem, findings: list[Finding] | None) -> None:
+    def __process_title_findings(self, data_frame: RequirementsInspectorResponseItem, smell_descriptions: list[str], has_findings: bool) -> None:
         """
-        Processes the findings of the title returned by the analyse_text method and updates the data frame.
+        Processes the result of the title returned by the contains_findings method and updates the data frame.
 
         Parameters:
             data_frame (dict): A data frame representing the analyzed workitem.
-            findings (list): A list of namedtuple findings (defined in constants).
+            smell_descriptions (list): The parts of the smell description of the workitem, joined once all sections are processed.
+            has_findings (bool): Whether the title contains a process word.
 
         """
-        if not findings:
+        if not has_findings:
             # generate finding
             finding = Finding(None, None, FindingType.PROCESS, 1, "Title contains no process word")
 
             # update smell description
-            smell_desc = self.__generate_smell_description(WorkItemFields.TITLE.value, finding)
-            data_frame["smellDescription"] += smell_desc
+            smell_descriptions.append(self.__generate_smell_description(WorkItemFields.TITLE.value, finding))
 
             if finding.finding_type == FindingType.PROCESS:
                 data_frame["missingProcessword"] = True
@@ -136,49 +181,287 @@ class WorkitemAnalyzer:
             list: A list of field names that are not part of the default input fields.
 
         """
-        return list(set(workitem.keys()).difference(WorkItem.__annotations__.keys()))
+        # keep the order of the workitem, so that the smell description is deterministic
+        return [field for field in workitem if field not in WorkItem.__annotations__]
 
-    def analyze_workitem(self, workitem: WorkItem) -> None:
+    def __get_text_sections(self, workitem: WorkItem) -> list[tuple[str, str, list[FindingType]]]:
         """
-        Analyzes all data from the given workitem (excluding id and language).
+        Get the text sections of the workitem to be analyzed (excluding id and language).
 
         Parameters:
             workitem (dict): A dictionary representing the workitem data.
 
-        """
-
-        self.__validate_language(workitem)
-        data_frame = self.__get_initialized_data_frame(workitem)
-
-        desc = workitem.get("description")
-        title = workitem.get("title")
-        lang = workitem.get("language")
-        additional_fields_to_check = self.__get_remaining_fields(workitem)
-
-        text_analyzer = self.__available_text_analyzer.get(lang) if lang is not None else None
+        Returns:
+            list: Tuples of the section name, the text and the checks to perform on the text.
 
-        if text_analyzer is None:
-            return
+        """
+        sections: list[tuple[str, str, list[FindingType]]] = []
 
         # If title is empty doesn't analyze
         # It is empty when it is parametrized to not analyze it
-        if title:
-            findings = text_analyzer.analyze_text(title, constants.DEFAULT_TITLE_CHECKS)
-            self.__process_title_findings(data_frame, findings)
+        title = workitem.get("title")
+        if title and self.__title_checks:
+            sections.append((WorkItemFields.TITLE.value, title, self.__title_checks))
+
+        if not self.__text_checks:
+            return sections
 
         # If description is empty doesn't analyze
         # Can be empty if it is parametrized to not analyze it
+        desc = workitem.get("description")
         if desc:
-            findings = text_analyzer.analyze_text(desc, self.__text_checks)
-            self.__process_findings(data_frame, findings, WorkItemFields.DESCRIPTION.value)
+            sections.append((WorkItemFields.DESCRIPTION.value, desc, self.__text_checks))
 
         # check all fields that are not description or title
-        for field in additional_fields_to_check:
-            field_content = str(workitem.get(field))
-            findings = text_analyzer.analyze_text(field_content, self.__text_checks)
-            self.__process_findings(data_frame, findings, field)
+        sections.extend((field, str(workitem.get(field)), self.__text_checks) for field in self.__get_remaining_fields(workitem))
+
+        return sections
+
+    def analyze_batch(self, workitems: list[WorkItem], batch_size: int = constants.DEFAULT_BATCH_SIZE) -> list[RequirementsInspectorResponseItem | None]:
+        """
+        Analyzes a batch of workitems. The texts of all workitems are grouped by language and
+        checks, so that each group is processed by the language model in batches.
+        With a result cache, only the workitems not analyzed before with the same ruleset are analyzed.
+
+        Parameters:
+            workitems (list): The workitems to be analyzed.
+            batch_size (int): The number of texts per batch of the language model.
+
+        Returns:
+            list: Per workitem, the data frame of the analyzed workitem or None if its language is not supported.
+
+        """
+        with self.__metrics.time("analyze_batch"):
+            results = self.__analyze_batch(workitems, batch_size)
+        self.__metrics.count("workitems", len(workitems))
+        self.__limit_memory()
+        return results
+
+    def __analyze_batch(self, workitems: list[WorkItem], batch_size: int) -> list[RequirementsInspectorResponseItem | None]:
+        """
+        Analyzes a batch of workitems (see analyze_batch).
+        """
+        # The content is hashed before the language validation completes the workitem.
+        # Workitems with a cached result are neither validated nor analyzed.
+        content_hashes = [get_content_hash(workitem) for workitem in workitems]
+        cached_results = self.__result_cache.get_many(content_hashes) if self.__result_cache is not None else {}
+
+        texts_per_group: dict[TextGroup, list[str]] = defaultdict(list)
+        sections_per_workitem: list[tuple[RequirementsInspectorResponseItem, list[tuple[str, TextGroup, int]]]] = []
+        results: list[RequirementsInspectorResponseItem | None] = []
+
+        for position, workitem in enumerate(workitems):
+            result_hash = get_result_hash(self.__ruleset_fingerprint, content_hashes[position]) if self.__options.content_hash else None
+            if content_hashes[position] in cached_results:
+                cached_result = cached_results[content_hashes[position]]
+                # the cached result may have been stored with another setting of content_hash
+                if cached_result is not None:
+                    cached_result.pop("contentHash", None)
+                    if result_hash is not None:
+                        cached_result["contentHash"] = result_hash
+                results.append(cached_result)
+                self.__metrics.count("cached_workitems")
+                continue
+
+            self.__validate_language(workitem)
+            lang = workitem.get("language")
+            if lang not in constants.SUPPORTED_LANGUAGES:
+                results.append(None)
+                continue
+
+            sections: list[tuple[str, TextGroup, int]] = []
+            for section, text, checks in self.__get_text_sections(workitem):
+                group = (lang, tuple(checks), section == WorkItemFields.TITLE.value)
+                sections.append((section, group, len(texts_per_group[group])))
+                texts_per_group[group].append(text)
+            data_frame = self.__get_initialized_data_frame(workitem, result_hash)
+            sections_per_workitem.append((data_frame, sections))
+            results.append(data_frame)
+
+        self.load_languages(lang for lang, _, _ in texts_per_group)
+        findings_per_group = {group: self.__available_text_analyzer[group[0]].analyze_texts(texts, list(group[1]), batch_size) for group, texts in texts_per_group.items() if not group[2]}
+        title_results_per_group = {group: self.__available_text_analyzer[group[0]].contains_findings(texts, list(group[1]), batch_size) for group, texts in texts_per_group.items() if group[2]}
+
+        for data_frame, sections in sections_per_workitem:
+            smell_descriptions: list[str] = []
+            for section, group, index in sections:
+                if section == WorkItemFields.TITLE.value:
+                    self.__process_title_findings(data_frame, smell_descriptions, title_results_per_group[group][index])
+                else:
+                    self.__process_findings(data_frame, smell_descriptions, findings_per_group[group][index], section)
+            # the description is built once per workitem instead of by repeated concatenation
+            data_frame["smellDescription"] = "".join(smell_descriptions)
+
+        if self.__result_cache is not None:
+            self.__result_cache.put_many((content_hash, result) for content_hash, result in zip(content_hashes, results, strict=True) if content_hash not in cached_results)
+
+        return results
+
+    def load_languages(self, languages: Iterable[str]) -> None:
+        """
+        Loads the language models and text analyzers of the given languages, if not already loaded.
+        Multiple languages are loaded concurrently.
+
+        Parameters:
+            languages (Iterable): The language codes to load, unsupported languages are ignored.
+
+        """
+
+        with self.__text_analyzer_lock:
+            self.__release_stale_models()
+            missing_languages = [lang for lang in dict.fromkeys(languages) if lang in constants.SUPPORTED_LANGUAGES and lang not in self.__available_text_analyzer]
+            if not missing_languages:
+                return
+
+            with ThreadPoolExecutor(max_workers=len(missing_languages)) as executor:
+                text_analyzers = executor.map(lambda lang: TextAnalyzer(lang, self.__options.single_parse, self.__title_checks + self.__text_checks, self.__sentence_cache, self.__metrics), missing_languages)
+                self.__available_text_analyzer.update(zip(missing_languages, text_analyzers, strict=True))
+
+    def __limit_memory(self) -> None:
+        """
+        Reloads the language models if their vocabularies or the memory of the process exceed the limits of the options.
+        Every new token text (e.g. ids, numbers and typos) adds a string to the vocabulary of a language model,
+        so the vocabularies of a long-running process grow without limit. The models are shared by all analyzers of the
+        process, so their vocabularies and the memory are counted once (see ModelRegistry).
+        """
+
+        max_new_strings = self.__options.max_new_strings
+        max_rss_mb = self.__options.max_rss_mb
+        if max_new_strings is not None and model_registry.get_new_string_count() > max_new_strings:
+            self.reload_models()
+            return
+        if max_rss_mb is not None:
+            rss_mb = get_rss_mb()
+            if rss_mb is not None and rss_mb > max(max_rss_mb, model_registry.get_rss_after_reload() + RSS_RELOAD_MARGIN_MB):
+                self.reload_models()
+
+    def reload_models(self) -> None:
+        """
+        Drops the language models of the process, their vocabularies and the checkers compiled against them. The models are
+        loaded again on first use, with fresh vocabularies and newly compiled matchers. Cached sentence findings and results
+        are kept. If another analyzer reloaded the models in the meantime, only the models of this analyzer are released.
+        """
+
+        with self.__text_analyzer_lock:
+            generation = self.__model_generation
+            if generation == model_registry.get_generation():
+                # the patterns in memory reference the dropped vocabularies, the serialized patterns are kept
+                pattern_cache.clear()
+            self.__drop_text_analyzers()
+            reloaded = model_registry.reload(generation)
+            self.__model_generation = model_registry.get_generation()
+        if reloaded:
+            self.__metrics.count("model_reloads")
+
+    def release_stale_models(self) -> None:
+        """
+        Releases the language models of this analyzer if another analyzer of the process reloaded them, so that the
+        dropped models are freed and not kept alongside the reloaded ones.
+        """
+
+        with self.__text_analyzer_lock:
+            self.__release_stale_models()
+
+    def __release_stale_models(self) -> None:
+        """
+        Releases the language models reloaded since they were loaded (see release_stale_models), with the lock held.
+        """
+
+        generation = model_registry.get_generation()
+        if generation != self.__model_generation:
+            self.__drop_text_analyzers()
+            self.__model_generation = generation
+
+    def __drop_text_analyzers(self) -> None:
+        """
+        Drops the text analyzers and the language detector holding the language models, with the lock held.
+        """
+
+        self.__available_text_analyzer.clear()
+        self.__language_detector = None
+
+    def analyze_workitem(self, workitem: WorkItem) -> None:
+        """
+        Analyzes all data from the given workitem (excluding id and language).
+
+        Parameters:
+            workitem (dict): A dictionary representing the workitem data.
+
+        """
+
+        self.__data.extend(result for result in self.analyze_batch([workitem]) if result is not None)
+
+    def analyze_workitems(self, workitems: Iterable[WorkItem], batch_size: int = constants.DEFAULT_BATCH_SIZE) -> Iterator[RequirementsInspectorResponseItem]:
+        """
+        Analyzes all data from the given workitems (excluding id and language) in batches.
+        In contrast to analyze_workitem the results are not collected, but returned in the order of the workitems.
+        Workitems of an unsupported language produce no result.
+
+        Parameters:
+            workitems (Iterable): The workitems to be analyzed.
+            batch_size (int): The number of workitems analyzed together.
+
+        Returns:
+            Iterator: The data frames (dictonary) with analyzed workitem information.
+
+        """
+
+        workitem_iterator = iter(workitems)
+        while batch := list(islice(workitem_iterator, batch_size)):
+            yield from (result for result in self.analyze_batch(batch, batch_size) if result is not None)
+
+    def analyze_batches(self, batches: Iterable[list[WorkItem]], batch_size: int = constants.DEFAULT_BATCH_SIZE) -> Iterator[list[RequirementsInspectorResponseItem]]:
+        """
+        Analyzes workitems already split into batches (see analyze_workitems). A batch may be empty.
+
+        Parameters:
+            batches (Iterable): The batches of workitems to be analyzed.
+            batch_size (int): The number of texts per batch of the language model.
+
+        Returns:
+            Iterator: Per batch, the data frames (dictonary) with analyzed workitem information.
+
+        """
+
+        for batch in batches:
+            yield [result for result in self.analyze_batch(batch, batch_size) if result is not None]
+
+    def get_cache_stats(self) -> CacheStats | None:
+        """
+        Returns the hit and miss statistics of the sentence cache.
+
+        Returns:
+            CacheStats: The statistics or None if the sentence cache is disabled.
+
+        """
+
+        return self.__sentence_cache.get_stats() if self.__sentence_cache is not None else None
+
+    def get_metrics(self) -> Metrics:
+        """
+        Returns the metrics of the analysis: the calls and durations of the stages (language_detection, sentencize, parse,
+        check.<check> per checker and analyze_batch) and the counters of workitems, cached_workitems, sentences and tokens.
+
+        Returns:
+            Metrics: The metrics, updated by further analyses.
+
+        """
+
+        return self.__metrics
+
+    def close(self) -> None:
+        """
+        Closes the result cache. The analyzer is not used afterwards.
+        """
+
+        if self.__result_cache is not None:
+            self.__result_cache.close()
+
+    def __enter__(self) -> Self:
+        return self
 
-        self.__data.append(data_frame)
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        self.close()
 
     def get_collected_data(self) -> list[RequirementsInspectorResponseItem]:
         """
@@ -0,0 +1,20 @@
+"""Fixtures shared by the tests."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from python_requirements_inspector import pattern_cache, text_processor, workitem_analyzer
+
+
+@pytest.fixture(autouse=True, scope="session")
+def pattern_cache_directory(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keeps the serialized patterns of the tests in a temporary directory instead of the user cache directory, also in worker processes."""
+    directory = tmp_path_factory.mktemp("pattern_cache")
+    test_cache = pattern_cache.PatternCache(directory)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(pattern_cache.CACHE_DIRECTORY_VARIABLE, str(directory))
+        monkeypatch.setattr(pattern_cache, "pattern_cache", test_cache)
+        monkeypatch.setattr(text_processor, "pattern_cache", test_cache)
+        monkeypatch.setattr(workitem_analyzer, "pattern_cache", test_cache)
+        yield
@@ -0,0 +1,110 @@
+"""Tests."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from python_requirements_inspector.async_analyzer import AsyncWorkitemAnalyzer
+from python_requirements_inspector.type_definitions import WorkItem
+from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
+
+TEST_DATA = [
+    WorkItem(id="test-123", description="I'm a description for testing with a weakword accordingly", title="I'm a title without a processword", language="en"),
+    WorkItem(id="test-234", description="Ich bin eine Beschreibung mit dem Weakword entsprechend.", title="Ich bin ein Titel ohne Processwort", language="de"),
+    WorkItem(id="test-345", description="I'm a description in an unsupported language", title="", language="fr"),
+    WorkItem(id="test-456", description="The system shall respond quickly.", title="Respond", language="en"),
+]
+
+
+async def _collect(results: AsyncIterator) -> list:
+    return [result async for result in results]
+
+
+async def _async_workitems() -> AsyncIterator[WorkItem]:
+    for workitem in TEST_DATA:
+        await asyncio.sleep(0)
+        yield workitem
+
+
+def test_async_analyzer_thread():
+    """
+    Test case for the AsyncWorkitemAnalyzer class analyzing workitems in a thread.
+    """
+    # init expected result
+    expected_results = list(WorkitemAnalyzer().analyze_workitems(TEST_DATA))
+
+    # run method
+    async def run() -> tuple:
+        async with AsyncWorkitemAnalyzer(batch_size=2) as analyzer:
+            single_results = await asyncio.gather(*(analyzer.analyze(workitem) for workitem in TEST_DATA))
+            stream_results = await _collect(analyzer.analyze_stream(TEST_DATA))
+            async_stream_results = await _collect(analyzer.analyze_stream(_async_workitems()))
+        return single_results, stream_results, async_stream_results
+
+    single_results, stream_results, async_stream_results = asyncio.run(run())
+
+    # check results
+    assert single_results == [expected_results[0], expected_results[1], None, expected_results[2]]
+    assert stream_results == expected_results
+    assert async_stream_results == expected_results
+
+
+def test_async_analyzer_process():
+    """
+    Test case for the AsyncWorkitemAnalyzer class analyzing workitems in worker processes.
+    """
+    # init expected result
+    expected_results = list(WorkitemAnalyzer().analyze_workitems(TEST_DATA))
+
+    # run method
+    async def run() -> tuple:
+        async with AsyncWorkitemAnalyzer(executor="process", workers=2, batch_size=1) as analyzer:
+            return await analyzer.analyze(TEST_DATA[0]), await _collect(analyzer.analyze_stream(TEST_DATA))
+
+    single_result, stream_results = asyncio.run(run())
+
+    # check results
+    assert single_result == expected_results[0]
+    assert stream_results == expected_results
+
+
+def test_async_analyzer_backpressure():
+    """
+    Test case for the AsyncWorkitemAnalyzer class reading workitems only as fast as the results are consumed.
+    """
+    read_workitems = []
+
+    def workitems() -> Iterator[WorkItem]:
+        for workitem in TEST_DATA:
+            read_workitems.append(workitem["id"])
+            yield workitem
+
+    # run method
+    async def run() -> int:
+        async with AsyncWorkitemAnalyzer(batch_size=1, max_pending=2) as analyzer:
+            results = analyzer.analyze_stream(workitems())
+            await anext(results)
+            read_after_first_result = len(read_workitems)
+            await results.aclose()
+        return read_after_first_result
+
+    # check results
+    # the first batch is returned while the second one is analyzed
+    assert asyncio.run(run()) == 2
+    # the remaining workitems are not read after the stream is closed
+    assert read_workitems == ["test-123", "test-234"]
+
+
+def test_async_analyzer_closed():
+    """
+    Test case for the AsyncWorkitemAnalyzer class rejecting workitems after it is closed.
+    """
+    analyzer = AsyncWorkitemAnalyzer()
+    analyzer.close()
+
+    # check results
+    with pytest.raises(RuntimeError, match="The analyzer is closed"):
+        asyncio.run(analyzer.analyze(TEST_DATA[0]))
+    with pytest.raises(ValueError, match="Unknown executor"):
+        AsyncWorkitemAnalyzer(executor="fiber")  # type: ignore[arg-type]
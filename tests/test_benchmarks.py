@@ -0,0 +1,87 @@
+"""Tests."""
+
+from benchmarks.compare import compare_results
+from benchmarks.corpus import CorpusGenerator, CorpusOptions
+from benchmarks.run import PASSIVE_SENTENCE_LENGTHS, BenchmarkRunner
+from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
+
+
+def test_corpus_generator():
+    """
+    Test case for the CorpusGenerator class generating a reproducible corpus with the given properties.
+    """
+    # init expected result
+    options = CorpusOptions(count=50, extra_fields=2, language_mix={"en": 1, "de": 1, "fr": 1}, seed=7)
+
+    # run method
+    workitems = list(CorpusGenerator(options).generate())
+
+    # check results
+    assert workitems == list(CorpusGenerator(options).generate())
+    assert workitems != list(CorpusGenerator(CorpusOptions(count=50, seed=8)).generate())
+    assert [workitem["id"] for workitem in workitems] == [f"REQ-{index}" for index in range(50)]
+    assert {workitem["language"] for workitem in workitems} == {"en", "de", "fr"}
+    assert all(workitem["extra0"] and workitem["extra1"] for workitem in workitems)
+    assert all(1 <= workitem["description"].count(".") <= options.max_sentences for workitem in workitems)
+
+
+def test_corpus_generator_findings():
+    """
+    Test case for the CorpusGenerator class controlling the weak word density and the passive ratio.
+    """
+    # init expected result
+    options = CorpusOptions(count=20, weak_word_density=0, passive_ratio=0, language_mix={"en": 1})
+    smelly_options = CorpusOptions(count=20, weak_word_density=0.5, passive_ratio=1, language_mix={"en": 1})
+
+    # run method
+    results = list(WorkitemAnalyzer().analyze_workitems(CorpusGenerator(options).generate()))
+    smelly_results = list(WorkitemAnalyzer().analyze_workitems(CorpusGenerator(smelly_options).generate()))
+
+    # check results
+    assert sum(result["smellWeakword"] for result in results) == 0
+    assert sum(result["smellWeakword"] for result in smelly_results) > 20
+    assert all("be" in workitem["description"].split() for workitem in CorpusGenerator(smelly_options).generate())
+
+
+def test_benchmark_passive_de():
+    """
+    Test case for the BenchmarkRunner class measuring the time per token of the German passive rule per sentence length.
+    """
+    # run method
+    results = BenchmarkRunner(CorpusOptions(count=1), repeat=1).run(["passive_de"])
+
+    # check results
+    assert list(results) == [f"passive.de.{length}_tokens" for length in PASSIVE_SENTENCE_LENGTHS]
+    assert all(measurement.value > 0 and measurement.unit == "us/token" and not measurement.higher_is_better for measurement in results.values())
+
+
+def test_compare_results():
+    """
+    Test case for the compare_results function flagging the changes in the worse direction beyond the threshold.
+    """
+    # init expected result
+    baseline = {
+        "results": {
+            "startup": {"value": 2.0, "unit": "s", "higher_is_better": False},
+            "cli.throughput": {"value": 100.0, "unit": "items/s", "higher_is_better": True},
+            "cli.peak_memory": {"value": 500.0, "unit": "MB", "higher_is_better": False},
+            "removed": {"value": 1.0, "unit": "s", "higher_is_better": False},
+        }
+    }
+    current = {
+        "results": {
+            "startup": {"value": 1.0, "unit": "s", "higher_is_better": False},
+            "cli.throughput": {"value": 80.0, "unit": "items/s", "higher_is_better": True},
+            "cli.peak_memory": {"value": 520.0, "unit": "MB", "higher_is_better": False},
+        }
+    }
+
+    # run method
+    comparisons = compare_results(baseline, current, threshold=0.1)
+
+    # check results
+    assert [(comparison.name, round(comparison.change, 2), comparison.regression) for comparison in comparisons] == [
+        ("startup", -0.5, False),
+        ("cli.throughput", -0.2, True),
+        ("cli.peak_memory", 0.04, False),
+    ]
@@ -0,0 +1,190 @@
+"""Tests."""
+
+import json
+import threading
+from collections.abc import Iterator
+from contextlib import chdir
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_requirements_inspector import daemon, main
+from python_requirements_inspector.type_definitions import AnalyzerOptions, FindingType, WorkItem
+from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
+
+TEST_DATA = [
+    WorkItem(id="test-123", description="I'm a description for testing with a weakword accordingly", title="I'm a title without a processword", language="en"),
+    WorkItem(id="test-234", description="Ich bin eine Beschreibung mit dem Weakword entsprechend.", title="Ich bin ein Titel ohne Processwort", language="de"),
+]
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Iterator[Path]:
+    """Runs a daemon in a thread and returns the path of its socket."""
+    path = tmp_path / "daemon.sock"
+    test_daemon = daemon.AnalysisDaemon(path)
+    thread = threading.Thread(target=test_daemon.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    test_daemon.shutdown()
+    test_daemon.server_close()
+    thread.join()
+
+
+def test_analyze_batches_in_daemon(socket_path: Path):
+    """
+    Test case for analyzing batches of workitems in the daemon.
+    """
+    options = AnalyzerOptions(checks=(FindingType.WEAKWORD,))
+
+    # init expected result
+    expected_result = list(WorkitemAnalyzer(options).analyze_batches([[TEST_DATA[0]], [], [TEST_DATA[1]]]))
+
+    # run method
+    connection = daemon.start_analysis_in_daemon(options, 8, socket_path)
+    assert connection is not None
+    result = list(daemon.analyze_batches_in_daemon(connection, [[TEST_DATA[0]], [], [TEST_DATA[1]]]))
+
+    # check results
+    assert result == expected_result
+
+
+def test_analyze_batches_in_daemon_error(socket_path: Path):
+    """
+    Test case for the daemon reporting an error to the client and serving the next client.
+    """
+    connection = daemon.start_analysis_in_daemon(AnalyzerOptions(), 8, socket_path)
+    assert connection is not None
+    with pytest.raises(daemon.DaemonError, match="AttributeError"):
+        list(daemon.analyze_batches_in_daemon(connection, [["not a workitem"]]))
+
+    connection = daemon.start_analysis_in_daemon(AnalyzerOptions(), 8, socket_path)
+    assert connection is not None
+    assert len(next(daemon.analyze_batches_in_daemon(connection, [TEST_DATA]))) == len(TEST_DATA)
+
+
+def test_start_analysis_in_daemon_fallback(socket_path: Path):
+    """
+    Test case for analyzing in the client process if the daemon runs another package version or serves another client.
+    """
+    # a daemon of another package version rejects the request
+    package_version = daemon.get_package_version
+    with patch.object(daemon, "get_package_version", side_effect=lambda name: "0.0.0" if threading.current_thread() is threading.main_thread() else package_version(name)):
+        assert daemon.start_analysis_in_daemon(AnalyzerOptions(), 8, socket_path) is None
+
+    # the daemon serves one client at a time, so a second client does not wait for it
+    connection = daemon.start_analysis_in_daemon(AnalyzerOptions(), 8, socket_path)
+    assert connection is not None
+    with patch.object(daemon, "ACCEPT_TIMEOUT", 0.2):
+        assert daemon.start_analysis_in_daemon(AnalyzerOptions(), 8, socket_path) is None
+    assert len(next(daemon.analyze_batches_in_daemon(connection, [TEST_DATA]))) == len(TEST_DATA)
+
+
+def test_main_with_daemon(socket_path: Path, tmp_path: Path, monkeypatch):
+    """
+    Test function for the main application logic forwarding the workitems to the daemon.
+    """
+
+    # write test data to json file
+    input_json_file = tmp_path / "input.json"
+    input_json_file.write_text(json.dumps(TEST_DATA), encoding="utf-8")
+
+    # execute main in this process and with the daemon
+    with chdir(tmp_path):
+        local_output_path = Path(main.main(input_json_file.name))
+        monkeypatch.setenv(daemon.SOCKET_PATH_VARIABLE, str(socket_path))
+        daemon_output_path = Path(main.main(input_json_file.name, use_daemon=True))
+
+    local_output = local_output_path.read_text(encoding="utf-8")
+    daemon_output = daemon_output_path.read_text(encoding="utf-8")
+
+    # delete json files
+    local_output_path.unlink()
+    daemon_output_path.unlink()
+
+    # both runs produce exactly the same output
+    assert daemon_output == local_output
+
+
+def test_daemon_socket(socket_path: Path, tmp_path: Path):
+    """
+    Test case for the socket of the daemon.
+    """
+    # a running daemon is not replaced
+    with pytest.raises(RuntimeError, match="already listening"):
+        daemon.AnalysisDaemon(socket_path)
+
+    # no daemon is listening on a missing socket
+    assert daemon.connect_to_daemon(tmp_path / "missing.sock") is None
+
+    # the socket of another user is not connected to
+    with patch.object(daemon.os, "getuid", return_value=socket_path.stat().st_uid + 1):
+        assert daemon.connect_to_daemon(socket_path) is None
+
+    # a socket left behind is replaced
+    stale_socket_path = tmp_path / "stale.sock"
+    stale_socket_path.touch()
+    stale_daemon = daemon.AnalysisDaemon(stale_socket_path)
+    assert stale_socket_path.stat().st_mode & 0o777 == 0o600
+    stale_daemon.server_close()
+    assert not stale_socket_path.exists()
+
+
+def test_default_socket_path(monkeypatch, tmp_path: Path):
+    """
+    Test case for the default path of the daemon socket.
+    """
+    monkeypatch.setenv(daemon.SOCKET_PATH_VARIABLE, str(tmp_path / "test.sock"))
+    assert daemon.get_default_socket_path() == tmp_path / "test.sock"
+
+    monkeypatch.delenv(daemon.SOCKET_PATH_VARIABLE)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert daemon.get_default_socket_path() == tmp_path / "python-requirements-inspector.sock"
+
+
+def test_analysis_daemon_memory_limits(tmp_path: Path):
+    """
+    Test case for the AnalysisDaemon class bounding the memory of its analyzers instead of the clients.
+    """
+    test_daemon = daemon.AnalysisDaemon(tmp_path / "daemon.sock", max_new_strings=1000)
+    client_options = AnalyzerOptions(checks=(FindingType.WEAKWORD,), max_rss_mb=100)
+
+    # run method
+    analyzer = test_daemon.get_analyzer(client_options)
+    shared_analyzer = test_daemon.get_analyzer(AnalyzerOptions(checks=(FindingType.WEAKWORD,)))
+    test_daemon.server_close()
+
+    # check results
+    assert analyzer is shared_analyzer
+    assert daemon._options_from_json(json.loads(json.dumps(daemon._options_to_json(client_options)))) == client_options
+
+
+def test_options_to_json_result_cache(tmp_path: Path):
+    """
+    Test case for sending the path of the result cache relative to the working directory of the client.
+    """
+    with chdir(tmp_path):
+        options = daemon._options_to_json(AnalyzerOptions(result_cache="cache.db"))
+
+    assert options["result_cache"] == str(tmp_path.resolve() / "cache.db")
+
+
+def test_analysis_daemon_max_analyzers(tmp_path: Path):
+    """
+    Test case for the AnalysisDaemon class closing the least recently used analyzer beyond the maximum number of analyzers.
+    """
+    test_daemon = daemon.AnalysisDaemon(tmp_path / "daemon.sock")
+    options = [AnalyzerOptions(language_sample_size=size) for size in range(1, daemon.MAX_ANALYZERS + 2)]
+
+    # run method
+    analyzers = [test_daemon.get_analyzer(option) for option in options[:-1]]
+    # the first analyzer is used again, so the second one is the least recently used
+    assert test_daemon.get_analyzer(options[0]) is analyzers[0]
+    test_daemon.get_analyzer(options[-1])
+
+    # check results
+    assert test_daemon.get_analyzer(options[0]) is analyzers[0]
+    assert test_daemon.get_analyzer(options[2]) is analyzers[2]
+    assert test_daemon.get_analyzer(options[1]) is not analyzers[1]
+    test_daemon.server_close()
@@ -0,0 +1,97 @@
+"""Tests."""
+
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+
+import pytest
+
+from python_requirements_inspector import http_server
+from python_requirements_inspector.type_definitions import WorkItem
+from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
+
+TEST_DATA = [
+    WorkItem(id="test-123", description="I'm a description for testing with a weakword accordingly", title="I'm a title without a processword", language="en"),
+    WorkItem(id="test-234", description="Ich bin eine Beschreibung mit dem Weakword entsprechend.", title="Ich bin ein Titel ohne Processwort", language="de"),
+    WorkItem(id="test-345", description="I'm a description in an unsupported language", title="", language="fr"),
+]
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    """Runs a warmed up server in a thread and returns its URL."""
+    server = http_server.AnalysisServer(("127.0.0.1", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.warm_up()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _request(url: str, body: bytes | None = None) -> tuple[int, object]:
+    """Sends a request and returns the status and the decoded body."""
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=body, method="POST" if body is not None else "GET")) as response:  # noqa: S310
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_analysis_server(server_url: str):
+    """
+    Test case for the AnalysisServer class analyzing posted workitems.
+    """
+    # init expected result
+    expected_results = list(WorkitemAnalyzer().analyze_workitems([WorkItem(**workitem) for workitem in TEST_DATA]))
+
+    # check results
+    assert _request(f"{server_url}/health") == (200, {"status": "ready"})
+    assert _request(f"{server_url}/analyze", json.dumps(TEST_DATA).encode()) == (200, expected_results)
+    assert _request(f"{server_url}/analyze", json.dumps(TEST_DATA[0]).encode()) == (200, expected_results[0])
+    # a workitem of an unsupported language has no result
+    assert _request(f"{server_url}/analyze", json.dumps(TEST_DATA[2]).encode()) == (422, {"error": "Unsupported language: fr"})
+
+    # the metrics count the analyzed workitems
+    with urllib.request.urlopen(f"{server_url}/metrics") as response:  # noqa: S310
+        assert "requirements_inspector_workitems_total" in response.read().decode()
+
+
+def test_analysis_server_errors(server_url: str):
+    """
+    Test case for the AnalysisServer class rejecting invalid requests.
+    """
+    assert _request(f"{server_url}/analyze", b"{invalid")[0] == 400
+    assert _request(f"{server_url}/analyze", b"[1, 2]") == (400, {"error": "Expecting a workitem or a list of workitems"})
+    assert _request(f"{server_url}/unknown")[0] == 404
+    assert _request(f"{server_url}/unknown", b"[]")[0] == 404
+
+    # an invalid Content-Length is rejected instead of failing or blocking the handler
+    for content_length in ["abc", "-1"]:
+        connection = http.client.HTTPConnection(server_url.removeprefix("http://"))
+        connection.putrequest("POST", "/analyze")
+        connection.putheader("Content-Length", content_length)
+        connection.endheaders()
+        response = connection.getresponse()
+        assert (response.status, json.loads(response.read())) == (400, {"error": "Invalid Content-Length"})
+        connection.close()
+
+
+def test_analysis_server_starting():
+    """
+    Test case for the AnalysisServer class reporting that it is not ready before the warm up.
+    """
+    server = http_server.AnalysisServer(("127.0.0.1", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    # check results
+    assert _request(f"http://127.0.0.1:{server.server_address[1]}/health") == (503, {"status": "starting"})
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
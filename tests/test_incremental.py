@@ -0,0 +1,81 @@
+"""Tests."""
+
+from python_requirements_inspector import incremental
+from python_requirements_inspector.fingerprint import get_ruleset_fingerprint
+from python_requirements_inspector.type_definitions import AnalyzerOptions, WorkItem
+from python_requirements_inspector.workitem_analyzer import WorkitemAnalyzer
+
+TEST_DATA = [
+    WorkItem(id="test-123", description="I'm a description for testing with a weakword accordingly", title="I'm a title without a processword", language="en"),
+    WorkItem(id="test-234", description="Ich bin eine Beschreibung mit dem Weakword entsprechend.", title="Ich bin ein Titel ohne Processwort", language="de"),
+    WorkItem(id="test-345", description="I'm a description in an unsupported language", title="", language="fr"),
+    WorkItem(id="test-456", description="I'm a description without findings", title="", language="en"),
+]
+
+
+def test_previous_results_lookahead():
+    """
+    Test case for the PreviousResults class finding results within the lookahead.
+    """
+    test_results = [{"id": f"test-{number}"} for number in range(5)]
+
+    # run method
+    previous_results = incremental.PreviousResults(test_results, lookahead=2)
+
+    # check results
+    # results read ahead are found out of order
+    assert previous_results.pop("test-2") == {"id": "test-2"}
+    assert previous_results.pop("test-1") == {"id": "test-1"}
+    # looking for an unknown result reads up to the lookahead, results far behind the last found one are forgotten
+    assert previous_results.pop("test-1") is None
+    assert previous_results.pop("test-0") is None
+    assert previous_results.pop("test-3") == {"id": "test-3"}
+    assert previous_results.pop("test-4") == {"id": "test-4"}
+
+
+def test_previous_results_new_workitem_first():
+    """
+    Test case for the PreviousResults class finding all results after a new workitem at the front of an export larger than the lookahead.
+    """
+    test_results = [{"id": f"test-{number}"} for number in range(30)]
+
+    # run method
+    previous_results = incremental.PreviousResults(test_results, lookahead=10)
+    new_result = previous_results.pop("test-new")
+    results = [previous_results.pop(f"test-{number}") for number in range(30)]
+
+    # check results
+    assert new_result is None
+    assert results == test_results
+
+
+def test_analyze_incrementally(monkeypatch):
+    """
+    Test case for analyzing only the new and changed workitems of a previous run.
+    """
+    # hold back only a few results, so that incomplete batches are analyzed
+    monkeypatch.setattr(incremental, "MAX_PENDING_RESULTS", 2)
+    options = AnalyzerOptions(content_hash=True)
+    analyzer = WorkitemAnalyzer(options)
+    previous_output = list(analyzer.analyze_workitems([WorkItem(**workitem) for workitem in TEST_DATA[:3]]))
+
+    # change the first workitem and add a new one
+    test_workitems = [{**TEST_DATA[0], "description": "I'm a changed description"}, *TEST_DATA[1:]]
+
+    # init expected result
+    expected_result = list(analyzer.analyze_workitems([WorkItem(**workitem) for workitem in test_workitems]))
+
+    # run method
+    analyzed_ids: list[str | None] = []
+
+    def analyze_batches(batches):
+        for batch in batches:
+            analyzed_ids.extend(workitem["id"] for workitem in batch)
+            yield from analyzer.analyze_batches([batch])
+
+    results = list(incremental.analyze_incrementally(test_workitems, incremental.PreviousResults(previous_output), get_ruleset_fingerprint(options), analyze_batches, 2))
+
+    # check results
+    assert results == expected_result
+    # the workitem without previous result (unsupported language) is analyzed again
+    assert analyzed_ids == ["test-123", "test-345", "test-456"]
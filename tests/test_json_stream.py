@@ -0,0 +1,110 @@
+"""Tests."""
+
+import io
+import json
+
+import pytest
+
+from python_requirements_inspector import json_stream
+from python_requirements_inspector.json_stream import JsonFormat
+
+TEST_ITEMS = [
+    {"id": "test-123", "title": "I'm a title", "description": 'A description with "quotes", [brackets] and {braces}'},
+    {"id": "test-234", "title": "Ich bin ein Titel", "description": "öüäß Beschreibung", "number": 12345},
+    [1, 2.5, None, True],
+    42,
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_read_json_array(chunk_size: int, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test reading the items of a JSON array with items spread over several read chunks.
+    """
+    monkeypatch.setattr(json_stream, "READ_CHUNK_SIZE", chunk_size)
+
+    result = list(json_stream.read_json_items(io.StringIO(json.dumps(TEST_ITEMS, indent=2)), JsonFormat.JSON))
+
+    assert result == TEST_ITEMS
+
+
+def test_read_json_array_empty():
+    """
+    Test reading an empty JSON array.
+    """
+    result = list(json_stream.read_json_items(io.StringIO(" [ ] \n"), JsonFormat.JSON))
+
+    assert result == []
+
+
+@pytest.mark.parametrize("malformed_json", ["{not json", "[{}", '[{"id": 1} {"id": 2}]', "[{}] []", "", "[{not json}]"])
+def test_read_json_array_malformed(malformed_json: str):
+    """
+    Test reading a malformed JSON array.
+    """
+    with pytest.raises(json.JSONDecodeError):
+        list(json_stream.read_json_items(io.StringIO(malformed_json), JsonFormat.JSON))
+
+
+def test_read_json_lines():
+    """
+    Test reading the items of a JSON Lines file, skipping empty lines.
+    """
+    json_lines = "\n".join(json.dumps(item) for item in TEST_ITEMS) + "\n\n"
+
+    result = list(json_stream.read_json_items(io.StringIO(json_lines), JsonFormat.JSON_LINES))
+
+    assert result == TEST_ITEMS
+
+
+@pytest.mark.parametrize("items", [TEST_ITEMS, []])
+def test_write_json_array(items: list):
+    """
+    Test writing items as a JSON array equal to json.dump.
+    """
+    output = io.StringIO()
+
+    writer = json_stream.JsonItemWriter(output, JsonFormat.JSON)
+    for item in items:
+        writer.write(item)
+    writer.close()
+
+    assert output.getvalue() == json.dumps(items)
+
+
+def test_write_json_lines():
+    """
+    Test writing items as JSON Lines.
+    """
+    output = io.StringIO()
+
+    writer = json_stream.JsonItemWriter(output, JsonFormat.JSON_LINES)
+    for item in TEST_ITEMS:
+        writer.write(item)
+    writer.close()
+
+    assert output.getvalue().splitlines() == [json.dumps(item) for item in TEST_ITEMS]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_read_json_array_large_items(chunk_size: int, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test decoding each item of a JSON array once, also if it spans many read chunks.
+    """
+    monkeypatch.setattr(json_stream, "READ_CHUNK_SIZE", chunk_size)
+    raw_decode = json.JSONDecoder.raw_decode
+    decode_calls = []
+
+    def counting_raw_decode(decoder: json.JSONDecoder, s: str, idx: int = 0) -> tuple:
+        decode_calls.append(idx)
+        return raw_decode(decoder, s, idx)
+
+    monkeypatch.setattr(json.JSONDecoder, "raw_decode", counting_raw_decode)
+    test_items = [{"id": "test-123", "description": 'A "quoted" \\ description ] } [ {' * 50, "items": [[1, {"a": []}]] * 20}, "a string ]}", -25000000000.0, {"id": "test-234"}, None]
+
+    # run method
+    result = list(json_stream.read_json_items(io.StringIO(json.dumps(test_items)), JsonFormat.JSON))
+
+    # check results
+    assert result == test_items
+    assert len(decode_calls) == len(test_items)
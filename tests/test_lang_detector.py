@@ -61,3 +61,43 @@ def test_lang_detector_text_none():
 
     result = lang_detector.LangDetector().detect_language(test_sentence_empty)
     assert result == expected_language
+
+
+def test_lang_detector_detect_bounded_sample():
+    """
+    Test case for the LangDetector class detecting the language of a long text from its start.
+    """
+    test_text = "Ich bin ein Text zur Erkennung von Deutsch als Sprache. " * 20 + "I am a long text for detecting english as language. " * 400
+
+    expected_language = constants.GERMAN
+
+    test_lang_detector = lang_detector.LangDetector(sample_size=500)
+    result = test_lang_detector.detect_language(test_text)
+
+    assert result == expected_language
+
+
+def test_lang_detector_sample_growth():
+    """
+    Test case for the LangDetector class using more of the text only while the detection is below the confidence.
+    """
+    test_text = "Ich bin ein Text zur Erkennung von Deutsch als Sprache. " * 100
+
+    # init expected result
+    expected_confident_sizes = [100]
+    expected_ambiguous_sizes = [100, 200, 400, 800]
+
+    # run method
+    sample_sizes = []
+    results = []
+    for confidence in [0.5, 1.1]:
+        test_lang_detector = lang_detector.LangDetector(sample_size=100, confidence=confidence)
+        nlp = test_lang_detector._LangDetector__nlp
+        test_lang_detector._LangDetector__nlp = lambda text, nlp=nlp: sample_sizes.append(len(text)) or nlp(text)
+        results.append(test_lang_detector.detect_language(test_text))
+
+    # check results
+    assert results == [constants.GERMAN, constants.GERMAN]
+    # the samples end before the first word exceeding the sample size
+    assert len(sample_sizes) == len(expected_confident_sizes) + len(expected_ambiguous_sizes)
+    assert all(size - 16 < sample_size <= size for sample_size, size in zip(sample_sizes, expected_confident_sizes + expected_ambiguous_sizes, strict=True))
@@ -1,5 +1,7 @@
 """Tests."""
 
+import argparse
+import csv
 import json
 import sys
 import tempfile
@@ -9,8 +11,10 @@ from unittest.mock import patch
 
 import pytest
 
-from python_requirements_inspector import main
-from python_requirements_inspector.type_definitions import WorkItem
+from python_requirements_inspector import constants, main
+from python_requirements_inspector.json_stream import JsonFormat
+from python_requirements_inspector.result_writer import OutputFormat
+from python_requirements_inspector.type_definitions import AnalyzerOptions, FindingType, WorkItem
 
 TEST_DATA = [
     WorkItem(
@@ -56,6 +60,188 @@ def test_main():
     assert "öüäß" in output_data[1]["smellDescription"]
 
 
+def test_main_workers(tmp_path: Path):
+    """
+    Test function for the main application logic with multiple worker processes.
+    """
+
+    # write test data with an additional field to a json file
+    test_data = [*TEST_DATA, {**TEST_DATA[0], "id": "test-345", "testfield": "I'm a customfield with a weakword automatically"}]
+    input_json_file = tmp_path / "input.json"
+    input_json_file.write_text(json.dumps(test_data), encoding="utf-8")
+
+    # execute main serially and with worker processes
+    with chdir(tmp_path):
+        serial_output_path = Path(main.main(input_json_file.name))
+        parallel_output_path = Path(main.main(input_json_file.name, batch_size=1, workers=2))
+
+    serial_output = serial_output_path.read_text(encoding="utf-8")
+    parallel_output = parallel_output_path.read_text(encoding="utf-8")
+
+    # delete json files
+    serial_output_path.unlink()
+    parallel_output_path.unlink()
+
+    # both runs produce exactly the same output
+    assert parallel_output == serial_output
+    assert [item["id"] for item in json.loads(parallel_output)] == ["test-123", "test-234", "test-345"]
+
+
+def test_main_json_lines(tmp_path: Path):
+    """
+    Test function for the main application logic with JSON Lines input and output.
+    """
+
+    # write test data to a json lines file
+    input_jsonl_file = tmp_path / "input.jsonl"
+    input_jsonl_file.write_text("".join(json.dumps(workitem) + "\n" for workitem in TEST_DATA), encoding="utf-8")
+
+    # execute main with json lines file
+    with chdir(tmp_path):
+        output_file_path = Path(main.main(input_jsonl_file.name, input_format=JsonFormat.JSON_LINES, output_format=JsonFormat.JSON_LINES))
+
+    # read output json lines file
+    output_data = [json.loads(line) for line in output_file_path.read_text(encoding="utf-8").splitlines()]
+    output_file_path.unlink()
+
+    # check if outfile has a line per data set
+    assert output_file_path.suffix == ".jsonl"
+    assert [item["id"] for item in output_data] == ["test-123", "test-234"]
+    assert "öüäß" in output_data[1]["smellDescription"]
+
+
+def test_main_csv(tmp_path: Path):
+    """
+    Test function for the main application logic with sparse CSV output without descriptions.
+    """
+
+    # write test data to json file
+    input_json_file = tmp_path / "input.json"
+    input_json_file.write_text(json.dumps(TEST_DATA), encoding="utf-8")
+
+    # execute main with csv output
+    with chdir(tmp_path):
+        output_file_path = Path(main.main(input_json_file.name, output_format=OutputFormat.CSV, sparse=True, descriptions=False))
+        with pytest.raises(ValueError, match="JSON output"):
+            main.main(input_json_file.name, output_format=OutputFormat.CSV, previous=output_file_path.name)
+
+    # read output csv file
+    with output_file_path.open(encoding="utf-8", newline="") as output_csv_file:
+        output_data = list(csv.DictReader(output_csv_file))
+    output_file_path.unlink()
+
+    # both workitems have findings, the descriptions are left out
+    assert output_file_path.suffix == ".csv"
+    assert [item["id"] for item in output_data] == ["test-123", "test-234"]
+    assert "smellDescription" not in output_data[0]
+
+
+def test_main_result_cache(tmp_path: Path):
+    """
+    Test function for the main application logic with a result cache exported after the run.
+    """
+
+    # write test data to json file
+    input_json_file = tmp_path / "input.json"
+    input_json_file.write_text(json.dumps(TEST_DATA), encoding="utf-8")
+    options = AnalyzerOptions(result_cache=str(tmp_path / "cache.sqlite"))
+
+    # execute main twice with the same cache
+    with chdir(tmp_path):
+        first_output_path = Path(main.main(input_json_file.name, options, cache_export=str(tmp_path / "export.sqlite")))
+        cached_output_path = Path(main.main(input_json_file.name, AnalyzerOptions(result_cache=str(tmp_path / "export.sqlite"))))
+
+    first_output = first_output_path.read_text(encoding="utf-8")
+    cached_output = cached_output_path.read_text(encoding="utf-8")
+
+    # delete json files
+    first_output_path.unlink()
+    cached_output_path.unlink()
+
+    # the run with the exported cache produces the same output
+    assert cached_output == first_output
+
+
+def test_main_previous(tmp_path: Path):
+    """
+    Test function for the main application logic analyzing only the workitems changed since a previous run.
+    """
+
+    # write test data to json file
+    input_json_file = tmp_path / "input.json"
+    input_json_file.write_text(json.dumps(TEST_DATA), encoding="utf-8")
+
+    # execute main again with the output of the first run
+    with chdir(tmp_path):
+        previous_output_path = Path(main.main(input_json_file.name, AnalyzerOptions(content_hash=True)))
+        previous_copy = tmp_path / "previous.json"
+        previous_copy.write_text(previous_output_path.read_text(encoding="utf-8"), encoding="utf-8")
+        incremental_output_path = Path(main.main(input_json_file.name, previous=previous_copy.name))
+        # previous output without descriptions or without content hashes is analyzed again
+        without_descriptions_path = Path(main.main(input_json_file.name, AnalyzerOptions(content_hash=True), descriptions=False))
+        previous_copy.write_text(without_descriptions_path.read_text(encoding="utf-8"), encoding="utf-8")
+        reanalyzed_output_path = Path(main.main(input_json_file.name, previous=previous_copy.name))
+        without_hashes_path = Path(main.main(input_json_file.name))
+        previous_copy.write_text(without_hashes_path.read_text(encoding="utf-8"), encoding="utf-8")
+        reanalyzed_without_hashes_path = Path(main.main(input_json_file.name, previous=previous_copy.name))
+        with pytest.raises(ValueError, match="all results and descriptions"):
+            main.main(input_json_file.name, previous=previous_copy.name, sparse=True)
+
+    previous_output = previous_output_path.read_text(encoding="utf-8")
+    incremental_output = incremental_output_path.read_text(encoding="utf-8")
+    reanalyzed_output = reanalyzed_output_path.read_text(encoding="utf-8")
+    without_hashes_output = without_hashes_path.read_text(encoding="utf-8")
+    reanalyzed_without_hashes_output = reanalyzed_without_hashes_path.read_text(encoding="utf-8")
+
+    # delete json files
+    for output_path in (previous_output_path, incremental_output_path, without_descriptions_path, reanalyzed_output_path, without_hashes_path, reanalyzed_without_hashes_path):
+        output_path.unlink()
+
+    # the results are copied forward
+    assert incremental_output == previous_output
+    assert all(item["contentHash"] for item in json.loads(incremental_output))
+    assert reanalyzed_output == previous_output
+    assert reanalyzed_without_hashes_output == previous_output
+    # the results have the fields of the default output and the content hash
+    assert all(list(item) == [*constants.INITIALIZED_DATA_FRAME, "contentHash"] for item in json.loads(previous_output))
+    assert all(list(item) == list(constants.INITIALIZED_DATA_FRAME) for item in json.loads(without_hashes_output))
+
+
+def test_run_metrics(tmp_path: Path):
+    """
+    Test function for the command-line entry point writing the metrics of the run.
+    """
+
+    # write test data to json file
+    input_json_file = tmp_path / "input.json"
+    input_json_file.write_text(json.dumps(TEST_DATA), encoding="utf-8")
+
+    # execute the entry point with metrics in both formats
+    with chdir(tmp_path), patch.object(sys, "argv", ["inspect-requirements", input_json_file.name, "--metrics", "metrics.json"]), patch("builtins.print") as print_mock:
+        main.run()
+    with chdir(tmp_path), patch.object(sys, "argv", ["inspect-requirements", input_json_file.name, "--metrics", "metrics.prom", "--metrics-format", "prometheus"]), patch("builtins.print"):
+        main.run()
+
+    Path(print_mock.call_args.args[0]).unlink()
+    metrics = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+
+    # the stages of the analysis and of the input and output are recorded
+    assert metrics["counters"]["workitems"] == 2
+    assert {"input", "output", "analyze_batch", "parse", "sentencize", "check.weakword"} <= set(metrics["stages"])
+    assert metrics["stages"]["output"]["count"] == 2
+    assert "requirements_inspector_workitems_total 2" in (tmp_path / "metrics.prom").read_text(encoding="utf-8")
+
+
+def test_check_list():
+    """
+    Test function for parsing the checks of the command line.
+    """
+    assert main.check_list("weakword, Complex") == (FindingType.WEAKWORD, FindingType.COMPLEX)
+
+    with pytest.raises(argparse.ArgumentTypeError, match="unknown check 'unknown'"):
+        main.check_list("weakword,unknown")
+
+
 def test_main_non_relative_path(tmp_path: Path):
     """
     Test function for the main application logic when the input path is absolute and outside the cwd.
@@ -0,0 +1,85 @@
+"""Tests."""
+
+import json
+
+import pytest
+
+from python_requirements_inspector.metrics import LATENCY_BUCKETS, Metrics
+
+
+def test_metrics_record():
+    """
+    Test case for the Metrics class recording the calls of stages in latency histograms.
+    """
+    metrics = Metrics()
+
+    # run method
+    metrics.record("parse", 0.0002)
+    metrics.record("parse", 0.02)
+    metrics.record("parse", 10)
+    with metrics.time("output"):
+        pass
+    metrics.count("sentences", 3)
+    metrics.count("sentences")
+
+    # check results
+    parse_stats = metrics.get_stage_stats("parse")
+    assert parse_stats is not None
+    assert parse_stats.count == 3
+    assert parse_stats.total_seconds == pytest.approx(10.0202)
+    assert parse_stats.bucket_counts == [0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+    assert metrics.get_stage_stats("output").count == 1
+    assert metrics.get_stage_stats("unknown") is None
+    assert metrics.get_counter("sentences") == 4
+    assert metrics.get_counter("tokens") == 0
+
+    metrics.reset()
+    assert metrics.get_stage_stats("parse") is None
+    assert metrics.get_counter("sentences") == 0
+
+
+def test_metrics_time_iterator():
+    """
+    Test case for the Metrics class recording the time of a lazy iterable as one call.
+    """
+    metrics = Metrics()
+
+    # run method
+    items = list(metrics.time_iterator("input", iter([1, 2, 3])))
+    closed_iterator = metrics.time_iterator("sentencize", iter([1, 2, 3]))
+    next(closed_iterator)
+    closed_iterator.close()
+
+    # check results
+    assert items == [1, 2, 3]
+    assert metrics.get_stage_stats("input").count == 1
+    assert metrics.get_stage_stats("sentencize").count == 1
+
+
+def test_metrics_formats():
+    """
+    Test case for the Metrics class writing the metrics as JSON and in the Prometheus text format.
+    """
+    metrics = Metrics()
+    metrics.record("check.passive", 0.003)
+    metrics.record("check.passive", 0.3)
+    metrics.count("workitems", 2)
+
+    # init expected result
+    expected_buckets = {"0.0001": 0, "0.0005": 0, "0.001": 0, "0.005": 1, "0.01": 1, "0.05": 1, "0.1": 1, "0.5": 2, "1.0": 2, "5.0": 2, "+Inf": 2}
+
+    # run method
+    metrics_json = json.loads(metrics.to_json())
+    prometheus_lines = metrics.to_prometheus().splitlines()
+
+    # check results
+    assert metrics_json["stages"]["check.passive"]["total_seconds"] == pytest.approx(0.303)
+    assert metrics_json["stages"]["check.passive"]["buckets"] == expected_buckets
+    assert metrics_json["stages"]["check.passive"]["count"] == 2
+    assert metrics_json["counters"] == {"workitems": 2}
+    assert len(expected_buckets) == len(LATENCY_BUCKETS)
+    assert 'requirements_inspector_stage_seconds_bucket{stage="check.passive",le="0.005"} 1' in prometheus_lines
+    assert 'requirements_inspector_stage_seconds_bucket{stage="check.passive",le="+Inf"} 2' in prometheus_lines
+    assert 'requirements_inspector_stage_seconds_count{stage="check.passive"} 2' in prometheus_lines
+    assert "# TYPE requirements_inspector_workitems_total counter" in prometheus_lines
+    assert "requirements_inspector_workitems_total 2" in prometheus_lines
@@ -0,0 +1,103 @@
+"""Tests."""
+
+import threading
+
+import pytest
+
+from python_requirements_inspector import micro_batcher
+from python_requirements_inspector.type_definitions import WorkItem
+
+
+class RecordingAnalyzer:
+    """An analyzer recording the batches, failing for workitems without id."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[WorkItem]] = []
+
+    def analyze_batch(self, workitems: list[WorkItem], batch_size: int) -> list:
+        self.batches.append(workitems)
+        if any(workitem.get("id") is None for workitem in workitems):
+            raise ValueError("missing id")
+        return [{"id": workitem["id"]} for workitem in workitems]
+
+
+def test_micro_batcher():
+    """
+    Test case for the MicroBatcher class analyzing concurrent requests together.
+    """
+    analyzer = RecordingAnalyzer()
+    batcher = micro_batcher.MicroBatcher(analyzer, max_batch_size=4, max_wait=0.5)
+
+    # run method
+    futures = [batcher.submit([{"id": "1"}]), batcher.submit([{"id": "2"}, {"id": "3"}]), batcher.submit([{"id": "4"}]), batcher.submit([{"id": "5"}])]
+    batcher.close()
+
+    # check results
+    assert [future.result() for future in futures] == [[{"id": "1"}], [{"id": "2"}, {"id": "3"}], [{"id": "4"}], [{"id": "5"}]]
+    # the batch is analyzed when it reaches the maximum batch size
+    assert [len(batch) for batch in analyzer.batches] == [4, 1]
+
+
+def test_micro_batcher_max_batch_size():
+    """
+    Test case for the MicroBatcher class leaving a request exceeding the maximum batch size for the next batch.
+    """
+    analyzer = RecordingAnalyzer()
+    batcher = micro_batcher.MicroBatcher(analyzer, max_batch_size=4, max_wait=0.5)
+
+    # run method
+    futures = [batcher.submit([{"id": "1"}, {"id": "2"}, {"id": "3"}]), batcher.submit([{"id": "4"}, {"id": "5"}]), batcher.submit([{"id": "6"}])]
+    batcher.close()
+
+    # check results
+    assert [future.result() for future in futures] == [[{"id": "1"}, {"id": "2"}, {"id": "3"}], [{"id": "4"}, {"id": "5"}], [{"id": "6"}]]
+    assert [len(batch) for batch in analyzer.batches] == [3, 3]
+
+
+def test_micro_batcher_failing_request():
+    """
+    Test case for the MicroBatcher class isolating a failing request from the requests analyzed together.
+    """
+    analyzer = RecordingAnalyzer()
+    batcher = micro_batcher.MicroBatcher(analyzer, max_batch_size=4, max_wait=0.5)
+
+    # run method
+    valid_future = batcher.submit([{"id": "1"}])
+    invalid_future = batcher.submit([{"id": None}])
+    batcher.close()
+
+    # check results
+    assert valid_future.result() == [{"id": "1"}]
+    with pytest.raises(ValueError, match="missing id"):
+        invalid_future.result()
+
+
+def test_micro_batcher_cancelled_request():
+    """
+    Test case for the MicroBatcher class skipping a request cancelled while waiting.
+    """
+    analyzer = RecordingAnalyzer()
+    analysis_started = threading.Event()
+    release_analysis = threading.Event()
+    analyze_batch = analyzer.analyze_batch
+
+    def blocking_analyze_batch(workitems: list[WorkItem], batch_size: int) -> list:
+        analysis_started.set()
+        release_analysis.wait()
+        return analyze_batch(workitems, batch_size)
+
+    analyzer.analyze_batch = blocking_analyze_batch  # type: ignore[method-assign]
+    batcher = micro_batcher.MicroBatcher(analyzer, max_batch_size=1, max_wait=0)
+
+    # run method
+    first_future = batcher.submit([{"id": "1"}])
+    analysis_started.wait()
+    cancelled_future = batcher.submit([{"id": "2"}])
+    cancelled = cancelled_future.cancel()
+    release_analysis.set()
+    batcher.close()
+
+    # check results
+    assert cancelled
+    assert first_future.result() == [{"id": "1"}]
+    assert analyzer.batches == [[{"id": "1"}]]
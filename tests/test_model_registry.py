@@ -0,0 +1,87 @@
+"""Tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import spacy
+
+from python_requirements_inspector import constants, model_registry, text_processor
+
+
+def _save_blank_model(path: Path) -> str:
+    """Saves a blank English model with a sentencizer and returns its path."""
+    nlp = spacy.blank(constants.ENGLISH)
+    nlp.add_pipe("sentencizer")
+    nlp.to_disk(path)
+    return str(path)
+
+
+def test_model_registry_shares_model(tmp_path: Path):
+    """
+    Test case for the ModelRegistry class returning the same model for the same configuration.
+    """
+    model_path = _save_blank_model(tmp_path / "model")
+    test_registry = model_registry.ModelRegistry()
+
+    # load the model concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: test_registry.load(model_path), range(8)))
+
+    # the model is loaded only once
+    assert all(result is results[0] for result in results)
+
+
+def test_model_registry_configuration(tmp_path: Path):
+    """
+    Test case for the ModelRegistry class loading a model per configuration.
+    """
+    model_path = _save_blank_model(tmp_path / "model")
+    test_registry = model_registry.ModelRegistry()
+
+    full_model = test_registry.load(model_path)
+    reduced_model = test_registry.load(model_path, exclude=["sentencizer"])
+
+    # each configuration has its own model
+    assert full_model is not reduced_model
+    assert full_model.pipe_names == ["sentencizer"]
+    assert reduced_model.pipe_names == []
+    assert test_registry.load(model_path, exclude=("sentencizer", "sentencizer")) is reduced_model
+
+    # a cleared registry loads the model again
+    test_registry.clear()
+    assert test_registry.load(model_path) is not full_model
+
+
+def test_text_processors_share_model():
+    """
+    Test case for TextProcessor instances of the same language sharing the language model.
+    """
+    first_processor = text_processor.TextProcessor(constants.ENGLISH)
+    second_processor = text_processor.TextProcessor(constants.ENGLISH)
+
+    assert first_processor.get_vocab() is second_processor.get_vocab()
+
+
+def test_model_registry_reload(tmp_path: Path):
+    """
+    Test case for the ModelRegistry class counting the new strings once per shared model and reloading the models once.
+    """
+    model_path = _save_blank_model(tmp_path / "model")
+    test_registry = model_registry.ModelRegistry()
+
+    full_model = test_registry.load(model_path)
+    reduced_model = test_registry.load(model_path, exclude=["sentencizer"])
+    loaded_string_count = len(full_model.vocab.strings)
+    full_model("first new")
+    test_registry.load(model_path)("second")
+    generation = test_registry.get_generation()
+
+    # the strings of both users of the shared model are counted once
+    assert test_registry.get_new_string_count() == len(full_model.vocab.strings) - loaded_string_count > 0
+    # users noticing the limit concurrently reload the models only once
+    assert test_registry.reload(generation)
+    assert not test_registry.reload(generation)
+    assert test_registry.get_generation() == generation + 1
+    assert test_registry.get_new_string_count() == 0
+    assert test_registry.load(model_path) is not full_model
+    assert test_registry.load(model_path, exclude=["sentencizer"]) is not reduced_model
@@ -0,0 +1,88 @@
+"""Tests."""
+
+import pytest
+from spacy.matcher import Matcher
+from spacy.tokens import Doc
+
+from python_requirements_inspector import constants
+from python_requirements_inspector.checkers.passive_checker import PassiveChecker
+from python_requirements_inspector.text_processor import TextProcessor
+
+# German sentences with STTS tags, the number of passive constructions they contain and the spans of the constructions
+PASSIVE_CORPUS_DE = [
+    ("Dies ist ein Analysetext , der im Passiv geschrieben ist .", "PDS VAFIN ART NN $, PRELS APPRART NN VVPP VAFIN $.", 1, " [8:10]"),
+    ("Damit es möglich ist , wird eine Bewegungserlaubnis benötigt .", "KOUS PPER ADJD VAFIN $, VAFIN ART NN VVPP $.", 1, " [5:9]"),
+    ("Das System hat die Daten gespeichert .", "ART NN VAFIN ART NN VVPP $.", 0, ""),
+    ("Die Daten werden vom System gespeichert .", "ART NN VAFIN APPRART NN VVPP $.", 1, " [2:6]"),
+    ("Die Meldung wird angezeigt und das Signal wird geprüft .", "ART NN VAFIN VVPP KON ART NN VAFIN VVPP $.", 2, " [2:4] [7:9]"),
+    ("Der Bediener ist für die Konfiguration zuständig .", "ART NN VAFIN APPR ART NN ADJD $.", 0, ""),
+    (", weil die Unterlagen zu erstellen sind .", "$, KOUS ART NN PTKZU VVINF VAFIN $.", 1, " [4:7]"),
+    (
+        "Die Position des Zuges wurde bei jeder Fahrt im gesamten Netz der Schweizerischen Bundesbahnen ohne manuellen Eingriff aufgezeichnet .",
+        "ART NN ART NN VAFIN APPR PIAT NN APPRART ADJA NN ART ADJA NN APPR ADJA NN VVPP $.",
+        1,
+        " [4:18]",
+    ),
+    ("Das Protokoll wird , falls ein Fehler auftritt , gespeichert .", "ART NN VAFIN $, KOUS ART NN VVFIN $, VVPP $.", 1, " [2:10]"),
+    ("Das System muss geprüft werden .", "ART NN VMFIN VVPP VAINF $.", 1, " [3:5]"),
+    ("Der Zug ist angekommen .", "ART NN VAFIN VVPP $.", 0, ""),
+    ("Die Daten wurden gestern übertragen und werden morgen gelöscht .", "ART NN VAFIN ADV VVPP KON VAFIN ADV VVPP $.", 2, " [2:5] [6:9]"),
+    ("Der Benutzer kann die Anwendung starten .", "ART NN VMFIN ART NN VVINF $.", 0, ""),
+    ("Das Signal ist ungültig , wenn der Sensor ausfällt .", "ART NN VAFIN ADJD $, KOUS ART NN VVFIN $.", 0, ""),
+    ("Der Bediener ist zuständig und der Techniker prüft die Anlage .", "ART NN VAFIN ADJD KON ART NN VVFIN ART NN $.", 0, ""),
+]
+
+# the perfect of verbs of motion is formed with "sein" and has the tags of a passive
+KNOWN_FALSE_POSITIVES_DE = {"Der Zug ist angekommen ."}
+
+# the German passive rule before the window of the auxiliary was bounded by its clause
+UNBOUNDED_PASSIVE_RULE_DE = [
+    [{"TAG": "VAFIN"}, {"OP": "*"}, {"TAG": {"IN": ["VVPP", "VVFIN"]}}],
+    [{"TAG": "PTKZU"}, {"TAG": "VVINF"}, {"TAG": "VAFIN"}],
+]
+
+
+def get_precision_and_recall(counts: list[int]) -> tuple[float, float]:
+    true_positives = sum(min(count, expected_count) for count, (_, _, expected_count, _) in zip(counts, PASSIVE_CORPUS_DE, strict=True))
+    return true_positives / sum(counts), true_positives / sum(expected_count for _, _, expected_count, _ in PASSIVE_CORPUS_DE)
+
+
+@pytest.mark.parametrize(
+    ("words", "tags", "expected_count", "expected_spans"),
+    [pytest.param(*row, marks=pytest.mark.xfail(reason="known false positive", strict=True)) if row[0] in KNOWN_FALSE_POSITIVES_DE else row for row in PASSIVE_CORPUS_DE],
+)
+def test_passive_checker_corpus_de(words: str, tags: str, expected_count: int, expected_spans: str):
+    """
+    Test case for the PassiveChecker class finding the labeled passive constructions of a tagged German corpus, at their spans.
+    """
+
+    # init expected result
+    text_processor = TextProcessor(constants.GERMAN)
+    sent = Doc(text_processor.get_vocab(), words=words.split(), tags=tags.split())[:]
+
+    # run method
+    result = PassiveChecker(text_processor).check_sentence(sent)
+
+    # check results
+    assert result == (expected_count, expected_spans)
+
+
+def test_passive_checker_corpus_de_unbounded():
+    """
+    Test case for the PassiveChecker class on a tagged German corpus: the clause window is more precise than the unbounded rule, and at least as complete.
+    """
+
+    # init expected result
+    text_processor = TextProcessor(constants.GERMAN)
+    sents = [Doc(text_processor.get_vocab(), words=words.split(), tags=tags.split())[:] for words, tags, _, _ in PASSIVE_CORPUS_DE]
+    unbounded_matcher = Matcher(text_processor.get_vocab())
+    unbounded_matcher.add("Passive", UNBOUNDED_PASSIVE_RULE_DE)
+    unbounded_precision, unbounded_recall = get_precision_and_recall([len(unbounded_matcher(sent)) for sent in sents])
+
+    # run method
+    checker = PassiveChecker(text_processor)
+    precision, recall = get_precision_and_recall([checker.check_sentence(sent)[0] for sent in sents])
+
+    # check results
+    assert precision > unbounded_precision
+    assert recall >= unbounded_recall
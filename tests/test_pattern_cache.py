@@ -0,0 +1,109 @@
+"""Tests."""
+
+from pathlib import Path
+
+import pytest
+
+from python_requirements_inspector import constants, pattern_cache, text_processor
+from python_requirements_inspector.checkers.weak_word_checker import weak_word_list_de
+
+# Words with several tokens, umlauts and inflected forms
+TEST_WORDS = weak_word_list_de[:20]
+
+
+def _fail() -> list:
+    """Fails when patterns are created although they are cached."""
+    pytest.fail("patterns are created again")
+
+
+def test_pattern_cache_serialization(tmp_path: Path):
+    """
+    Test case for the PatternCache class loading serialized patterns instead of creating them again.
+    """
+    test_processor = text_processor.TextProcessor(constants.ENGLISH)
+    vocab = test_processor.get_vocab()
+    created_patterns = [test_processor.lemmatize_doc(test_processor.tokenize("similar to"))]
+
+    # run method
+    test_cache = pattern_cache.PatternCache(tmp_path)
+    patterns = test_cache.load(["test", 1], vocab, lambda: created_patterns)
+
+    # check results
+    # the patterns are kept in memory and on disk
+    assert patterns is created_patterns
+    assert test_cache.load(["test", 1], vocab, _fail) is created_patterns
+    assert [doc.text for doc in pattern_cache.PatternCache(tmp_path).load(["test", 1], vocab, _fail)] == [doc.text for doc in created_patterns]
+    # another key creates other patterns
+    assert pattern_cache.PatternCache(tmp_path).load(["test", 2], vocab, list) == []
+
+
+def test_pattern_cache_format_version(monkeypatch, tmp_path: Path):
+    """
+    Test case for the PatternCache class creating the patterns again after the pattern format changed.
+    """
+    test_processor = text_processor.TextProcessor(constants.ENGLISH)
+    vocab = test_processor.get_vocab()
+    pattern_cache.PatternCache(tmp_path).load(["test", 1], vocab, lambda: [test_processor.tokenize("similar to")])
+
+    # run method
+    monkeypatch.setattr(pattern_cache, "PATTERN_FORMAT_VERSION", pattern_cache.PATTERN_FORMAT_VERSION + 1)
+    patterns = pattern_cache.PatternCache(tmp_path).load(["test", 1], vocab, list)
+
+    # check results
+    assert patterns == []
+
+
+def test_pattern_cache_failed_write(monkeypatch, tmp_path: Path):
+    """
+    Test case for the PatternCache class removing the temporary file of a failed write.
+    """
+    test_processor = text_processor.TextProcessor(constants.ENGLISH)
+    created_patterns = [test_processor.tokenize("similar to")]
+
+    def fail_replace(self: Path, target: Path) -> Path:
+        raise PermissionError(target)
+
+    # run method
+    monkeypatch.setattr(Path, "replace", fail_replace)
+    patterns = pattern_cache.PatternCache(tmp_path).load(["test", 1], test_processor.get_vocab(), lambda: created_patterns)
+
+    # check results
+    assert patterns is created_patterns
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_pattern_cache_directory(monkeypatch, tmp_path: Path):
+    """
+    Test case for the directory of the pattern cache.
+    """
+    monkeypatch.setenv(pattern_cache.CACHE_DIRECTORY_VARIABLE, str(tmp_path))
+    assert pattern_cache.get_default_directory() == tmp_path
+
+    # an empty directory keeps the patterns in memory only
+    monkeypatch.setenv(pattern_cache.CACHE_DIRECTORY_VARIABLE, "")
+    assert pattern_cache.get_default_directory() is None
+
+    monkeypatch.delenv(pattern_cache.CACHE_DIRECTORY_VARIABLE)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert pattern_cache.get_default_directory() == tmp_path / "python-requirements-inspector"
+
+
+def test_get_lemma_patterns(monkeypatch, tmp_path: Path):
+    """
+    Test case for the batched lemma patterns being equal to the patterns of each single word.
+    """
+    monkeypatch.setattr(text_processor, "pattern_cache", pattern_cache.PatternCache(tmp_path))
+    test_processor = text_processor.TextProcessor(constants.GERMAN)
+
+    # init expected result
+    expected_patterns = []
+    for word in TEST_WORDS:
+        name = " ".join(token.text for token in test_processor.tokenize(word.lower())).strip()
+        expected_patterns.append(test_processor.lemmatize_doc(test_processor.tokenize(name)).text)
+
+    # run method
+    patterns = test_processor.get_lemma_patterns(TEST_WORDS)
+
+    # check results
+    assert [doc.text for doc in patterns] == expected_patterns
+    assert len(list(tmp_path.glob("*.spacy"))) == 1
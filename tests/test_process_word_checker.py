@@ -0,0 +1,35 @@
+"""Tests."""
+
+import pytest
+
+from python_requirements_inspector import constants
+from python_requirements_inspector.checkers.process_word_checker import ProcessWordChecker
+from python_requirements_inspector.text_processor import TextProcessor
+
+
+@pytest.mark.parametrize(
+    ("text", "expected_result"),
+    [
+        ("DATEN ANZEIGEN", (1, " anzeigen")),
+        ("Daten Anzeigen", (1, " anzeigen")),
+        ("Daten Anzeige", (1, " anzeige")),
+        ("daten anzeigen", (1, " anzeigen")),
+    ],
+)
+def test_process_word_checker_case_insensitive_de(text: str, expected_result: tuple[int, str]):
+    """
+    Test that German process words in uppercase and title case are found like in lowercase, although the lemmatizers are case-sensitive.
+    The English process word list is empty.
+    """
+
+    # init expected result
+    text_processor = TextProcessor(constants.GERMAN)
+    checker = ProcessWordChecker(text_processor)
+
+    # run method
+    result = checker.check_sentence(text_processor.tokenize(text)[:])
+    lowercase_result = checker.check_sentence(text_processor.tokenize(text.lower())[:])
+
+    # check results
+    assert result == lowercase_result == expected_result
+    assert checker.has_match(text_processor.tokenize(text)[:])
@@ -0,0 +1,89 @@
+"""Tests."""
+
+from pathlib import Path
+
+from python_requirements_inspector import constants, fingerprint, result_cache, workitem_analyzer
+from python_requirements_inspector.checkers import weak_word_checker
+from python_requirements_inspector.type_definitions import AnalyzerOptions, FindingType, WorkItem
+
+TEST_RESULT = {**constants.INITIALIZED_DATA_FRAME, "id": "test-123", "language": "en", "smellWeakword": 1}
+
+
+def test_result_cache_rulesets(tmp_path: Path):
+    """
+    Test case for the ResultCache class keeping the results of each ruleset apart.
+    """
+    database_path = tmp_path / "cache.sqlite"
+
+    # cache results with the first ruleset
+    with result_cache.ResultCache(database_path, "first") as test_cache:
+        test_cache.put_many([("content-1", TEST_RESULT), ("content-2", None)])
+        assert test_cache.get_many(["content-1", "content-2", "content-3"]) == {"content-1": TEST_RESULT, "content-2": None}
+
+    # another ruleset does not see the results, until it is pruned they stay in the database
+    with result_cache.ResultCache(database_path, "second") as test_cache:
+        assert test_cache.get_many(["content-1", "content-2"]) == {}
+        assert test_cache.prune() == 2
+
+    with result_cache.ResultCache(database_path, "first") as test_cache:
+        assert test_cache.get_many(["content-1"]) == {}
+
+
+def test_result_cache_export(tmp_path: Path):
+    """
+    Test case for the ResultCache class exporting a copy of the database.
+    """
+    export_path = tmp_path / "export.sqlite"
+
+    # run method
+    with result_cache.ResultCache(tmp_path / "cache.sqlite", "ruleset") as test_cache:
+        test_cache.put_many([("content-1", TEST_RESULT)])
+        test_cache.export(export_path)
+
+    # check results
+    with result_cache.ResultCache(export_path, "ruleset") as exported_cache:
+        assert exported_cache.get_many(["content-1"]) == {"content-1": TEST_RESULT}
+
+
+def test_ruleset_fingerprint(monkeypatch):
+    """
+    Test case for the ruleset fingerprint changing with the options and the word lists.
+    """
+    default_fingerprint = fingerprint.get_ruleset_fingerprint(AnalyzerOptions())
+
+    # options not changing the results keep the fingerprint
+    assert fingerprint.get_ruleset_fingerprint(AnalyzerOptions(sentence_cache_size=0)) == default_fingerprint
+    assert fingerprint.get_ruleset_fingerprint(AnalyzerOptions(checks=tuple(reversed(constants.DEFAULT_CHECKS)))) == default_fingerprint
+
+    # options and rules changing the results change the fingerprint
+    assert fingerprint.get_ruleset_fingerprint(AnalyzerOptions(single_parse=True)) != default_fingerprint
+    assert fingerprint.get_ruleset_fingerprint(AnalyzerOptions(checks=(FindingType.WEAKWORD,))) != default_fingerprint
+    monkeypatch.setattr(weak_word_checker, "weak_word_list_en", [*weak_word_checker.weak_word_list_en, "somewhat"])
+    assert fingerprint.get_ruleset_fingerprint(AnalyzerOptions()) != default_fingerprint
+
+
+def test_workitem_analyzer_with_result_cache(tmp_path: Path):
+    """
+    Test the workitem analyzer taking the results of unchanged workitems from the result cache.
+    """
+    test_workitems = [
+        WorkItem(id="test-123", description="I'm a description for testing with a weakword accordingly", title="I'm a title without a processword", language="en"),
+        WorkItem(id="test-234", description="I'm a description in an unsupported language", title="", language="fr"),
+    ]
+    options = AnalyzerOptions(result_cache=str(tmp_path / "cache.sqlite"))
+
+    # init expected result
+    expected_results = list(workitem_analyzer.WorkitemAnalyzer().analyze_workitems(test_workitems))
+
+    # run method
+    first_results = list(workitem_analyzer.WorkitemAnalyzer(options).analyze_workitems(test_workitems))
+    cached_analyzer = workitem_analyzer.WorkitemAnalyzer(options)
+    cached_results = list(cached_analyzer.analyze_workitems(test_workitems))
+    changed_results = list(cached_analyzer.analyze_workitems([{**test_workitems[0], "description": "I'm a changed description"}]))
+
+    # check results
+    assert first_results == expected_results
+    assert cached_results == expected_results
+    assert changed_results[0]["smellWeakword"] == 0
+    # only the changed workitem needed a language model
+    assert list(cached_analyzer._WorkitemAnalyzer__available_text_analyzer) == [constants.ENGLISH]
@@ -0,0 +1,113 @@
+"""Tests."""
+
+import csv
+import io
+import json
+
+import numpy as np
+import pytest
+
+from python_requirements_inspector import constants
+from python_requirements_inspector.result_writer import OutputFormat, ResultWriter
+from python_requirements_inspector.type_definitions import FindingType
+
+TEST_RESULTS = [
+    {
+        **constants.INITIALIZED_DATA_FRAME,
+        "id": "test-123",
+        "language": "en",
+        "smellDescription": "In DESCRIPTION Sentence 1 I'm a… smellWeakword: accordingly [9] \n",
+        "smellWeakword": 1,
+        "contentHash": "abc",
+    },
+    {**constants.INITIALIZED_DATA_FRAME, "id": "test-234", "language": "de", "contentHash": "def"},
+    {
+        **constants.INITIALIZED_DATA_FRAME,
+        "id": "test-345",
+        "language": "de",
+        "smellDescription": "In TITLE missingProcessword: Title contains no process word\n",
+        "smellPassive": 2,
+        "missingProcessword": True,
+        "contentHash": "ghi",
+    },
+]
+
+
+def write_results(output_format: OutputFormat, sparse: bool = False, descriptions: bool = True, content_hashes: bool = False) -> bytes:
+    output = io.BytesIO()
+    writer = ResultWriter(output, output_format, sparse, descriptions, content_hashes)
+    for result in TEST_RESULTS:
+        writer.write(result)
+    writer.close()
+    return output.getvalue()
+
+
+@pytest.mark.parametrize("output_format", [OutputFormat.JSON, OutputFormat.JSON_LINES])
+def test_write_json(output_format: OutputFormat):
+    """
+    Test writing results as JSON array and JSON Lines, equal to the JSON output.
+    """
+
+    # run method
+    output = write_results(output_format).decode("utf-8")
+
+    # check results
+    expected_output = json.dumps(TEST_RESULTS) if output_format == OutputFormat.JSON else "".join(json.dumps(result) + "\n" for result in TEST_RESULTS)
+    assert output == expected_output
+
+
+def test_write_sparse_without_descriptions():
+    """
+    Test leaving out the results without findings and the smell descriptions.
+    """
+
+    # init expected result
+    expected_results = [{field: value for field, value in result.items() if field != "smellDescription"} for result in TEST_RESULTS if result["id"] != "test-234"]
+
+    # run method
+    output = write_results(OutputFormat.JSON_LINES, sparse=True, descriptions=False).decode("utf-8")
+
+    # check results
+    assert [json.loads(line) for line in output.splitlines()] == expected_results
+
+
+def test_write_csv():
+    """
+    Test writing results as CSV with a header row.
+    """
+
+    # run method
+    rows = list(csv.DictReader(io.StringIO(write_results(OutputFormat.CSV).decode("utf-8"), newline="")))
+    rows_without_descriptions = list(csv.DictReader(io.StringIO(write_results(OutputFormat.CSV, descriptions=False).decode("utf-8"), newline="")))
+    rows_with_content_hashes = list(csv.DictReader(io.StringIO(write_results(OutputFormat.CSV, content_hashes=True).decode("utf-8"), newline="")))
+
+    # check results
+    assert [row["id"] for row in rows] == ["test-123", "test-234", "test-345"]
+    assert rows[0]["smellDescription"] == TEST_RESULTS[0]["smellDescription"]
+    assert rows[2]["smellPassive"] == "2"
+    assert rows[2]["missingProcessword"] == "True"
+    assert "smellDescription" not in rows_without_descriptions[0]
+    assert list(rows[0]) == list(constants.INITIALIZED_DATA_FRAME)
+    assert [row["contentHash"] for row in rows_with_content_hashes] == ["abc", "def", "ghi"]
+
+
+def test_write_npz():
+    """
+    Test writing results as numpy arrays with a matrix of the finding counts.
+    """
+
+    # init expected result
+    expected_counts = [[int(result[check.value]) for check in FindingType] for result in TEST_RESULTS]
+
+    # run method
+    arrays = np.load(io.BytesIO(write_results(OutputFormat.NPZ, content_hashes=True)))
+    sparse_arrays = np.load(io.BytesIO(write_results(OutputFormat.NPZ, sparse=True)))
+
+    # check results
+    assert arrays["id"].tolist() == ["test-123", "test-234", "test-345"]
+    assert arrays["content_hash"].tolist() == ["abc", "def", "ghi"]
+    assert arrays["finding_type"].tolist() == [check.value for check in FindingType]
+    assert arrays["counts"].tolist() == expected_counts
+    assert sparse_arrays["id"].tolist() == ["test-123", "test-345"]
+    assert sparse_arrays["counts"].shape == (2, len(FindingType))
+    assert "content_hash" not in sparse_arrays
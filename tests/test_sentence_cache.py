@@ -0,0 +1,87 @@
+"""Tests."""
+
+import pytest
+
+from python_requirements_inspector import constants, sentence_cache, text_analyzer
+from python_requirements_inspector.type_definitions import FindingType, PartialFinding
+
+CHECKS = (FindingType.WEAKWORD,)
+
+
+def test_sentence_cache_lru_eviction():
+    """
+    Test case for the SentenceCache class evicting the least recently used sentence.
+    """
+    findings = (PartialFinding(FindingType.WEAKWORD, 1, "accordingly [9] "),)
+    test_cache = sentence_cache.SentenceCache(2)
+
+    test_cache.put((constants.ENGLISH, "first", CHECKS), findings)
+    test_cache.put((constants.ENGLISH, "second", CHECKS), ())
+
+    # using the first sentence makes the second one the least recently used
+    assert test_cache.get((constants.ENGLISH, "first", CHECKS)) == findings
+    test_cache.put((constants.ENGLISH, "third", CHECKS), ())
+
+    # check results
+    assert test_cache.get((constants.ENGLISH, "second", CHECKS)) is None
+    assert test_cache.get((constants.ENGLISH, "first", CHECKS)) == findings
+    assert test_cache.get((constants.ENGLISH, "third", CHECKS)) == ()
+    assert test_cache.get((constants.GERMAN, "third", CHECKS)) is None
+    assert test_cache.get_stats() == sentence_cache.CacheStats(hits=3, misses=2, size=2)
+
+    # a cleared cache is empty
+    test_cache.clear()
+    assert test_cache.get_stats() == sentence_cache.CacheStats(hits=0, misses=0, size=0)
+
+
+def test_sentence_cache_invalid_size():
+    """
+    Test case for the SentenceCache class rejecting a cache without capacity.
+    """
+    with pytest.raises(ValueError, match="Cache size must be positive"):
+        sentence_cache.SentenceCache(0)
+
+
+def test_text_analyzer_with_sentence_cache():
+    """
+    Test case for the TextAnalyzer class reusing the findings of repeated sentences.
+    """
+    test_texts = [
+        "The system shall respond accordingly. I am a text for analysis.",
+        "The system shall respond accordingly. I am another text.",
+    ]
+
+    # init expected result
+    expected_result = text_analyzer.TextAnalyzer(constants.ENGLISH).analyze_texts(test_texts, constants.DEFAULT_DESCRIPTION_CHECKS)
+
+    # run method
+    test_cache = sentence_cache.SentenceCache(100)
+    test_analyzer = text_analyzer.TextAnalyzer(constants.ENGLISH, sentence_cache=test_cache)
+    result = test_analyzer.analyze_texts(test_texts, constants.DEFAULT_DESCRIPTION_CHECKS)
+    repeated_result = test_analyzer.analyze_texts(test_texts, constants.DEFAULT_DESCRIPTION_CHECKS)
+
+    # check results
+    assert result == expected_result
+    assert repeated_result == expected_result
+    # three distinct sentences are processed once, the second run is answered from the cache
+    assert test_cache.get_stats() == sentence_cache.CacheStats(hits=3, misses=3, size=3)
+
+
+def test_text_analyzer_with_sentence_cache_whitespace():
+    """
+    Test case for the TextAnalyzer class keeping the findings of sentences differing in whitespace apart.
+    """
+    test_texts = ["The system shall respond accordingly.", "The  system shall respond accordingly."]
+
+    # init expected result
+    expected_result = [text_analyzer.TextAnalyzer(constants.ENGLISH).analyze_texts([text], [FindingType.WEAKWORD])[0] for text in test_texts]
+
+    # run method
+    test_cache = sentence_cache.SentenceCache(100)
+    result = text_analyzer.TextAnalyzer(constants.ENGLISH, sentence_cache=test_cache).analyze_texts(test_texts, [FindingType.WEAKWORD])
+
+    # check results
+    assert result == expected_result
+    # the additional space is a token, so the weak word is at another position
+    assert result[0][0].finding_desc != result[1][0].finding_desc
+    assert test_cache.get_stats().size == 2
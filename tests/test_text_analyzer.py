@@ -1,6 +1,6 @@
 """Tests."""
 
-from python_requirements_inspector import constants, text_analyzer
+from python_requirements_inspector import constants, metrics, text_analyzer
 from python_requirements_inspector.type_definitions import FindingType, MatcherId
 
 ######################################################
@@ -55,6 +55,39 @@ def test_text_analyzer_find_weak_words_en():
     assert expected_finding_message_content in result_finding_desc
 
 
+def test_text_analyzer_find_weak_words_case_insensitive_en():
+    """
+    Test case for the TextAnalyzer class detecting a capitalized weak word in an English sentence.
+    """
+    test_sentence = "Accordingly, I am a text for analysis with a capitalized weak word."
+
+    # init expected result
+    expected_result_count = 1
+    expected_finding_type = FindingType.WEAKWORD
+    expected_finding_count = 1
+    expected_finding_message_content = "accordingly [0]"
+
+    # run method
+    test_analyzer = text_analyzer.TextAnalyzer(constants.ENGLISH)
+    result = test_analyzer.analyze_text(test_sentence, [FindingType.WEAKWORD])
+
+    # check results
+    # only 1 finding should be found
+    assert len(result) == expected_result_count
+
+    # finding should be weakword
+    result_tuple = result[0]
+    assert expected_finding_type == result_tuple.finding_type
+
+    # only 1 weakword should be found
+    result_finding_count = result_tuple.finding_count
+    assert result_finding_count == expected_finding_count
+
+    # finding message should contain the weakword in lower case and its position
+    result_finding_desc = result_tuple.finding_desc
+    assert expected_finding_message_content in result_finding_desc
+
+
 def test_text_analyzer_find_complexity_en():
     """
     Test case for the TextAnalyzer class detecting complexity in an English sentence.
@@ -189,6 +222,52 @@ def test_text_analyzer_find_passive_en():
     assert expected_finding_message_content in result_finding_desc
 
 
+def test_text_analyzer_single_parse_en():
+    """
+    Test case for the TextAnalyzer class processing a text with multiple sentences in a single parse.
+    """
+    test_text = "I am a text for analysis and without results. I am a text for analysis with the weak word, accordingly."
+
+    # init expected result
+    expected_result_count = 1
+    expected_finding_type = FindingType.WEAKWORD
+    expected_sent_num = 2
+    expected_sent_start = "I am a"
+
+    # run method
+    test_analyzer = text_analyzer.TextAnalyzer(constants.ENGLISH, single_parse=True)
+    result = test_analyzer.analyze_text(test_text, [FindingType.WEAKWORD])
+
+    # check results
+    # only 1 finding should be found
+    assert len(result) == expected_result_count
+
+    # finding should be the weakword of the second sentence
+    result_tuple = result[0]
+    assert expected_finding_type == result_tuple.finding_type
+    assert result_tuple.sent_num == expected_sent_num
+    assert result_tuple.sent_start == expected_sent_start
+
+
+def test_text_analyzer_selected_checks_en():
+    """
+    Test case for the TextAnalyzer class loading only the pipeline components of the selected checks.
+    """
+    test_sentence = "I am a text for analysis with the weak word, accordingly."
+
+    # run method
+    test_analyzer = text_analyzer.TextAnalyzer(constants.ENGLISH, checks=[FindingType.COMPLEX])
+    result = test_analyzer.analyze_text(test_sentence, constants.DEFAULT_DESCRIPTION_CHECKS)
+
+    # check results
+    # the weak word is not found, because the weak word check is not selected
+    assert not result
+
+    # the complexity check only needs the tokenizer
+    pipe_names = test_analyzer._TextAnalyzer__text_processor._TextProcessor__nlp.pipe_names
+    assert not set(pipe_names).intersection(constants.MODEL_COMPONENTS)
+
+
 ######################################################
 # TESTS FOR GERMAN
 ######################################################
@@ -409,5 +488,34 @@ def test_text_analyzer_find_processword_de():
     assert expected_finding_message_content in result_finding_desc
 
 
+def test_text_analyzer_contains_findings_de():
+    """
+    Test case for the existence mode of the TextAnalyzer class, stopping at the first sentence with a process word.
+    """
+    test_titles = [
+        "Ich bin ein Titel ohne Processwort.",
+        "Ein Titel zum Auswählen. Noch ein Satz zum Ändern.",
+        "Ein Titel ohne Processwort. Ein Satz zum Auswählen.",
+        "",
+    ]
+
+    # init expected result
+    expected_result = [False, True, True, False]
+    # the second sentence of the second title is not checked
+    expected_check_calls = 4
+
+    # run method
+    test_metrics = metrics.Metrics()
+    test_analyzer = text_analyzer.TextAnalyzer(constants.GERMAN, metrics=test_metrics)
+    result = test_analyzer.contains_findings(test_titles, constants.DEFAULT_TITLE_CHECKS)
+    check_calls = test_metrics.get_stage_stats("check.process").count
+    full_result = test_analyzer.analyze_texts(test_titles, constants.DEFAULT_TITLE_CHECKS)
+
+    # check results
+    assert result == expected_result
+    assert result == [bool(findings) for findings in full_result]
+    assert check_calls == expected_check_calls
+
+
 if __name__ == "__main__":
     test_text_analyzer_find_weak_words_en()
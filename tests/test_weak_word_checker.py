@@ -0,0 +1,73 @@
+"""Tests."""
+
+import pytest
+from spacy.matcher import PhraseMatcher
+
+from benchmarks.corpus import CorpusGenerator, CorpusOptions
+from python_requirements_inspector import constants
+from python_requirements_inspector.checkers import weak_word_checker
+from python_requirements_inspector.checkers.weak_word_checker import WeakWordChecker
+from python_requirements_inspector.text_processor import TextProcessor
+
+
+@pytest.mark.parametrize("lang", [constants.ENGLISH, constants.GERMAN])
+def test_weak_word_prescreen_identical_results(lang: str):
+    """
+    Test that rejecting sentences by their lemmas finds the same weak words as the matching of the lowercased sentence
+    parsed again (the implementation before the sentences were parsed once), on a generated corpus in the original case,
+    uppercase and title case.
+    """
+
+    # init expected result
+    corpus_generator = CorpusGenerator(CorpusOptions(weak_word_density=0.1, seed=7))
+    generated_sentences = [corpus_generator.generate_sentence(lang) for _ in range(300)]
+    sentences = generated_sentences + [sentence.upper() for sentence in generated_sentences] + [sentence.title() for sentence in generated_sentences]
+    text_processor = TextProcessor(lang)
+    checker = WeakWordChecker(text_processor)
+    weak_word_list = weak_word_checker.weak_word_list_en if lang == constants.ENGLISH else weak_word_checker.weak_word_list_de
+    reparse_matcher = PhraseMatcher(text_processor.get_vocab(), attr="LEMMA")
+    reparse_matcher.add("WEAKWORD", [text_processor.tokenize(name) for name in text_processor.lemmatize_list(weak_word_list)])
+    expected_results = []
+    for sentence in sentences:
+        doc = text_processor.tokenize(sentence.lower())
+        matches = reparse_matcher(doc)
+        expected_results.append((len(matches), "".join(f"{doc[start:end].text} [{start}] " for _, start, end in matches)))
+
+    # run method
+    processed_sents = [doc[:] for doc in text_processor.tokenize_batch(sentences, constants.DEFAULT_BATCH_SIZE)]
+    results = [checker.check_sentence(sent) for sent in processed_sents]
+    candidates = [checker.is_candidate(sent) for sent in processed_sents]
+
+    # check results
+    assert results == expected_results
+    # the corpus contains sentences with and without weak words, and only candidates have findings
+    assert any(count for count, _ in results)
+    assert not all(candidates)
+    assert all(candidate for candidate, (count, _) in zip(candidates, results, strict=True) if count)
+
+
+@pytest.mark.parametrize(
+    ("lang", "text", "expected_result"),
+    [
+        (constants.ENGLISH, "THE ALARM TRIGGERS THE DOOR ACCORDINGLY.", (2, "triggers [2] accordingly [5] ")),
+        (constants.ENGLISH, "The Alarm Triggers The Door Accordingly.", (2, "triggers [2] accordingly [5] ")),
+        (constants.GERMAN, "DIE ANZEIGE WIRD VERBESSERT.", (1, "verbessert [3] ")),
+        (constants.GERMAN, "Die Anzeige Wird Verbessert.", (1, "verbessert [3] ")),
+    ],
+)
+def test_weak_word_checker_case_insensitive(lang: str, text: str, expected_result: tuple[int, str]):
+    """
+    Test that weak words in uppercase and title case are found like in lowercase, although the lemmatizers are case-sensitive.
+    """
+
+    # init expected result
+    text_processor = TextProcessor(lang)
+    checker = WeakWordChecker(text_processor)
+
+    # run method
+    result = checker.check_sentence(text_processor.tokenize(text)[:])
+    lowercase_result = checker.check_sentence(text_processor.tokenize(text.lower())[:])
+
+    # check results
+    assert result == lowercase_result == expected_result
+    assert checker.has_match(text_processor.tokenize(text)[:])
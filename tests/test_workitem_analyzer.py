@@ -1,7 +1,12 @@
 """Tests."""
 
-from python_requirements_inspector import workitem_analyzer
-from python_requirements_inspector.type_definitions import FindingType, WorkItem, WorkItemFields
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from python_requirements_inspector import constants, model_registry, workitem_analyzer
+from python_requirements_inspector.type_definitions import AnalyzerOptions, FindingType, WorkItem, WorkItemFields
 
 
 def test_workitem_analyzer_with_findings_en():
@@ -227,3 +232,244 @@ def test_workitem_analyzer_with_additional_fields():
     # check if all values are set to the expected values
     for key, expected_value in expected_finding_values.items():
         assert result_dict[key] == expected_value
+
+
+def test_workitem_analyzer_batch():
+    """
+    Test the batch analysis of workitems against the analysis of single workitems.
+    """
+
+    # init test workitems of mixed languages
+    test_workitems = [
+        WorkItem(id="test-123", description="I'm a description for testing with a weakword accordingly", title="I'm a title without a processword", language="en"),
+        WorkItem(id="test-234", description="Ich bin eine Beschreibung mit dem Weakword entsprechend.", title="Ich bin ein Titel ohne Processwort", language="de"),
+        WorkItem(id="test-345", description="I'm a description without findings. This second sentence is automatically checked.", title="", language="en"),
+        WorkItem(id="test-456", description="Ich bin eine Beschreibung ohne Ergebnisse.", title="Ich bin ein Titel zum Auswählen", language="de"),
+    ]
+
+    # run method
+    test_workitem_analyzer = workitem_analyzer.WorkitemAnalyzer()
+    for test_workitem in test_workitems:
+        test_workitem_analyzer.analyze_workitem(test_workitem)
+    expected_results = test_workitem_analyzer.get_collected_data()
+
+    results = list(test_workitem_analyzer.analyze_workitems(test_workitems, batch_size=3))
+
+    # check results
+    # the batch results are in the order of the workitems and equal to the single results
+    assert [result["id"] for result in results] == [test_workitem["id"] for test_workitem in test_workitems]
+    assert results == expected_results
+
+
+def test_workitem_analyzer_lazy_loading():
+    """
+    Test the workitem analyzer loading only the languages and checkers it needs.
+    """
+
+    # init test workitem
+    test_workitem = WorkItem(
+        id="test-123",
+        description="I'm a description for testing with a weakword accordingly",
+        title="",
+        language="en",
+    )
+
+    # run method
+    test_workitem_analyzer = workitem_analyzer.WorkitemAnalyzer()
+    assert not test_workitem_analyzer._WorkitemAnalyzer__available_text_analyzer
+
+    test_workitem_analyzer.analyze_workitem(test_workitem)
+
+    # check results
+    # only the English text analyzer with the description checkers is created
+    available_text_analyzer = test_workitem_analyzer._WorkitemAnalyzer__available_text_analyzer
+    assert list(available_text_analyzer) == ["en"]
+    assert set(available_text_analyzer["en"]._TextAnalyzer__available_checks) == set(constants.DEFAULT_DESCRIPTION_CHECKS)
+
+    # the language is given, so no language detector is created
+    assert test_workitem_analyzer._WorkitemAnalyzer__language_detector is None
+
+    # loading both languages only loads the missing one
+    test_workitem_analyzer.load_languages([*constants.SUPPORTED_LANGUAGES, "fr"])
+    assert set(test_workitem_analyzer._WorkitemAnalyzer__available_text_analyzer) == set(constants.SUPPORTED_LANGUAGES)
+    assert test_workitem_analyzer._WorkitemAnalyzer__available_text_analyzer["en"] is available_text_analyzer["en"]
+
+
+def test_workitem_analyzer_selected_checks():
+    """
+    Test the workitem analyzer performing only the selected checks.
+    """
+
+    # init test workitem
+    test_workitem = WorkItem(
+        id="test-123",
+        description="I'm a description for testing with a weakword accordingly",
+        title="I'm a title without a processword",
+        language="en",
+    )
+
+    # init expected result
+    expected_finding_values = {
+        FindingType.WEAKWORD.value: 1,
+        FindingType.COMPLEX.value: 0,
+        FindingType.COMPARATIVE.value: 0,
+        FindingType.PASSIVE.value: 0,
+        FindingType.PROCESS.value: False,
+    }
+
+    # run method
+    test_workitem_analyzer = workitem_analyzer.WorkitemAnalyzer(AnalyzerOptions(checks=(FindingType.WEAKWORD,)))
+    test_workitem_analyzer.analyze_workitem(test_workitem)
+    results = test_workitem_analyzer.get_collected_data()
+
+    # check results
+    # only the weak word is reported, the title is not checked for process words
+    result_dict = results[0]
+    assert WorkItemFields.TITLE.value.upper() not in result_dict["smellDescription"]
+    for key, expected_value in expected_finding_values.items():
+        assert result_dict[key] == expected_value
+
+
+def test_workitem_analyzer_metrics():
+    """
+    Test the workitem analyzer recording the stages of the analysis and counting the processed items.
+    """
+
+    # init test workitems
+    test_workitems = [
+        WorkItem(id="test-123", description="The first sentence. The second sentence accordingly.", title="Title", language="en"),
+        WorkItem(id="test-234", description="Ein Satz ohne Sprache.", title="Titel", language=None),
+    ]
+
+    # run method
+    analyzer = workitem_analyzer.WorkitemAnalyzer(AnalyzerOptions(checks=(FindingType.WEAKWORD, FindingType.PASSIVE)))
+    list(analyzer.analyze_workitems(test_workitems))
+    metrics = analyzer.get_metrics()
+
+    # check results
+    assert metrics.get_counter("workitems") == 2
+    assert metrics.get_counter("sentences") == 3
+    assert metrics.get_counter("tokens") > 0
+    assert metrics.get_stage_stats("analyze_batch").count == 1
+    assert metrics.get_stage_stats("language_detection").count == 1
+    assert metrics.get_stage_stats("sentencize") is not None
+    assert metrics.get_stage_stats("parse") is not None
+    assert metrics.get_stage_stats("check.weakword").count == 3
+    assert metrics.get_stage_stats("check.passive").count == 3
+    assert metrics.get_stage_stats("check.complex") is None
+
+
+def test_workitem_analyzer_reload_models():
+    """
+    Test the workitem analyzer reloading the language models when their vocabularies grow beyond the limit.
+    """
+
+    # init test workitems with token texts unknown to the vocabulary
+    test_workitems = [WorkItem(id=f"test-{index}", description=f"The ticket POL-{index}x{index} is handled accordingly.", title="I'm a title without a processword", language=lang) for index, lang in enumerate(["en", "de", "en"])]
+
+    # run method
+    analyzer = workitem_analyzer.WorkitemAnalyzer(AnalyzerOptions(max_new_strings=1))
+    results = list(analyzer.analyze_workitems(test_workitems, batch_size=1))
+
+    # init expected result
+    expected_results = list(workitem_analyzer.WorkitemAnalyzer().analyze_workitems(test_workitems, batch_size=1))
+
+    # check results
+    # the matchers compiled against the reloaded vocabularies find the same findings
+    assert results == expected_results
+    assert analyzer.get_metrics().get_counter("model_reloads") == 3
+    assert list(workitem_analyzer.WorkitemAnalyzer(AnalyzerOptions(max_new_strings=1000000)).analyze_workitems(test_workitems)) == expected_results
+
+
+def test_workitem_analyzer_reload_models_rss(monkeypatch):
+    """
+    Test the workitem analyzer reloading the language models when the memory of the process exceeds the limit.
+    """
+
+    # init test workitem
+    test_workitem = WorkItem(id="test-123", description="A description accordingly.", title="A title", language="en")
+    rss_values = iter([500.0, 480.0, 520.0, 600.0, 480.0])
+    monkeypatch.setattr(workitem_analyzer, "get_rss_mb", lambda: next(rss_values))
+    monkeypatch.setattr(model_registry, "get_rss_mb", lambda: next(rss_values))
+    # the memory after the reloads of other tests is not the baseline of this test
+    monkeypatch.setattr(workitem_analyzer, "model_registry", model_registry.ModelRegistry())
+
+    # run method
+    analyzer = workitem_analyzer.WorkitemAnalyzer(AnalyzerOptions(max_rss_mb=400))
+    reload_counts = []
+    for _ in range(3):
+        list(analyzer.analyze_workitems([test_workitem]))
+        reload_counts.append(analyzer.get_metrics().get_counter("model_reloads"))
+
+    # check results
+    # 500 MB exceeds the limit, after the reload 520 MB is within the margin and 600 MB exceeds it
+    assert reload_counts == [1, 1, 2]
+
+
+def test_workitem_analyzer_reload_shared_models():
+    """
+    Test the workitem analyzers of a process reloading their shared language models once.
+    """
+
+    # init test workitem with token texts unknown to the vocabulary
+    test_workitem = WorkItem(id="test-123", description="The ticket POL-123x456 is handled accordingly.", title="A title", language="en")
+    limited_analyzer = workitem_analyzer.WorkitemAnalyzer(AnalyzerOptions(max_new_strings=1))
+    other_analyzer = workitem_analyzer.WorkitemAnalyzer()
+    expected_results = list(other_analyzer.analyze_workitems([test_workitem]))
+    generation = model_registry.model_registry.get_generation()
+
+    # run method
+    results = list(limited_analyzer.analyze_workitems([test_workitem]))
+    other_analyzer.reload_models()
+    other_analyzer.release_stale_models()
+
+    # check results
+    # the analyzer noticing the limit reloads the models, the other one only releases the models it held
+    assert results == expected_results
+    assert limited_analyzer.get_metrics().get_counter("model_reloads") == 1
+    assert other_analyzer.get_metrics().get_counter("model_reloads") == 0
+    assert model_registry.model_registry.get_generation() == generation + 1
+    assert list(other_analyzer.analyze_workitems([test_workitem])) == expected_results
+
+
+def test_workitem_analyzer_close(tmp_path: Path):
+    """
+    Test the workitem analyzer closing its result cache when used as context manager.
+    """
+
+    # init test workitem
+    test_workitem = WorkItem(id="test-123", description="A description accordingly.", title="A title", language="en")
+
+    # run method
+    with workitem_analyzer.WorkitemAnalyzer(AnalyzerOptions(result_cache=str(tmp_path / "cache.db"))) as analyzer:
+        results = list(analyzer.analyze_workitems([test_workitem]))
+
+    # check results
+    assert len(results) == 1
+    # the cache is closed, and its results are available to the next analyzer
+    with pytest.raises(sqlite3.ProgrammingError):
+        list(analyzer.analyze_workitems([test_workitem]))
+    with workitem_analyzer.WorkitemAnalyzer(AnalyzerOptions(result_cache=str(tmp_path / "cache.db"))) as cached_analyzer:
+        assert list(cached_analyzer.analyze_workitems([test_workitem])) == results
+        assert cached_analyzer.get_metrics().get_counter("cached_workitems") == 1
+
+
+def test_workitem_analyzer_content_hash(tmp_path: Path):
+    """
+    Test the workitem analyzer adding the content hash to the results only if requested, also to cached results.
+    """
+
+    # init test workitem
+    test_workitem = WorkItem(id="test-123", description="A description accordingly.", title="A title", language="en")
+
+    # run method
+    with workitem_analyzer.WorkitemAnalyzer(AnalyzerOptions(result_cache=str(tmp_path / "cache.db"), content_hash=True)) as analyzer:
+        results = list(analyzer.analyze_workitems([test_workitem]))
+    with workitem_analyzer.WorkitemAnalyzer(AnalyzerOptions(result_cache=str(tmp_path / "cache.db"))) as cached_analyzer:
+        cached_results = list(cached_analyzer.analyze_workitems([test_workitem]))
+        assert cached_analyzer.get_metrics().get_counter("cached_workitems") == 1
+
+    # check results
+    assert list(results[0]) == [*constants.INITIALIZED_DATA_FRAME, "contentHash"]
+    assert list(cached_results[0]) == list(constants.INITIALIZED_DATA_FRAME)
+    assert cached_results[0] == {field: value for field, value in results[0].items() if field != "contentHash"}